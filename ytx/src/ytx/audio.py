@@ -2,8 +2,10 @@ from __future__ import annotations
 
 """Audio utilities: ffmpeg/ffprobe wrappers and helpers."""
 
+import os
 import shutil
 import subprocess
+import tempfile
 from pathlib import Path
 
 
@@ -28,7 +30,8 @@ def ensure_ffprobe() -> None:
         raise FFmpegNotFound("ffprobe is required but not found on PATH")
 
 
-def build_normalize_wav_command(src: Path, dst: Path) -> list[str]:
+def build_normalize_wav_command(src: Path | str, dst: Path) -> list[str]:
+    """ffmpeg command converting `src` (a path, or "pipe:0" for stdin) to 16 kHz mono WAV."""
     return [
         "ffmpeg",
         "-hide_banner",
@@ -48,14 +51,25 @@ def build_normalize_wav_command(src: Path, dst: Path) -> list[str]:
     ]
 
 
-def normalize_wav(src: Path, dst: Path, *, overwrite: bool = False) -> Path:
-    """Convert input audio to 16 kHz mono PCM WAV using ffmpeg."""
-    ensure_ffmpeg()
+def normalize_wav(src: Path, dst: Path, *, overwrite: bool = False, blob_root: Path | None = None) -> Path:
+    """Convert input audio to 16 kHz mono PCM WAV using ffmpeg.
+
+    With `blob_root`, the WAV is stored by the digest of `src`; a later call
+    with identical source audio hardlinks the stored WAV instead of re-encoding.
+    """
     src = Path(src)
     dst = Path(dst)
     dst.parent.mkdir(parents=True, exist_ok=True)
     if dst.exists() and not overwrite:
         return dst
+    blob: Path | None = None
+    if blob_root is not None:
+        from .blobs import file_digest, link_or_copy, wav_blob_path
+
+        blob = wav_blob_path(blob_root, file_digest(src))
+        if blob.is_file() and blob.stat().st_size > 0:
+            return link_or_copy(blob, dst)
+    ensure_ffmpeg()
 
     cmd = build_normalize_wav_command(src, dst)
     try:
@@ -66,6 +80,77 @@ def normalize_wav(src: Path, dst: Path, *, overwrite: bool = False) -> Path:
         raise FFmpegError(f"ffmpeg failed: {proc.stderr.strip()}")
     if not dst.exists():
         raise FFmpegError("ffmpeg reported success but output file is missing")
+    if blob is not None:
+        from .blobs import store_blob
+
+        try:
+            store_blob(dst, blob)
+        except OSError:
+            pass  # dedup is best effort
+    return dst
+
+
+# Upload encodings for cloud engines: (file suffix, ffmpeg codec args, MIME type).
+# Bitrates are tuned for 16 kHz mono speech; FLAC is lossless (~2x smaller).
+UPLOAD_CODECS: dict[str, tuple[str, list[str], str]] = {
+    "opus": (".ogg", ["-c:a", "libopus", "-b:a", "24k", "-application", "voip"], "audio/ogg"),
+    "mp3": (".mp3", ["-c:a", "libmp3lame", "-b:a", "32k"], "audio/mpeg"),
+    "flac": (".flac", ["-c:a", "flac"], "audio/flac"),
+}
+# Containers yt-dlp typically downloads, for engines that take them as is
+_UPLOAD_MIMES = {suffix: mime for suffix, _args, mime in UPLOAD_CODECS.values()} | {
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".mp4": "audio/mp4",
+    ".webm": "audio/webm",
+    ".opus": "audio/ogg",
+    ".aac": "audio/aac",
+}
+
+
+def upload_mime(path: Path) -> str:
+    """MIME type to declare when uploading `path`."""
+    return _UPLOAD_MIMES.get(Path(path).suffix.lower(), "audio/wav")
+
+
+def build_encode_command(src: Path, dst: Path, codec: str) -> list[str]:
+    """ffmpeg command encoding `src` as 16 kHz mono `codec` (see UPLOAD_CODECS)."""
+    _suffix, args, _mime = UPLOAD_CODECS[codec]
+    return ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", str(src), "-vn", "-ac", "1", "-ar", "16000", *args, str(dst)]
+
+
+def encode_for_upload(src: Path, codec: str) -> Path:
+    """Encode `src` for upload next to it (`<stem>.upload<suffix>`) and return the new path.
+
+    An existing encoding at least as new as `src` is reused, so a video is
+    encoded once however many chunks or retries upload it.
+    """
+    src = Path(src)
+    if codec not in UPLOAD_CODECS:
+        raise ValueError(f"unknown upload codec: {codec}")
+    dst = src.with_name(f"{src.stem}.upload{UPLOAD_CODECS[codec][0]}")
+    try:
+        if dst.stat().st_size > 0 and dst.stat().st_mtime >= src.stat().st_mtime:
+            return dst
+    except OSError:
+        pass
+    ensure_ffmpeg()
+    # A unique temp file per call: threads and processes encoding the same
+    # source each write their own, and the last rename wins
+    fd, name = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=dst.suffix)
+    os.close(fd)
+    tmp = Path(name)
+    try:
+        proc = subprocess.run(build_encode_command(src, tmp, codec), check=False, text=True, capture_output=True)
+        if proc.returncode != 0 or tmp.stat().st_size == 0:
+            raise FFmpegError(f"ffmpeg encode failed: {proc.stderr.strip()}")
+        os.replace(tmp, dst)
+    except FFmpegError:
+        tmp.unlink(missing_ok=True)
+        raise
+    except Exception as e:  # pragma: no cover
+        tmp.unlink(missing_ok=True)
+        raise FFmpegError(f"ffmpeg execution failed: {e}")
     return dst
 
 
@@ -115,6 +200,10 @@ __all__ = [
     "ensure_ffprobe",
     "build_normalize_wav_command",
     "normalize_wav",
+    "UPLOAD_CODECS",
+    "build_encode_command",
+    "encode_for_upload",
+    "upload_mime",
     "build_ffprobe_duration_command",
     "probe_duration",
 ]
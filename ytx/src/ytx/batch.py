@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+"""Batch transcription pipeline for many videos.
+
+Runs the per-video stages as a pipeline instead of one video at a time:
+
+    metadata + download  →  normalize (ffmpeg)  →  transcribe + export
+
+The normalize stage passes items straight through when the engine accepts
+the downloaded container as is (see `ytx.engines.base.accepts_input`).
+
+Each stage has its own worker pool sized for its bottleneck (network, CPU,
+engine) and stages are connected by bounded queues, so the download of video
+N+1 overlaps the transcription of video N without letting downloads run far
+ahead of transcription (which would only fill the disk).
+
+With `async_transcribe`, the transcribe stage is a single thread running an
+asyncio loop instead: up to `transcribe_workers` videos are transcribed at once
+through `ytx.engines.base.transcribe_async`, so cloud engines keep their
+requests in flight on the loop rather than holding a thread each (local
+engines run on the loop's executor).
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+import asyncio
+import queue
+import threading
+import time
+
+from .audio import normalize_wav
+from .cache import artifact_paths_for, artifacts_exist, build_meta_payload, write_meta, ArtifactPaths
+from .config import AppConfig
+from .downloader import download_audio, extract_video_id, fetch_metadata, stream_audio_to_wav
+from .errors import write_error_report
+from .exporters.manager import export_all, parse_formats
+from .models import TranscriptDoc, VideoMetadata
+
+
+# Item states
+PENDING = "pending"
+CACHED = "cached"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class BatchItem:
+    """One video flowing through the pipeline."""
+
+    url: str
+    video_id: str | None = None
+    status: str = PENDING
+    stage: str | None = None
+    error: str | None = None
+    meta: VideoMetadata | None = None
+    paths: ArtifactPaths | None = None
+    audio_path: Path | None = None
+    wav_path: Path | None = None
+    # Seconds spent in each stage (download, normalize, transcribe)
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class BatchReport:
+    items: list[BatchItem]
+    elapsed: float
+
+    def _count(self, status: str) -> int:
+        return sum(1 for it in self.items if it.status == status)
+
+    @property
+    def done(self) -> int:
+        return self._count(DONE)
+
+    @property
+    def cached(self) -> int:
+        return self._count(CACHED)
+
+    @property
+    def failed(self) -> int:
+        return self._count(FAILED)
+
+    @property
+    def videos_per_hour(self) -> float:
+        """Throughput of freshly transcribed videos (cache hits excluded)."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.done * 3600.0 / self.elapsed
+
+
+_SENTINEL = object()
+
+
+class BatchPipeline:
+    """Bounded multi-stage scheduler for transcribing many videos.
+
+    Stage callables default to the regular single-video building blocks and
+    can be swapped out (e.g. in tests). `engine_factory` is called once per
+    transcription worker so engines are never shared across threads.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        *,
+        engine_factory: Callable[[], Any],
+        download_workers: int = 2,
+        normalize_workers: int = 2,
+        transcribe_workers: int = 1,
+        async_transcribe: bool = False,
+        queue_size: int | None = None,
+        overwrite: bool = False,
+        fetch: Callable[..., VideoMetadata] = fetch_metadata,
+        download: Callable[..., Path] = download_audio,
+        normalize: Callable[..., Path] = normalize_wav,
+        stream: Callable[..., Path] = stream_audio_to_wav,
+        on_update: Callable[[BatchItem], None] | None = None,
+    ) -> None:
+        self.config = config
+        self.engine_factory = engine_factory
+        self.download_workers = max(1, int(download_workers))
+        self.normalize_workers = max(1, int(normalize_workers))
+        self.transcribe_workers = max(1, int(transcribe_workers))
+        self.async_transcribe = async_transcribe
+        # Default: keep at most one extra item waiting per downstream worker
+        self.queue_size = max(1, int(queue_size)) if queue_size else None
+        self.overwrite = overwrite
+        self._fetch = fetch
+        self._download = download
+        self._normalize = normalize
+        self._stream = stream
+        self._on_update = on_update
+        self._local = threading.local()
+        self._blobs: Path | None = None
+        if config.cache_dedup:
+            from .blobs import blob_root
+
+            self._blobs = blob_root()
+
+    # --- public API ---
+
+    def run(self, urls: Iterable[str]) -> BatchReport:
+        items = [BatchItem(url=u) for u in urls]
+        started = time.perf_counter()
+        q_download: queue.Queue = queue.Queue()
+        q_normalize: queue.Queue = queue.Queue(maxsize=self.queue_size or self.normalize_workers)
+        q_transcribe: queue.Queue = queue.Queue(maxsize=self.queue_size or self.transcribe_workers)
+
+        threads = (
+            self._start_stage("download", self._do_download, q_download, q_normalize, self.download_workers)
+            + self._start_stage("normalize", self._do_normalize, q_normalize, q_transcribe, self.normalize_workers)
+            + (
+                self._start_async_stage("transcribe", q_transcribe, self.transcribe_workers)
+                if self.async_transcribe
+                else self._start_stage("transcribe", self._do_transcribe, q_transcribe, None, self.transcribe_workers)
+            )
+        )
+        for it in items:
+            if self._check_cache(it):
+                continue
+            q_download.put(it)
+        q_download.put(_SENTINEL)
+        for t in threads:
+            t.join()
+        return BatchReport(items=items, elapsed=time.perf_counter() - started)
+
+    # --- scheduling ---
+
+    def _start_stage(
+        self,
+        name: str,
+        work: Callable[[BatchItem], None],
+        inq: queue.Queue,
+        outq: queue.Queue | None,
+        workers: int,
+    ) -> list[threading.Thread]:
+        remaining = [workers]
+        lock = threading.Lock()
+
+        def loop() -> None:
+            while True:
+                it = inq.get()
+                if it is _SENTINEL:
+                    # Let sibling workers see the sentinel; the last one out
+                    # forwards it so the next stage can drain and stop.
+                    inq.put(_SENTINEL)
+                    with lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last and outq is not None:
+                        outq.put(_SENTINEL)
+                    return
+                it.stage = name
+                t0 = time.perf_counter()
+                try:
+                    work(it)
+                except Exception as e:
+                    self._fail(it, e)
+                finally:
+                    it.timings[name] = time.perf_counter() - t0
+                if it.status == FAILED:
+                    continue
+                if outq is not None:
+                    outq.put(it)
+
+        threads = [
+            threading.Thread(target=loop, name=f"ytx-batch-{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for t in threads:
+            t.start()
+        return threads
+
+    def _start_async_stage(self, name: str, inq: queue.Queue, slots: int) -> list[threading.Thread]:
+        t = threading.Thread(
+            target=lambda: asyncio.run(self._run_async_stage(name, inq, slots)),
+            name=f"ytx-batch-{name}-async",
+            daemon=True,
+        )
+        t.start()
+        return [t]
+
+    async def _run_async_stage(self, name: str, inq: queue.Queue, slots: int) -> None:
+        from .http_pool import aclose_async_clients
+
+        loop = asyncio.get_running_loop()
+        free = asyncio.Semaphore(slots)
+        idle: list[Any] = []  # engines not serving an item; each serves one at a time
+        tasks: set[asyncio.Task] = set()
+
+        async def run(it: BatchItem) -> None:
+            eng = idle.pop() if idle else self.engine_factory()
+            it.stage = name
+            t0 = time.perf_counter()
+            try:
+                await self._do_transcribe_async(it, eng)
+            except Exception as e:
+                self._fail(it, e)
+            finally:
+                it.timings[name] = time.perf_counter() - t0
+                idle.append(eng)
+                free.release()
+
+        try:
+            while True:
+                # Take an item only when a slot is free, so the queue keeps applying backpressure
+                await free.acquire()
+                it = await loop.run_in_executor(None, inq.get)
+                if it is _SENTINEL:
+                    break
+                task = asyncio.create_task(run(it))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*list(tasks))
+        finally:
+            await aclose_async_clients()
+
+    def _notify(self, it: BatchItem) -> None:
+        if self._on_update:
+            try:
+                self._on_update(it)
+            except Exception:
+                pass
+
+    def _fail(self, it: BatchItem, e: Exception) -> None:
+        it.status = FAILED
+        it.error = str(e)
+        if it.paths is not None:
+            try:
+                write_error_report(
+                    it.paths.dir,
+                    e,
+                    context={"command": "batch", "stage": it.stage, "video_id": it.video_id, "url": it.url},
+                )
+            except Exception:
+                pass
+        self._notify(it)
+
+    # --- stages ---
+
+    def _check_cache(self, it: BatchItem) -> bool:
+        it.video_id = extract_video_id(it.url)
+        if not it.video_id:
+            it.status = FAILED
+            it.error = "Invalid YouTube URL or video ID"
+            self._notify(it)
+            return True
+        paths = artifact_paths_for(video_id=it.video_id, config=self.config, create=False)
+        if not self.overwrite and artifacts_exist(paths):
+            it.paths = paths
+            it.status = CACHED
+            self._notify(it)
+            return True
+        return False
+
+    def _do_download(self, it: BatchItem) -> None:
+        cfg = self.config
+        it.paths = artifact_paths_for(video_id=it.video_id or "", config=cfg, create=True)
+        it.meta = self._fetch(it.url, timeout=cfg.network_timeout, max_abr_kbps=cfg.max_download_abr_kbps)
+        if cfg.stream_download and not cfg.download_extract_audio:
+            try:
+                # Download and normalize in one pass; the normalize stage is skipped
+                it.wav_path = self._stream(
+                    it.meta,
+                    it.paths.dir / f"{it.meta.id}.wav",
+                    timeout=cfg.download_timeout,
+                    overwrite=self.overwrite,
+                    max_abr_kbps=cfg.max_download_abr_kbps,
+                    blob_root=self._blobs,
+                )
+                return
+            except Exception:
+                it.wav_path = None  # fall back to a regular file download
+        it.audio_path = self._download(
+            it.meta,
+            it.paths.dir,
+            timeout=cfg.download_timeout,
+            max_abr_kbps=cfg.max_download_abr_kbps,
+            download_extract_audio=cfg.download_extract_audio,
+            show_progress=False,
+            blob_root=self._blobs,
+        )
+
+    def _accepts_download(self, path: Path) -> bool:
+        from .engines import get_engine_class
+        from .engines.base import accepts_input
+
+        try:
+            return accepts_input(get_engine_class(self.config.engine), path, config=self.config)
+        except KeyError:
+            return False
+
+    def _do_normalize(self, it: BatchItem) -> None:
+        if it.wav_path is not None:
+            return  # already normalized by a streaming download
+        assert it.audio_path is not None and it.paths is not None and it.meta is not None
+        if self._accepts_download(it.audio_path):
+            return  # the engine takes the downloaded audio as is
+        it.wav_path = self._normalize(it.audio_path, it.paths.dir / f"{it.meta.id}.wav", blob_root=self._blobs)
+
+    def _engine(self) -> Any:
+        eng = getattr(self._local, "engine", None)
+        if eng is None:
+            eng = self.engine_factory()
+            self._local.engine = eng
+        return eng
+
+    def _do_transcribe(self, it: BatchItem) -> None:
+        source = it.wav_path or it.audio_path
+        assert source is not None and it.paths is not None and it.meta is not None
+        cfg = self.config
+        eng = self._engine()
+        segments = eng.transcribe(source, config=cfg, on_progress=None)
+        language = cfg.language or eng.detect_language(source, config=cfg)
+        self._finish(it, segments, language)
+
+    async def _do_transcribe_async(self, it: BatchItem, eng: Any) -> None:
+        from .engines.base import transcribe_async
+
+        source = it.wav_path or it.audio_path
+        assert source is not None and it.paths is not None and it.meta is not None
+        cfg = self.config
+        segments = await transcribe_async(eng, source, config=cfg)
+        language = cfg.language or await asyncio.to_thread(eng.detect_language, source, config=cfg)
+        await asyncio.to_thread(self._finish, it, segments, language)
+
+    def _finish(self, it: BatchItem, segments: list, language: str | None) -> None:
+        assert it.paths is not None and it.meta is not None
+        cfg = self.config
+        meta = it.meta
+        doc = TranscriptDoc(
+            video_id=meta.id,
+            source_url=meta.url,
+            title=meta.title,
+            duration=meta.duration,
+            language=language,
+            engine=cfg.engine,
+            model=cfg.model,
+            segments=segments,
+            chapters=meta.chapters,
+        )
+        export_all(doc, it.paths.dir, parse_formats("json,srt"))
+        write_meta(it.paths, build_meta_payload(video_id=meta.id, config=cfg, source=meta, provider=cfg.engine))
+        it.status = DONE
+        self._notify(it)
+
+
+def read_url_file(path: Path) -> list[str]:
+    """Read URLs from a text file: one per line, blank lines and `#` comments ignored."""
+    out: list[str] = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        s = line.strip()
+        if s and not s.startswith("#"):
+            out.append(s)
+    return out
+
+
+__all__ = [
+    "BatchItem",
+    "BatchReport",
+    "BatchPipeline",
+    "read_url_file",
+]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+"""Content-addressed blob store for reusable audio intermediates.
+
+Artifact directories are keyed by config hash, so transcribing one video with
+two engines/models would download the audio and run the ffmpeg normalization
+twice. Blobs live under `<cache_root>/.blobs/` and are shared by hardlink:
+
+- `audio/<key>.<ext>`: downloaded audio, keyed by video id + format selector
+- `wav/<digest>.wav`: normalized WAV, keyed by the SHA-256 of its source audio
+  (or by the download key for streamed WAVs)
+
+A blob whose link count drops to 1 is no longer referenced by any artifact
+directory and can be removed with `prune_blobs`. When hardlinks are not
+possible (e.g. the cache spans filesystems) files are copied instead.
+"""
+
+from hashlib import sha256
+from pathlib import Path
+import os
+import shutil
+
+BLOB_DIR = ".blobs"
+# Bump when normalization settings change so stale WAV blobs are not reused
+_WAV_VERSION = "16k-mono-s16-v1"
+
+
+def blob_root(root: Path | None = None) -> Path:
+    from .cache import cache_root
+
+    return (root or cache_root()) / BLOB_DIR
+
+
+def audio_key(video_id: str, selector: str) -> str:
+    return sha256(f"{video_id}\0{selector}".encode("utf-8")).hexdigest()
+
+
+def file_digest(path: Path, *, chunk_size: int = 1 << 20) -> str:
+    h = sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def find_audio_blob(blobs: Path, key: str) -> Path | None:
+    d = Path(blobs) / "audio"
+    if not d.is_dir():
+        return None
+    for p in d.glob(f"{key}.*"):
+        if p.is_file() and p.stat().st_size > 0:
+            return p
+    return None
+
+
+def audio_blob_path(blobs: Path, key: str, ext: str) -> Path:
+    return Path(blobs) / "audio" / f"{key}.{ext.lstrip('.')}"
+
+
+def wav_blob_path(blobs: Path, key: str) -> Path:
+    name = sha256(f"{_WAV_VERSION}\0{key}".encode("utf-8")).hexdigest()
+    return Path(blobs) / "wav" / f"{name}.wav"
+
+
+def link_or_copy(src: Path, dst: Path) -> Path:
+    """Make `dst` refer to the same bytes as `src` (hardlink, else copy)."""
+    src = Path(src)
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists():
+        try:
+            if os.path.samefile(src, dst):
+                return dst
+        except OSError:
+            pass
+        dst.unlink()
+    tmp = dst.with_name(dst.name + ".link")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copy2(src, tmp)
+    tmp.replace(dst)
+    return dst
+
+
+def store_blob(src: Path, blob: Path) -> Path:
+    """Add `src` to the store as `blob` (no-op when already present)."""
+    blob = Path(blob)
+    if blob.is_file() and blob.stat().st_size > 0:
+        return blob
+    return link_or_copy(src, blob)
+
+
+def prune_blobs(root: Path | None = None) -> tuple[int, int]:
+    """Remove blobs no artifact directory links to; returns (count, bytes)."""
+    removed = 0
+    freed = 0
+    base = blob_root(root)
+    if not base.is_dir():
+        return (0, 0)
+    for p in base.rglob("*"):
+        try:
+            st = p.stat()
+            if p.is_file() and st.st_nlink <= 1:
+                p.unlink()
+                removed += 1
+                freed += st.st_size
+        except FileNotFoundError:
+            pass
+    return (removed, freed)
+
+
+__all__ = [
+    "BLOB_DIR",
+    "blob_root",
+    "audio_key",
+    "file_digest",
+    "find_audio_blob",
+    "audio_blob_path",
+    "wav_blob_path",
+    "link_or_copy",
+    "store_blob",
+    "prune_blobs",
+]
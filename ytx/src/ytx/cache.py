@@ -14,13 +14,15 @@ Can be overridden via YTX_CACHE_DIR environment variable.
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Final, TYPE_CHECKING, Iterator
+from typing import Final, TYPE_CHECKING, Iterable, Iterator
 from datetime import datetime, timezone
 import tempfile
 import json as _json
 import shutil
+import time
 
 if TYPE_CHECKING:  # avoid runtime import cycles
+    from .cache_index import CacheIndex
     from .config import AppConfig
     from .models import TranscriptDoc, VideoMetadata
 
@@ -243,9 +245,11 @@ def read_transcript_doc(paths: ArtifactPaths) -> "TranscriptDoc":
             raise
     try:
         payload = _loads_json(raw)
-        return TranscriptDoc.model_validate(payload)
+        doc = TranscriptDoc.model_validate(payload)
     except Exception as e:
         raise CacheCorruptedError(f"corrupted transcript.json at {paths.transcript_json}: {e}") from e
+    _index_touch(paths.dir)
+    return doc
 
 
 def read_meta(paths: ArtifactPaths) -> dict:
@@ -268,7 +272,9 @@ def write_summary(paths: ArtifactPaths, payload: dict) -> Path:
         data = _orjson.dumps(payload, option=_orjson.OPT_SORT_KEYS)
     except Exception:
         data = _json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
-    return write_bytes_atomic(paths.summary_json, data)
+    out = write_bytes_atomic(paths.summary_json, data)
+    _index_update(paths.dir)
+    return out
 
 
 def read_summary(paths: ArtifactPaths) -> dict | None:
@@ -359,7 +365,9 @@ def write_meta(paths: ArtifactPaths, payload: dict) -> Path:
         data = _orjson.dumps(payload, option=_orjson.OPT_SORT_KEYS)
     except Exception:
         data = _json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
-    return write_bytes_atomic(paths.meta_json, data) 
+    out = write_bytes_atomic(paths.meta_json, data)
+    _index_update(paths.dir)
+    return out
 
 
 # -------- Listing, Stats, and Expiration (CACHE-007..010) --------
@@ -406,7 +414,8 @@ def iter_artifact_dirs(root: Path | None = None) -> Iterator[Path]:
     if not r.exists():
         return iter(())
     for video_dir in r.iterdir():
-        if not video_dir.is_dir():
+        # Skip files and internal dot-directories such as the blob store
+        if not video_dir.is_dir() or video_dir.name.startswith("."):
             continue
         for engine_dir in video_dir.iterdir():
             if not engine_dir.is_dir():
@@ -419,54 +428,120 @@ def iter_artifact_dirs(root: Path | None = None) -> Iterator[Path]:
                         yield hash_dir
 
 
-def scan_cache(root: Path | None = None) -> list[CacheEntry]:
-    entries: list[CacheEntry] = []
-    for d in iter_artifact_dirs(root):
+def _root_for_dir(d: Path) -> Path:
+    # <root>/<video_id>/<engine>/<model>/<hash>
+    return Path(d).parents[3]
+
+
+def _entry_from_dir(d: Path) -> CacheEntry | None:
+    """Build a CacheEntry for one artifact dir from disk (None if incomplete)."""
+    try:
+        video_id = d.parents[2].name
+        engine = d.parents[1].name
+        model = d.parents[0].name
+        cfg_hash = d.name
+    except Exception:
+        return None
+    paths = ArtifactPaths(
+        dir=d,
+        meta_json=d / META_JSON,
+        transcript_json=d / TRANSCRIPT_JSON,
+        captions_srt=d / CAPTIONS_SRT,
+        summary_json=d / SUMMARY_JSON,
+    )
+    if not artifacts_exist(paths):
+        return None
+    created_at: datetime | None = None
+    title: str | None = None
+    url: str | None = None
+    if paths.meta_json.exists():
         try:
-            # <root>/<video_id>/<engine>/<model>/<hash>
-            video_id = d.parents[2].name
-            engine = d.parents[1].name
-            model = d.parents[0].name
-            cfg_hash = d.name
+            meta = read_meta(paths)
+            created_at = _parse_iso8601_z(str(meta.get("created_at", "")))
+            src = meta.get("source") or {}
+            title = src.get("title")
+            url = src.get("url")
         except Exception:
-            continue
-        paths = ArtifactPaths(
-            dir=d,
-            meta_json=d / META_JSON,
-            transcript_json=d / TRANSCRIPT_JSON,
-            captions_srt=d / CAPTIONS_SRT,
-            summary_json=d / SUMMARY_JSON,
-        )
-        if not artifacts_exist(paths):
-            continue
-        created_at: datetime | None = None
-        title: str | None = None
-        url: str | None = None
-        if paths.meta_json.exists():
-            try:
-                meta = read_meta(paths)
-                created_at = _parse_iso8601_z(str(meta.get("created_at", "")))
-                src = meta.get("source") or {}
-                title = src.get("title")
-                url = src.get("url")
-            except Exception:
-                pass
-        entries.append(
-            CacheEntry(
-                dir=d,
-                video_id=video_id,
-                engine=engine,
-                model=model,
-                config_hash=cfg_hash,
-                created_at=created_at,
-                size_bytes=dir_size(d),
-                title=title,
-                url=url,
-            )
-        )
+            pass
+    return CacheEntry(
+        dir=d,
+        video_id=video_id,
+        engine=engine,
+        model=model,
+        config_hash=cfg_hash,
+        created_at=created_at,
+        size_bytes=dir_size(d),
+        title=title,
+        url=url,
+    )
+
+
+def _scan_cache_disk(root: Path | None = None) -> list[CacheEntry]:
+    entries: list[CacheEntry] = []
+    for d in iter_artifact_dirs(root):
+        e = _entry_from_dir(d)
+        if e is not None:
+            entries.append(e)
     return entries
 
 
+def _open_index(root: Path | None = None) -> "CacheIndex":
+    """Return the index for `root`, building it from disk the first time."""
+    from .cache_index import CacheIndex
+
+    idx = CacheIndex(root or cache_root())
+    if not idx.exists():
+        idx.replace_all(_scan_cache_disk(idx.root))
+    return idx
+
+
+def _index_update(d: Path) -> None:
+    """Upsert one artifact dir into its root's index (best effort, never raises)."""
+    try:
+        from .cache_index import CacheIndex
+
+        idx = CacheIndex(_root_for_dir(d))
+        if not idx.exists():
+            # First write to a fresh/legacy cache: build the full index once
+            _open_index(idx.root)
+            return
+        e = _entry_from_dir(d)
+        if e is not None:
+            idx.upsert(e)
+        else:
+            idx.remove([d])  # not (or no longer) a complete artifact set
+    except Exception:
+        pass
+
+
+def _index_touch(d: Path) -> None:
+    """Record a cache hit for LRU eviction (best effort, never raises)."""
+    try:
+        from .cache_index import CacheIndex
+
+        idx = CacheIndex(_root_for_dir(d))
+        if idx.exists():
+            idx.touch(d)
+    except Exception:
+        pass
+
+
+def rebuild_index(root: Path | None = None) -> int:
+    """Rebuild the cache index from disk; returns the number of entries."""
+    from .cache_index import CacheIndex
+
+    r = root or cache_root()
+    return CacheIndex(r).replace_all(_scan_cache_disk(r))
+
+
+def scan_cache(root: Path | None = None, *, video_id: str | None = None) -> list[CacheEntry]:
+    """List complete artifact sets (optionally for one video) from the cache index."""
+    r = root or cache_root()
+    if not r.exists():
+        return []
+    return _open_index(r).entries(video_id=video_id)
+
+
 def clear_cache(root: Path | None = None, *, video_id: str | None = None) -> tuple[int, int]:
     """Clear entire cache or a specific video's cache subtree.
 
@@ -491,17 +566,27 @@ def clear_cache(root: Path | None = None, *, video_id: str | None = None) -> tup
             removed += 1
         except FileNotFoundError:
             pass
+    if video_id and removed:
+        try:
+            from .cache_index import CacheIndex
+
+            idx = CacheIndex(r)
+            if idx.exists():
+                idx.remove_video(_sanitize_segment(video_id))
+        except Exception:
+            pass
+        # Drop shared audio blobs that no remaining artifact set links to
+        from .blobs import prune_blobs
+
+        freed += prune_blobs(r)[1]
     return (removed, freed)
 
 
 def cache_statistics(root: Path | None = None) -> dict:
-    entries = scan_cache(root)
-    unique_videos = len({e.video_id for e in entries})
-    return {
-        "entries": len(entries),
-        "unique_videos": unique_videos,
-        "total_size_bytes": sum(e.size_bytes for e in entries),
-    }
+    r = root or cache_root()
+    if not r.exists():
+        return {"entries": 0, "unique_videos": 0, "total_size_bytes": 0}
+    return _open_index(r).stats()
 
 
 def expire_cache(ttl_seconds: int, root: Path | None = None) -> list[Path]:
@@ -509,20 +594,174 @@ def expire_cache(ttl_seconds: int, root: Path | None = None) -> list[Path]:
 
     Returns list of removed directories. Only considers entries with valid created_at.
     """
-    now = datetime.now(timezone.utc)
+    from datetime import timedelta
+
+    r = root or cache_root()
+    if not r.exists():
+        return []
+    idx = _open_index(r)
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=ttl_seconds)
     removed: list[Path] = []
-    for e in scan_cache(root):
-        if e.created_at is None:
+    gone: list[Path] = []
+    for e in idx.older_than(cutoff):
+        try:
+            shutil.rmtree(e.dir)
+            removed.append(e.dir)
+        except FileNotFoundError:
+            pass
+        gone.append(e.dir)
+    if gone:
+        idx.remove(gone)
+    return removed
+
+
+# Reproducible intermediates: evicted before any transcript/summary is removed
+_INTERMEDIATE_SUFFIXES = {".wav", ".m4a", ".mp4", ".webm", ".opus", ".ogg", ".mp3", ".aac", ".flac", ".part"}
+CHAPTERS_DIR = "chapters"
+
+
+def _intermediates(d: Path) -> list[Path]:
+    out: list[Path] = []
+    try:
+        for p in Path(d).iterdir():
+            if p.is_dir() and p.name == CHAPTERS_DIR:
+                out.append(p)
+            elif p.is_file() and p.suffix.lower() in _INTERMEDIATE_SUFFIXES:
+                out.append(p)
+    except FileNotFoundError:
+        pass
+    return out
+
+
+def _path_size(p: Path) -> int:
+    if p.is_dir():
+        return dir_size(p)
+    try:
+        return p.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+@dataclass
+class GCReport:
+    """Outcome of a size-bounded `gc_cache` run."""
+
+    max_bytes: int
+    size_before: int
+    size_after: int
+    trimmed: list[Path]  # intermediates deleted from artifact sets that were kept
+    removed: list[Path]  # whole artifact sets evicted
+    blobs_freed: int = 0
+
+    @property
+    def freed_bytes(self) -> int:
+        return self.size_before - self.size_after + self.blobs_freed
+
+
+def gc_cache(
+    max_bytes: int,
+    root: Path | None = None,
+    *,
+    keep: Iterable[Path] = (),
+    dry_run: bool = False,
+) -> GCReport:
+    """Shrink the cache below `max_bytes`, evicting least-recently-used data first.
+
+    Two passes over artifact sets in LRU order (last cache hit, else creation):
+    first delete reproducible intermediates (audio, WAV, `chapters/` slices),
+    then, if still over the limit, whole artifact sets. Dirs in `keep` are never
+    removed entirely. Sizes come from the index and count hardlinked blobs once
+    per artifact set, so the estimate errs on the side of deleting more.
+    """
+    r = root or cache_root()
+    if not r.exists():
+        return GCReport(max_bytes=max_bytes, size_before=0, size_after=0, trimmed=[], removed=[])
+    idx = _open_index(r)
+    lru = [e for e, _ in idx.least_recently_used()]
+    sizes = {e.dir: e.size_bytes for e in lru}
+    total = sum(sizes.values())
+    report = GCReport(max_bytes=max_bytes, size_before=total, size_after=total, trimmed=[], removed=[])
+    protected = {Path(k).resolve() for k in keep}
+
+    for e in lru:
+        if total <= max_bytes:
+            break
+        freed = 0
+        for p in _intermediates(e.dir):
+            size = _path_size(p)
+            if not dry_run:
+                try:
+                    if p.is_dir():
+                        shutil.rmtree(p)
+                    else:
+                        p.unlink()
+                except FileNotFoundError:
+                    pass
+            report.trimmed.append(p)
+            freed += size
+        if freed:
+            total -= freed
+            sizes[e.dir] = max(0, sizes[e.dir] - freed)
+            if not dry_run:
+                idx.set_size(e.dir, sizes[e.dir])
+
+    gone: list[Path] = []
+    for e in lru:
+        if total <= max_bytes:
+            break
+        if e.dir.resolve() in protected:
             continue
-        created = e.created_at.astimezone(timezone.utc)
-        age = (now - created).total_seconds()
-        if age > ttl_seconds:
+        if not dry_run:
             try:
                 shutil.rmtree(e.dir)
-                removed.append(e.dir)
             except FileNotFoundError:
                 pass
-    return removed
+        gone.append(e.dir)
+        total -= sizes[e.dir]
+    if gone and not dry_run:
+        idx.remove(gone)
+    report.removed = gone
+    report.size_after = max(0, total)
+    if not dry_run:
+        # Provider-side uploads past their expiry are already gone remotely
+        for rec in idx.uploads(expired_at=time.time()):
+            idx.forget_upload(rec.provider, rec.digest)
+    if not dry_run and (report.trimmed or gone):
+        from .blobs import prune_blobs
+
+        report.blobs_freed = prune_blobs(r)[1]
+    return report
+
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_size(s: str) -> int:
+    """Parse a human size such as `200G`, `512M`, `1.5T` or `1048576` (binary units)."""
+    text = str(s).strip().upper().removesuffix("IB").removesuffix("B")
+    num = text.rstrip("KMGT")
+    unit = text[len(num):]
+    if unit not in _SIZE_UNITS or not num:
+        raise ValueError(f"invalid size: {s!r}")
+    try:
+        value = float(num)
+    except ValueError:
+        raise ValueError(f"invalid size: {s!r}") from None
+    if value < 0:
+        raise ValueError(f"invalid size: {s!r}")
+    return int(value * _SIZE_UNITS[unit])
+
+
+def get_max_size_from_env() -> int | None:
+    """Read the cache size limit from env: YTX_CACHE_MAX_SIZE (e.g. `200G`)."""
+    s = os.environ.get("YTX_CACHE_MAX_SIZE")
+    if not s:
+        return None
+    try:
+        v = parse_size(s)
+        return v if v > 0 else None
+    except ValueError:
+        return None
 
 
 def get_ttl_seconds_from_env() -> int | None:
@@ -566,8 +805,13 @@ __all__ = [
     "write_meta",
     "CacheEntry",
     "scan_cache",
+    "rebuild_index",
     "clear_cache",
     "cache_statistics",
     "expire_cache",
     "get_ttl_seconds_from_env",
+    "get_max_size_from_env",
+    "parse_size",
+    "gc_cache",
+    "GCReport",
 ]
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+"""SQLite index of cached artifact sets.
+
+Listing, stats, per-video lookup and TTL expiry used to walk the whole
+`<video_id>/<engine>/<model>/<hash>/` tree, stat every file and parse every
+meta.json. The index keeps one row per artifact directory in
+`<cache_root>/index.sqlite3`; rows are upserted when meta/summary files are
+written and the table can always be rebuilt from disk (`ytx cache reindex`).
+
+Each operation opens its own short-lived connection, so the index is safe to
+use from the batch pipeline's worker threads and from concurrent processes.
+
+The `uploads` table remembers provider-side file handles (e.g. Gemini Files
+API uploads) by content digest and expiry, so identical audio is uploaded
+once and referenced until the provider drops it.
+
+The `summaries` table is a content-addressed store of LLM summaries keyed by
+a digest of the normalized input text and the summarizer parameters (see
+`ytx.summarizer`), shared by every artifact set and by `summarize-file`.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+import sqlite3
+import time
+
+if TYPE_CHECKING:  # avoid runtime import cycles
+    from .cache import CacheEntry
+
+INDEX_DB = "index.sqlite3"
+SCHEMA_VERSION = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    dir TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    model TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    created_at REAL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    complete INTEGER NOT NULL DEFAULT 0,
+    title TEXT,
+    url TEXT,
+    last_access REAL
+);
+CREATE INDEX IF NOT EXISTS entries_video ON entries(video_id);
+CREATE INDEX IF NOT EXISTS entries_created ON entries(created_at);
+CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS uploads (
+    provider TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    name TEXT NOT NULL,
+    uri TEXT,
+    mime_type TEXT,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    created_at REAL,
+    expires_at REAL,
+    PRIMARY KEY (provider, digest)
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    model TEXT,
+    payload TEXT NOT NULL,
+    created_at REAL,
+    last_access REAL
+);
+"""
+
+
+@dataclass(frozen=True)
+class UploadRecord:
+    provider: str
+    digest: str
+    name: str
+    uri: str | None
+    mime_type: str | None
+    size_bytes: int
+    created_at: float | None
+    expires_at: float | None
+
+
+class CacheIndex:
+    """Thin wrapper over the index database for one cache root."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.path = self.root / INDEX_DB
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30.0)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            _migrate(conn)
+            with conn:  # one transaction per operation
+                yield conn
+        finally:
+            conn.close()
+
+    def _rel(self, d: Path) -> str:
+        try:
+            return Path(d).relative_to(self.root).as_posix()
+        except ValueError:
+            return Path(d).as_posix()
+
+    # --- writes ---
+
+    def upsert(self, entry: "CacheEntry", *, complete: bool = True) -> None:
+        """Insert or update the row for `entry.dir`; a write counts as an access."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO entries"
+                " (dir, video_id, engine, model, config_hash, created_at, size_bytes, complete, title, url, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(dir) DO UPDATE SET video_id=excluded.video_id, engine=excluded.engine,"
+                " model=excluded.model, config_hash=excluded.config_hash, created_at=excluded.created_at,"
+                " size_bytes=excluded.size_bytes, complete=excluded.complete, title=excluded.title,"
+                " url=excluded.url, last_access=excluded.last_access",
+                _row(self._rel(entry.dir), entry, complete) + (time.time(),),
+            )
+
+    def touch(self, d: Path, *, when: float | None = None) -> None:
+        """Record an access (cache hit) for artifact dir `d`."""
+        with self._connect() as conn:
+            conn.execute("UPDATE entries SET last_access = ? WHERE dir = ?", (when or time.time(), self._rel(d)))
+
+    def set_size(self, d: Path, size_bytes: int) -> None:
+        with self._connect() as conn:
+            conn.execute("UPDATE entries SET size_bytes = ? WHERE dir = ?", (int(size_bytes), self._rel(d)))
+
+    def remove(self, dirs: Iterable[Path]) -> None:
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM entries WHERE dir = ?", [(self._rel(d),) for d in dirs])
+
+    def remove_video(self, video_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE video_id = ?", (video_id,))
+
+    def replace_all(self, entries: Iterable["CacheEntry"]) -> int:
+        """Replace the whole table with `entries` in a single transaction."""
+        rows = [_row(self._rel(e.dir), e, True) for e in entries]
+        with self._connect() as conn:
+            # Keep access history for directories that survive the rebuild
+            seen = dict(conn.execute("SELECT dir, last_access FROM entries WHERE last_access IS NOT NULL"))
+            conn.execute("DELETE FROM entries")
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries"
+                " (dir, video_id, engine, model, config_hash, created_at, size_bytes, complete, title, url, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [r + (seen.get(r[0]),) for r in rows],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO info (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+            )
+        return len(rows)
+
+    # --- queries ---
+
+    def entries(self, *, video_id: str | None = None) -> list["CacheEntry"]:
+        sql = "SELECT * FROM entries WHERE complete = 1"
+        args: tuple = ()
+        if video_id is not None:
+            sql += " AND video_id = ?"
+            args = (video_id,)
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            return [self._entry(r) for r in conn.execute(sql + " ORDER BY video_id, dir", args)]
+
+    def older_than(self, cutoff: datetime) -> list["CacheEntry"]:
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                "SELECT * FROM entries WHERE complete = 1 AND created_at IS NOT NULL AND created_at < ?",
+                (cutoff.timestamp(),),
+            )
+            return [self._entry(r) for r in rows]
+
+    def least_recently_used(self) -> list[tuple["CacheEntry", float]]:
+        """All entries with their last access time (falling back to creation), oldest first."""
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                "SELECT *, COALESCE(last_access, created_at, 0) AS used FROM entries"
+                " WHERE complete = 1 ORDER BY used, dir"
+            )
+            return [(self._entry(r), float(r["used"])) for r in rows]
+
+    # --- provider uploads ---
+
+    def record_upload(self, rec: UploadRecord) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO uploads"
+                " (provider, digest, name, uri, mime_type, size_bytes, created_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (rec.provider, rec.digest, rec.name, rec.uri, rec.mime_type, int(rec.size_bytes), rec.created_at, rec.expires_at),
+            )
+
+    def find_upload(self, provider: str, digest: str) -> UploadRecord | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT provider, digest, name, uri, mime_type, size_bytes, created_at, expires_at"
+                " FROM uploads WHERE provider = ? AND digest = ?",
+                (provider, digest),
+            ).fetchone()
+        return UploadRecord(*row) if row else None
+
+    def forget_upload(self, provider: str, digest: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM uploads WHERE provider = ? AND digest = ?", (provider, digest))
+
+    def uploads(self, provider: str | None = None, *, expired_at: float | None = None) -> list[UploadRecord]:
+        """Recorded uploads, optionally only those expired at time `expired_at`."""
+        sql = "SELECT provider, digest, name, uri, mime_type, size_bytes, created_at, expires_at FROM uploads WHERE 1 = 1"
+        args: list = []
+        if provider is not None:
+            sql += " AND provider = ?"
+            args.append(provider)
+        if expired_at is not None:
+            sql += " AND expires_at IS NOT NULL AND expires_at <= ?"
+            args.append(expired_at)
+        with self._connect() as conn:
+            return [UploadRecord(*r) for r in conn.execute(sql + " ORDER BY created_at", args)]
+
+    # --- summaries ---
+
+    def get_summary(self, key: str) -> str | None:
+        """Stored JSON payload for summary `key`, recording the access."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT payload FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE summaries SET last_access = ? WHERE key = ?", (time.time(), key))
+        return row[0] if row else None
+
+    def put_summary(self, key: str, payload: str, *, kind: str, model: str | None = None) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, kind, model, payload, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, kind, model, payload, now, now),
+            )
+
+    def clear_summaries(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM summaries").rowcount
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            n, videos, size = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT video_id), COALESCE(SUM(size_bytes), 0)"
+                " FROM entries WHERE complete = 1"
+            ).fetchone()
+        return {"entries": int(n), "unique_videos": int(videos), "total_size_bytes": int(size)}
+
+    def _entry(self, r: sqlite3.Row) -> "CacheEntry":
+        from .cache import CacheEntry
+
+        created = r["created_at"]
+        return CacheEntry(
+            dir=self.root / r["dir"],
+            video_id=r["video_id"],
+            engine=r["engine"],
+            model=r["model"],
+            config_hash=r["config_hash"],
+            created_at=datetime.fromtimestamp(created, tz=timezone.utc) if created is not None else None,
+            size_bytes=int(r["size_bytes"]),
+            title=r["title"],
+            url=r["url"],
+        )
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(entries)")}
+    if "last_access" not in cols:  # schema v1
+        conn.execute("ALTER TABLE entries ADD COLUMN last_access REAL")
+
+
+def _row(rel: str, e: "CacheEntry", complete: bool) -> tuple:
+    created = e.created_at.timestamp() if e.created_at is not None else None
+    return (rel, e.video_id, e.engine, e.model, e.config_hash, created, int(e.size_bytes), int(complete), e.title, e.url)
+
+
+__all__ = ["INDEX_DB", "CacheIndex", "UploadRecord"]
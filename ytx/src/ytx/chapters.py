@@ -6,13 +6,15 @@ Provides helpers to parse chapter metadata emitted by yt-dlp's --dump-json
 output into our Chapter model. Handles videos without chapters gracefully.
 """
 
-from typing import Any, List, Callable, Tuple
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Callable, Sequence, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import tempfile
 
-from .chunking import slice_wav_segment
+from .chunking import slice_wav_segments
 from .models import TranscriptSegment
+from .stitch import shift_words
 from .config import AppConfig
 from .engines.base import TranscriptionEngine
 
@@ -105,6 +107,8 @@ __all__ = [
     "process_chapters",
     "offset_chapter_segments",
     "stitch_chapter_segments",
+    "stitch_chapter_results",
+    "chapter_texts",
 ]
 
 
@@ -129,7 +133,7 @@ def slice_audio_by_chapters(
     """
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
-    items: List[Tuple[int, Chapter, Path]] = []
+    slices: List[Tuple[Path, float, float]] = []
     n = len(chapters)
     for i, ch in enumerate(chapters):
         # Overlap: add overlap_seconds to the end except the last chapter
@@ -138,10 +142,10 @@ def slice_audio_by_chapters(
         if i < n - 1:
             end = min(float(chapters[i + 1].end), end + max(0.0, overlap_seconds))
         name = f"chapter_{i:03d}_{_safe_slug(ch.title)}.wav"
-        dst = out_dir / name
-        slice_wav_segment(src, dst, start=start, end=end)
-        items.append((i, ch, dst))
-    return items
+        slices.append((out_dir / name, start, end))
+    # One pass over the source for all chapters (native copy or a single ffmpeg decode)
+    paths = slice_wav_segments(src, slices)
+    return [(i, ch, path) for i, (ch, path) in enumerate(zip(chapters, paths))]
 
 
 def process_chapters(
@@ -210,6 +214,7 @@ def offset_chapter_segments(
                     end=float(base) + float(s.end),
                     text=s.text,
                     confidence=s.confidence,
+                    words=shift_words(s.words, base),
                 )
             )
     # Renumber by time
@@ -230,3 +235,43 @@ def stitch_chapter_segments(
     from .stitch import stitch_segments
 
     return stitch_segments(segments, epsilon=epsilon)
+
+
+def stitch_chapter_results(
+    items: List[Tuple[int, Chapter, List[TranscriptSegment]]],
+    *,
+    overlap_seconds: float = 2.0,
+    epsilon: float = 0.01,
+) -> List[TranscriptSegment]:
+    """Offset per-chapter segments to video time and stitch chapter boundaries.
+
+    Slices overlap as in `slice_audio_by_chapters`; when segments carry word
+    timings the overlap is cut exactly at its midpoint, otherwise this is the
+    same as `stitch_chapter_segments(offset_chapter_segments(items))`.
+    """
+    from .stitch import stitch_chunks
+
+    ordered = sorted(items, key=lambda t: t[0])
+    chunks: List[Tuple[float, float, List[TranscriptSegment]]] = []
+    for pos, (idx, ch, segs) in enumerate(ordered):
+        end = float(ch.end)
+        if pos < len(ordered) - 1:
+            end = min(float(ordered[pos + 1][1].end), end + max(0.0, overlap_seconds))
+        chunks.append((float(ch.start), end, offset_chapter_segments([(idx, ch, segs)])))
+    return stitch_chunks(chunks, epsilon=epsilon)
+
+
+def chapter_texts(chapters: Sequence[Chapter], segments: Sequence[TranscriptSegment]) -> List[str]:
+    """Text of the segments lying entirely inside each chapter, one string per chapter.
+
+    Segments are located by binary search over their start times, so the cost
+    is O((chapters + segments) log segments) instead of a scan per chapter.
+    """
+    ordered = sorted(segments, key=lambda s: s.start)
+    starts = [float(s.start) for s in ordered]
+    out: List[str] = []
+    for ch in chapters:
+        lo = bisect_left(starts, float(ch.start))
+        hi = bisect_right(starts, float(ch.end))
+        out.append(" ".join(s.text for s in ordered[lo:hi] if s.end <= ch.end).strip())
+    return out
@@ -2,14 +2,23 @@ from __future__ import annotations
 
 """Audio chunking utilities for long files.
 
-Provides helpers to compute chunk boundaries and slice WAV audio using ffmpeg.
-Default strategy: fixed windows with small overlaps.
+Provides helpers to compute chunk boundaries and slice WAV audio. Canonical
+16 kHz mono PCM16 WAVs (what `normalize_wav` produces) are sliced in-process
+by copying the frame range; anything else goes through ffmpeg.
+Default strategy: fixed windows with small overlaps; `plan_chunks` moves cuts
+into nearby pauses of a canonical WAV so most chunks need no overlap.
+
+`ChunkPrefetcher` slices chunks on a background thread a few steps ahead of
+the consumers, so ffmpeg cutting overlaps with uploads/transcription while the
+number of chunk files on disk stays bounded.
 """
 
 from dataclasses import dataclass
 from pathlib import Path
 import subprocess
-from typing import List, Tuple
+import threading
+import wave
+from typing import Callable, List, Sequence, Tuple
 
 from .audio import ensure_ffmpeg, FFmpegError
 
@@ -45,18 +54,110 @@ def compute_chunks(duration: float, *, window_seconds: float = 600.0, overlap_se
     return chunks
 
 
+def plan_chunks(
+    duration: float,
+    *,
+    window_seconds: float = 600.0,
+    overlap_seconds: float = 2.0,
+    audio_path: Path | None = None,
+    tolerance_seconds: float = 30.0,
+) -> List[Tuple[float, float]]:
+    """Chunk boundaries that fall in pauses of `audio_path` where possible.
+
+    Each cut is moved back from `start + window` to the latest silence found
+    within `tolerance_seconds` (see `ytx.silence.find_silence`); such cuts
+    split no words, so the next chunk starts right there with no overlap.
+    Cuts with no pause nearby keep the fixed window and `overlap_seconds`.
+    Chunks never exceed `window_seconds`. Without `audio_path`, NumPy, or a
+    canonical WAV this is exactly `compute_chunks`.
+    """
+    from .silence import find_silence, open_pcm
+
+    pcm = open_pcm(audio_path)
+    if pcm is None or duration <= 0:
+        return compute_chunks(duration, window_seconds=window_seconds, overlap_seconds=overlap_seconds)
+    w = max(1.0, float(window_seconds))
+    o = max(0.0, min(float(overlap_seconds), w - 0.001))
+    tol = max(0.0, min(float(tolerance_seconds), w / 2))
+    chunks: List[Tuple[float, float]] = []
+    start = 0.0
+    while start < duration:
+        end = min(duration, start + w)
+        if end >= duration:
+            chunks.append((round(start, 3), round(end, 3)))
+            break
+        cut = find_silence(pcm, end - tol, end) if tol > 0 else None
+        if cut is not None and cut > start:
+            chunks.append((round(start, 3), round(cut, 3)))
+            start = cut
+        else:
+            chunks.append((round(start, 3), round(end, 3)))
+            start = max(0.0, end - o)
+    return chunks
+
+
+CANONICAL_RATE = 16000
+_COPY_FRAMES = 1 << 18  # ~0.5 MB of PCM16 per read
+
+
+def is_canonical_wav(path: Path) -> bool:
+    """True if `path` is an uncompressed 16 kHz mono 16-bit WAV."""
+    try:
+        with wave.open(str(path), "rb") as w:
+            return (
+                w.getnchannels() == 1
+                and w.getsampwidth() == 2
+                and w.getframerate() == CANONICAL_RATE
+                and w.getcomptype() == "NONE"
+            )
+    except (wave.Error, EOFError, OSError):
+        return False
+
+
+def slice_wav_native(src: Path, dst: Path, *, start: float, end: float) -> Path:
+    """Copy the [start,end] second range of a canonical WAV without decoding.
+
+    The data chunk is fixed-size PCM frames, so a slice is a frame-range copy
+    done in bounded blocks; no subprocess is spawned.
+    """
+    src = Path(src)
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(src), "rb") as r:
+        rate = r.getframerate()
+        total = r.getnframes()
+        first = min(total, max(0, int(round(float(start) * rate))))
+        last = min(total, max(first, int(round(float(end) * rate))))
+        r.setpos(first)
+        with wave.open(str(dst), "wb") as w:
+            w.setnchannels(r.getnchannels())
+            w.setsampwidth(r.getsampwidth())
+            w.setframerate(rate)
+            remaining = last - first
+            while remaining > 0:
+                data = r.readframes(min(_COPY_FRAMES, remaining))
+                if not data:
+                    break
+                w.writeframesraw(data)
+                remaining -= len(data) // r.getsampwidth()
+    return dst
+
+
 def slice_wav_segment(src: Path, dst: Path, *, start: float, end: float) -> Path:
-    """Slice a WAV file into [start,end] seconds using ffmpeg and re-encode to PCM.
+    """Slice a WAV file into [start,end] seconds as 16 kHz mono PCM WAV.
 
-    Produces 16 kHz mono PCM WAV similar to normalization settings.
+    Canonical inputs are copied natively (`slice_wav_native`); other inputs
+    are cut and re-encoded with ffmpeg to match normalization settings.
     """
-    ensure_ffmpeg()
     src = Path(src)
     dst = Path(dst)
     if not src.exists():
         raise FFmpegError(f"source file not found: {src}")
     if end <= start:
         raise FFmpegError("invalid slice bounds: end must be > start")
+    if is_canonical_wav(src):
+        return slice_wav_native(src, dst, start=start, end=end)
+    ensure_ffmpeg()
     dst.parent.mkdir(parents=True, exist_ok=True)
     # Use -ss before -i for fast seek; re-encode for correctness
     cmd = [
@@ -88,9 +189,203 @@ def slice_wav_segment(src: Path, dst: Path, *, start: float, end: float) -> Path
     return dst
 
 
+def slice_encoded_segment(src: Path, dst: Path, *, start: float, end: float) -> Path:
+    """Cut [start,end] seconds out of an encoded (Opus/MP3/FLAC) file without re-encoding.
+
+    Stream copy snaps to codec packet boundaries (tens of milliseconds), which
+    chunk stitching tolerates.
+    """
+    src = Path(src)
+    dst = Path(dst)
+    if not src.exists():
+        raise FFmpegError(f"source file not found: {src}")
+    if end <= start:
+        raise FFmpegError("invalid slice bounds: end must be > start")
+    ensure_ffmpeg()
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+        "-ss", f"{max(0.0, float(start)):.3f}", "-to", f"{max(0.0, float(end)):.3f}",
+        "-i", str(src), "-vn", "-c:a", "copy", str(dst),
+    ]
+    proc = subprocess.run(cmd, check=False, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise FFmpegError(f"ffmpeg slice failed: {proc.stderr.strip()}")
+    if not dst.exists():
+        raise FFmpegError("ffmpeg reported success but output is missing")
+    return dst
+
+
+def build_multi_slice_command(src: Path, slices: Sequence[Tuple[Path, float, float]]) -> List[str]:
+    """ffmpeg command that decodes `src` once and writes every (dst, start, end) slice.
+
+    The decoded stream is resampled to 16 kHz mono, split N ways and each
+    branch is trimmed with `atrim`, so overlapping ranges cost no extra I/O.
+    """
+    n = len(slices)
+    labels = "".join(f"[s{i}]" for i in range(n))
+    graph = [f"[0:a]aresample={CANONICAL_RATE},aformat=sample_fmts=s16:channel_layouts=mono,asplit={n}{labels}"]
+    for i, (_dst, start, end) in enumerate(slices):
+        graph.append(f"[s{i}]atrim=start={max(0.0, float(start)):.3f}:end={max(0.0, float(end)):.3f},asetpts=PTS-STARTPTS[o{i}]")
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", str(src), "-filter_complex", ";".join(graph)]
+    for i, (dst, _start, _end) in enumerate(slices):
+        cmd += ["-map", f"[o{i}]", "-c:a", "pcm_s16le", str(dst)]
+    return cmd
+
+
+def slice_wav_segments(src: Path, slices: Sequence[Tuple[Path, float, float]]) -> List[Path]:
+    """Slice many (dst, start, end) ranges from `src` and return the paths in order.
+
+    Canonical WAVs are copied natively per slice; other inputs are decoded in
+    a single ffmpeg pass that emits all slices at once.
+    """
+    src = Path(src)
+    if not src.exists():
+        raise FFmpegError(f"source file not found: {src}")
+    for _dst, start, end in slices:
+        if end <= start:
+            raise FFmpegError("invalid slice bounds: end must be > start")
+    if not slices:
+        return []
+    if is_canonical_wav(src):
+        return [slice_wav_native(src, dst, start=start, end=end) for dst, start, end in slices]
+    ensure_ffmpeg()
+    for dst, _start, _end in slices:
+        Path(dst).parent.mkdir(parents=True, exist_ok=True)
+    proc = subprocess.run(build_multi_slice_command(src, slices), check=False, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise FFmpegError(f"ffmpeg slice failed: {proc.stderr.strip()}")
+    missing = [str(dst) for dst, _s, _e in slices if not Path(dst).exists()]
+    if missing:
+        raise FFmpegError(f"ffmpeg reported success but outputs are missing: {', '.join(missing[:3])}")
+    return [Path(dst) for dst, _s, _e in slices]
+
+
+class ChunkPrefetcher:
+    """Slice `ranges` of `src` into `out_dir` in order on a background thread.
+
+    At most `max_ahead` chunks are held at any time: a chunk counts from the
+    moment slicing starts until the consumer calls `release(idx)`, which also
+    deletes the file. Consumers call `get(idx)` to wait for a chunk; slicing
+    errors are re-raised there. `cancel()` stops slicing and wakes waiters.
+    """
+
+    def __init__(
+        self,
+        src: Path,
+        ranges: Sequence[Tuple[float, float]],
+        out_dir: Path,
+        *,
+        max_ahead: int = 2,
+        slicer: Callable[..., Path] = slice_wav_segment,
+        suffix: str = ".wav",
+    ) -> None:
+        self.src = Path(src)
+        self.suffix = suffix
+        self._transcoded: Path | None = None
+        self.ranges = list(ranges)
+        self.out_dir = Path(out_dir)
+        self._slicer = slicer
+        self._slots = threading.Semaphore(max(1, int(max_ahead)))
+        self._held = [False] * len(self.ranges)
+        self._held_lock = threading.Lock()
+        self._ready = [threading.Event() for _ in self.ranges]
+        self._errors: list[BaseException | None] = [None] * len(self.ranges)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, name="ytx-chunk-prefetch", daemon=True)
+
+    def __enter__(self) -> "ChunkPrefetcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def path_for(self, idx: int) -> Path:
+        return self.out_dir / f"chunk_{idx:04d}{self.suffix}"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _prepare_source(self) -> None:
+        """Decode a non-canonical source once so every chunk is a native copy."""
+        if self._slicer is not slice_wav_segment or is_canonical_wav(self.src):
+            return
+        canonical = self.out_dir / "source.16k.wav"
+        slice_wav_segments(self.src, [(canonical, 0.0, max(end for _s, end in self.ranges))])
+        self.src = self._transcoded = canonical
+
+    def _produce(self) -> None:
+        try:
+            if self.ranges:
+                self._prepare_source()
+        except BaseException as e:
+            for idx in range(len(self.ranges)):
+                self._errors[idx] = e
+                self._ready[idx].set()
+            return
+        for idx, (start, end) in enumerate(self.ranges):
+            while not self._slots.acquire(timeout=0.1):
+                if self._stop.is_set():
+                    return
+            with self._held_lock:
+                self._held[idx] = True
+            if self._stop.is_set():
+                return
+            try:
+                # Slicers write to the path we give them; the return value is not relied on
+                self._slicer(self.src, self.path_for(idx), start=start, end=end)
+            except BaseException as e:  # surfaced to the consumer in get()
+                self._errors[idx] = e
+            self._ready[idx].set()
+
+    def get(self, idx: int) -> Path:
+        while not self._ready[idx].wait(timeout=0.1):
+            if self._stop.is_set() or not self._thread.is_alive():
+                if self._ready[idx].is_set():
+                    break
+                raise FFmpegError(f"chunk {idx} was not prepared (prefetch cancelled)")
+        err = self._errors[idx]
+        if err is not None:
+            raise err
+        return self.path_for(idx)
+
+    def release(self, idx: int) -> None:
+        """Delete chunk `idx` and free its slot; safe to call for unsliced chunks."""
+        with self._held_lock:
+            held, self._held[idx] = self._held[idx], False
+        if not held:
+            return
+        try:
+            self.path_for(idx).unlink(missing_ok=True)
+        except OSError:
+            pass
+        self._slots.release()
+
+    def cancel(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        self.cancel()
+        if self._thread.is_alive():
+            self._thread.join()
+        # Drop chunks sliced ahead for work that never ran
+        for idx in range(len(self.ranges)):
+            self.release(idx)
+        if self._transcoded is not None:
+            self._transcoded.unlink(missing_ok=True)
+
+
 __all__ = [
     "AudioChunk",
+    "ChunkPrefetcher",
+    "build_multi_slice_command",
     "compute_chunks",
+    "is_canonical_wav",
+    "plan_chunks",
+    "slice_encoded_segment",
+    "slice_wav_native",
     "slice_wav_segment",
+    "slice_wav_segments",
 ]
 
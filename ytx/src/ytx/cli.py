@@ -6,32 +6,52 @@ from pathlib import Path
 import typer
 from rich.console import Console
 from .logging import configure_logging
-from .downloader import extract_video_id, fetch_metadata, download_audio
-from .audio import normalize_wav
-from .config import load_config
-from .engines.whisper_engine import WhisperEngine
-from .exporters.manager import parse_formats, export_all
-from .exporters.markdown_exporter import MarkdownExporter  # ensure importable for CLI wiring
-from .models import TranscriptDoc
-from .cache import (
-    artifact_paths_for,
-    artifacts_exist,
-    read_transcript_doc,
-    build_meta_payload,
-    write_meta,
-    scan_cache,
-    clear_cache as cache_clear_func,
-    cache_statistics,
-    expire_cache,
-    get_ttl_seconds_from_env,
-)
-from .chapters import (
-    slice_audio_by_chapters,
-    process_chapters,
-    offset_chapter_segments,
-    stitch_chapter_segments,
-)
-from .errors import write_error_report
+from .urls import extract_video_id
+
+
+def _lazy(module: str, name: str):  # type: ignore[no-untyped-def]
+    """Return a stand-in for `module.name` that imports it on first call.
+
+    `ytx` runs from shell loops, so `--help`, `cache ...` and cache hits must not
+    pay for importing the download/engine/export stack. The stand-ins are plain
+    module attributes, so tests can still monkeypatch e.g. `cli.fetch_metadata`.
+    """
+    from importlib import import_module
+
+    def call(*args, **kwargs):  # type: ignore[no-untyped-def]
+        return getattr(import_module(module, __package__), name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+fetch_metadata = _lazy(".downloader", "fetch_metadata")
+download_audio = _lazy(".downloader", "download_audio")
+stream_audio_to_wav = _lazy(".downloader", "stream_audio_to_wav")
+normalize_wav = _lazy(".audio", "normalize_wav")
+load_config = _lazy(".config", "load_config")
+WhisperEngine = _lazy(".engines.whisper_engine", "WhisperEngine")
+parse_formats = _lazy(".exporters.manager", "parse_formats")
+export_all = _lazy(".exporters.manager", "export_all")
+MarkdownExporter = _lazy(".exporters.markdown_exporter", "MarkdownExporter")
+TranscriptDoc = _lazy(".models", "TranscriptDoc")
+artifact_paths_for = _lazy(".cache", "artifact_paths_for")
+artifacts_exist = _lazy(".cache", "artifacts_exist")
+read_transcript_doc = _lazy(".cache", "read_transcript_doc")
+build_meta_payload = _lazy(".cache", "build_meta_payload")
+write_meta = _lazy(".cache", "write_meta")
+scan_cache = _lazy(".cache", "scan_cache")
+cache_clear_func = _lazy(".cache", "clear_cache")
+cache_statistics = _lazy(".cache", "cache_statistics")
+expire_cache = _lazy(".cache", "expire_cache")
+gc_cache = _lazy(".cache", "gc_cache")
+get_max_size_from_env = _lazy(".cache", "get_max_size_from_env")
+get_ttl_seconds_from_env = _lazy(".cache", "get_ttl_seconds_from_env")
+parse_size = _lazy(".cache", "parse_size")
+slice_audio_by_chapters = _lazy(".chapters", "slice_audio_by_chapters")
+process_chapters = _lazy(".chapters", "process_chapters")
+stitch_chapter_results = _lazy(".chapters", "stitch_chapter_results")
+write_error_report = _lazy(".errors", "write_error_report")
 
 app = typer.Typer(
     no_args_is_help=True,
@@ -56,6 +76,10 @@ def _pkg_version() -> str:
     return "0.2.1"
 
 
+# Set by the root callback from --verbose/--debug
+_VERBOSE = False
+
+
 @app.callback()
 def _root(
     verbose: bool = typer.Option(False, "--verbose", help="Enable verbose output"),
@@ -72,7 +96,9 @@ def _root(
     if version_flag:
         console.print(f"ytx v{_pkg_version()}")
         raise typer.Exit(code=0)
-    configure_logging(verbose=verbose or debug)
+    global _VERBOSE
+    _VERBOSE = verbose or debug
+    configure_logging(verbose=_VERBOSE)
     # Optional: clean old cache entries if TTL is configured via env
     ttl = get_ttl_seconds_from_env()
     if ttl:
@@ -81,6 +107,36 @@ def _root(
             console.print(f"[dim]Expired {len(removed)} cache entrie(s) older than TTL[/]")
 
 
+def _print_connection_stats() -> None:
+    """Per-provider HTTP connection reuse for this run (--verbose/--debug only)."""
+    if not _VERBOSE:
+        return
+    from .http_pool import connection_stats
+
+    for provider, st in connection_stats().items():
+        console.print(
+            f"[dim]HTTP {provider}[/]: {st['requests']} request(s) over {st['connections']} new connection(s), "
+            f"{st['reused']} reused ({st['reuse_ratio']:.0%}), {st['http2_requests']} via HTTP/2"
+        )
+
+
+def _auto_gc(keep: list[Path] | None = None) -> None:
+    """Enforce YTX_CACHE_MAX_SIZE after new artifacts were written (best effort)."""
+    limit = get_max_size_from_env()
+    if not limit:
+        return
+    try:
+        rep = gc_cache(limit, keep=keep or [])
+    except Exception as e:
+        console.print(f"[yellow]Cache gc skipped: {e}[/]")
+        return
+    if rep.trimmed or rep.removed:
+        console.print(
+            f"[dim]Cache gc: trimmed {len(rep.trimmed)} intermediate(s), evicted {len(rep.removed)} "
+            f"artifact set(s), freed {rep.freed_bytes} bytes[/]"
+        )
+
+
 @app.command()
 def version_cmd() -> None:
     """Show version and exit."""
@@ -93,6 +149,67 @@ def hello(name: str = "world") -> None:
     console.print(f"Hello, {name}!")
 
 
+_ALLOWED_ENGINES = {"whisper", "whispercpp", "gemini", "openai", "deepgram", "elevenlabs"}
+
+
+def _parse_engine_opts(engine_opts: str | None) -> dict:
+    """Parse the --engine-opts JSON object (empty dict when not provided)."""
+    opts: dict = {}
+    if engine_opts:
+        try:
+            import orjson as _orjson  # type: ignore
+
+            opts = _orjson.loads(engine_opts)
+            if not isinstance(opts, dict):
+                raise ValueError("engine-opts must be a JSON object")
+        except Exception:
+            import json as _json
+
+            try:
+                opts = _json.loads(engine_opts)
+                if not isinstance(opts, dict):
+                    raise ValueError
+            except Exception:
+                raise typer.BadParameter("Invalid JSON for --engine-opts", param_hint=["--engine-opts"])
+    return opts
+
+
+def _make_engine(engine: str, cfg):  # type: ignore[no-untyped-def]
+    """Instantiate the engine for `engine`, preferring whisper.cpp for Metal."""
+    if engine == "whispercpp" or (engine == "whisper" and cfg.device == "metal"):
+        try:
+            from .engines.whispercpp_engine import WhisperCppEngine
+
+            return WhisperCppEngine()
+        except Exception:
+            console.print(
+                "[yellow]whisper.cpp not available; falling back to faster-whisper CPU[/]"
+            )
+            return WhisperEngine()
+    if engine == "whisper":
+        from .server import find_server, RemoteWhisperEngine
+
+        info = find_server()
+        if info is not None:
+            console.print(f"[dim]Using warm models from ytx serve at {info.url}[/]")
+            return RemoteWhisperEngine(info, fallback_factory=WhisperEngine)
+        return WhisperEngine()
+    from .engines import create_engine
+
+    return create_engine(engine)
+
+
+def _engine_accepts(engine: str, path: Path, cfg) -> bool:  # type: ignore[no-untyped-def]
+    """True if `engine` can transcribe the downloaded `path` without normalization."""
+    from .engines import get_engine_class
+    from .engines.base import accepts_input
+
+    try:
+        return accepts_input(get_engine_class(engine), path, config=cfg)
+    except KeyError:
+        return False
+
+
 @app.command()
 def transcribe(
     url: str = typer.Argument(..., help="YouTube URL to transcribe"),
@@ -142,6 +259,11 @@ def transcribe(
         "--summarize-chapters/--no-summarize-chapters",
         help="Generate a short summary per chapter (uses Gemini)",
     ),
+    batch_chapter_summaries: bool = typer.Option(
+        False,
+        "--batch-chapter-summaries/--no-batch-chapter-summaries",
+        help="Summarize all chapters in one structured request instead of one request per chapter",
+    ),
     summarize: bool = typer.Option(
         False,
         "--summarize/--no-summarize",
@@ -157,38 +279,46 @@ def transcribe(
         "--download-extract-audio/--no-download-extract-audio",
         help="Use yt-dlp to extract to a target audio format during download (extra re-encode)",
     ),
+    stream_download: bool = typer.Option(
+        False,
+        "--stream-download/--no-stream-download",
+        help="Pipe the download straight into ffmpeg (no intermediate audio file); falls back on failure",
+    ),
+    word_timestamps: bool = typer.Option(
+        False,
+        "--word-timestamps/--no-word-timestamps",
+        help="Keep per-word timings (whisper/openai/deepgram) and cut chunk/chapter overlaps exactly",
+    ),
+    upload_codec: str = typer.Option(
+        "auto", "--upload-codec", help="Cloud upload encoding: auto|opus|mp3|flac|wav (auto = per-provider default)"
+    ),
+    speech_only: bool = typer.Option(
+        False,
+        "--speech-only/--no-speech-only",
+        help="Cloud engines: upload only the speech (long silences removed); timestamps are mapped back",
+    ),
+    whisper_workers: int = typer.Option(
+        1, "--whisper-workers", min=1, help="Worker processes for chunk-parallel local Whisper (1 = single pass)"
+    ),
+    whisper_threads: int | None = typer.Option(
+        None, "--whisper-threads", min=1, help="CPU threads per Whisper worker (default: cores / workers)"
+    ),
 ) -> None:
     """Transcribe a YouTube video (stub)."""
     # CLI-008: Parameter validation
     vid = extract_video_id(url)
     if not vid:
         raise typer.BadParameter("Invalid YouTube URL or video ID", param_hint=["url"])
-    allowed_engines = {"whisper", "whispercpp", "gemini", "openai", "deepgram", "elevenlabs"}
-    if engine not in allowed_engines:
+    if engine not in _ALLOWED_ENGINES:
         raise typer.BadParameter("Unsupported engine (supported: whisper)", param_hint=["engine"])
     if output_dir is not None and not output_dir.exists():
         raise typer.BadParameter("Output directory does not exist", param_hint=["output-dir"])
 
-    # Parse engine_opts JSON if provided
-    opts: dict = {}
-    if engine_opts:
-        try:
-            import orjson as _orjson  # type: ignore
-
-            opts = _orjson.loads(engine_opts)
-            if not isinstance(opts, dict):
-                raise ValueError("engine-opts must be a JSON object")
-        except Exception:
-            import json as _json
-
-            try:
-                opts = _json.loads(engine_opts)
-                if not isinstance(opts, dict):
-                    raise ValueError
-            except Exception:
-                raise typer.BadParameter("Invalid JSON for --engine-opts", param_hint=["--engine-opts"])
+    opts = _parse_engine_opts(engine_opts)
     if timestamps not in {"native", "chunked", "none"}:
         raise typer.BadParameter("--timestamps must be one of native|chunked|none", param_hint=["--timestamps"])
+    if upload_codec not in {"auto", "wav", "opus", "mp3", "flac"}:
+        raise typer.BadParameter("--upload-codec must be one of auto|opus|mp3|flac|wav", param_hint=["--upload-codec"])
     # Normalize cap: treat <=0 as None
     abr_cap = None if (max_download_abr_kbps is None or max_download_abr_kbps <= 0) else int(max_download_abr_kbps)
     cfg = load_config(
@@ -198,6 +328,12 @@ def transcribe(
         timestamp_policy=timestamps,
         max_download_abr_kbps=abr_cap,
         download_extract_audio=download_extract_audio,
+        stream_download=stream_download,
+        word_timestamps=word_timestamps,
+        speech_only=speech_only,
+        upload_codec=upload_codec,
+        whisper_workers=whisper_workers,
+        whisper_threads=whisper_threads,
     )
     # Prepare artifact paths for this video/config
     paths = artifact_paths_for(video_id=vid, config=cfg, create=False)
@@ -222,8 +358,8 @@ def transcribe(
                 if doc.summary is None:
                     text = "\n".join(s.text for s in doc.segments if s.text).strip()
                     if text:
-                        summarizer = GeminiSummarizer()
-                        res = summarizer.summarize_long(text, language=doc.language, bullets=5, max_tldr=500)
+                        summarizer = GeminiSummarizer(window_tokens=cfg.summary_window_tokens)
+                        res = summarizer.summarize_long(doc.segments, language=doc.language, bullets=5, max_tldr=500)
                         from .models import Summary as SummaryModel
 
                         doc.summary = SummaryModel(tldr=res.get("tldr", ""), bullets=list(res.get("bullets", [])))
@@ -245,60 +381,60 @@ def transcribe(
     # No valid cache (or overwrite). Ensure artifact directory exists for writes.
     paths = artifact_paths_for(video_id=vid, config=cfg, create=True)
     outdir = paths.dir  # write primary outputs into the cache directory
+    blobs = None
+    if cfg.cache_dedup:
+        from .blobs import blob_root
+
+        blobs = blob_root()
 
     try:
         # Stage 1: metadata
         with console.status("[bold blue]Fetching metadata…", spinner="dots"):
             meta = fetch_metadata(url, timeout=cfg.network_timeout, max_abr_kbps=cfg.max_download_abr_kbps)
 
-        # Stage 2: download audio
-        with console.status("[bold green]Downloading audio…", spinner="dots"):
-            audio_path = download_audio(
-                meta,
-                outdir,
-                timeout=cfg.download_timeout,
-                max_abr_kbps=cfg.max_download_abr_kbps,
-                download_extract_audio=cfg.download_extract_audio,
-            )
+        wav_path: Path | None = None
+        if cfg.stream_download and not cfg.download_extract_audio:
+            # Stages 2+3 in one pass: yt-dlp stdout → ffmpeg stdin → WAV
+            with console.status("[bold green]Downloading + normalizing audio…", spinner="dots"):
+                try:
+                    wav_path = stream_audio_to_wav(
+                        meta,
+                        outdir / f"{meta.id}.wav",
+                        timeout=cfg.download_timeout,
+                        overwrite=overwrite,
+                        max_abr_kbps=cfg.max_download_abr_kbps,
+                        blob_root=blobs,
+                    )
+                except Exception as e:
+                    console.print(f"[yellow]Streaming download failed ({e}); retrying as a file download[/]")
+
+        if wav_path is None:
+            # Stage 2: download audio
+            with console.status("[bold green]Downloading audio…", spinner="dots"):
+                audio_path = download_audio(
+                    meta,
+                    outdir,
+                    timeout=cfg.download_timeout,
+                    max_abr_kbps=cfg.max_download_abr_kbps,
+                    download_extract_audio=cfg.download_extract_audio,
+                    blob_root=blobs,
+                )
 
-        # Stage 3: normalize to WAV
-        with console.status("[bold green]Normalizing audio…", spinner="dots"):
-            wav_path = normalize_wav(audio_path, outdir / f"{meta.id}.wav")
+            # Stage 3: normalize to WAV, unless the engine takes the download as is
+            if _engine_accepts(engine, audio_path, cfg):
+                console.print(f"[dim]Sending {audio_path.suffix.lstrip('.')} audio as is (no WAV normalization)[/]")
+            else:
+                with console.status("[bold green]Normalizing audio…", spinner="dots"):
+                    wav_path = normalize_wav(audio_path, outdir / f"{meta.id}.wav", blob_root=blobs)
+        # What the engine reads: the WAV, or the download when no WAV was needed
+        source_path = wav_path if wav_path is not None else audio_path
     except KeyboardInterrupt:
         report = write_error_report(paths.dir if 'paths' in locals() else Path.cwd(), InterruptError().with_traceback(None) if False else KeyboardInterrupt(), context={"stage": "init", "url": url})
         console.print(f"[yellow]Aborted by user. Error report: {report}[/]")
         raise typer.Exit(code=130)
 
     # Stage 4: transcribe (progress bar)
-    # Choose engine (prefer whispercpp for Metal if requested)
-    if engine == "gemini":
-        from .engines.gemini_engine import GeminiEngine
-
-        eng = GeminiEngine()
-    elif engine == "openai":
-        from .engines.openai_engine import OpenAIEngine
-
-        eng = OpenAIEngine()
-    elif engine == "deepgram":
-        from .engines.deepgram_engine import DeepgramEngine
-
-        eng = DeepgramEngine()
-    elif engine == "elevenlabs":
-        from .engines.eleven_engine import ElevenLabsEngine
-
-        eng = ElevenLabsEngine()
-    elif engine == "whispercpp" or (engine == "whisper" and cfg.device == "metal"):
-        try:
-            from .engines.whispercpp_engine import WhisperCppEngine
-
-            eng = WhisperCppEngine()
-        except Exception as e:
-            console.print(
-                "[yellow]whisper.cpp not available; falling back to faster-whisper CPU[/]"
-            )
-            eng = WhisperEngine()
-    else:
-        eng = WhisperEngine()
+    eng = _make_engine(engine, cfg)
     from rich.progress import Progress, BarColumn, TimeRemainingColumn, TextColumn, TaskProgressColumn
 
     console.print(f"[bold]Transcribing[/]: {meta.title or meta.id} ({cfg.model})")
@@ -318,7 +454,7 @@ def transcribe(
             if by_chapter and (meta.chapters or []):
                 # Chapter-aware processing path
                 parts = slice_audio_by_chapters(
-                    wav_path,
+                    source_path,
                     meta.chapters or [],
                     out_dir=paths.dir / "chapters",
                     overlap_seconds=chapter_overlap,
@@ -358,12 +494,12 @@ def transcribe(
                 # Sort, offset, and stitch
                 results.sort(key=lambda t: t[0])
                 chapter_results = results
-                segments = stitch_chapter_segments(offset_chapter_segments(results))
+                segments = stitch_chapter_results(results, overlap_seconds=chapter_overlap)
                 # Mark overall complete
                 progress.update(task, completed=1.0)
             else:
                 # Single-pass transcription
-                segments = eng.transcribe(wav_path, config=cfg, on_progress=on_prog)
+                segments = eng.transcribe(source_path, config=cfg, on_progress=on_prog)
         except Exception as e:
             if engine == "gemini" and fallback:
                 console.print(f"[yellow]Gemini failed ({e}); falling back to Whisper[/]")
@@ -373,6 +509,9 @@ def transcribe(
                 used_engine_name = "whisper"
                 whisper_eng = WhisperEngine()
                 engine_for_lang = whisper_eng
+                if wav_path is None:
+                    # Normalization was skipped for the cloud engine; Whisper needs the WAV
+                    wav_path = source_path = normalize_wav(audio_path, outdir / f"{meta.id}.wav", blob_root=blobs)
                 # Retry with whisper (single or chapters)
                 if by_chapter and (meta.chapters or []):
                     parts = slice_audio_by_chapters(
@@ -401,14 +540,14 @@ def transcribe(
                             completed += 1
                     results.sort(key=lambda t: t[0])
                     chapter_results = results
-                    segments = stitch_chapter_segments(offset_chapter_segments(results))
+                    segments = stitch_chapter_results(results, overlap_seconds=chapter_overlap)
                 else:
                     segments = whisper_eng.transcribe(wav_path, config=used_cfg, on_progress=on_prog)
             else:
                 # Recovery strategy: write partial results if available and by-chapter was used
                 try:
                     if by_chapter and chapter_results:
-                        partial_segments = stitch_chapter_segments(offset_chapter_segments(chapter_results))
+                        partial_segments = stitch_chapter_results(chapter_results, overlap_seconds=chapter_overlap)
                         partial_doc = TranscriptDoc(
                             video_id=vid,
                             source_url=url,
@@ -428,7 +567,7 @@ def transcribe(
                     raise
 
     # Optional language detection if not provided
-    language = used_cfg.language or engine_for_lang.detect_language(wav_path, config=used_cfg)
+    language = used_cfg.language or engine_for_lang.detect_language(source_path, config=used_cfg)
 
     # Optional per-chapter summaries
     chapters_for_doc = meta.chapters
@@ -436,19 +575,25 @@ def transcribe(
         try:
             from .summarizer import GeminiSummarizer
 
-            summarizer = GeminiSummarizer()
-            chapters_for_doc = []
+            summarizer = GeminiSummarizer(window_tokens=used_cfg.summary_window_tokens)
             if by_chapter and chapter_results is not None:
-                for i, ch, segs in chapter_results:
-                    text = " ".join(s.text for s in segs if s.text).strip()
-                    summ = summarizer.summarize(text, language=language, max_chars=500) if text else ""
-                    chapters_for_doc.append(type(ch)(title=ch.title, start=ch.start, end=ch.end, summary=summ))
+                pairs = [(ch, " ".join(s.text for s in segs if s.text).strip()) for _, ch, segs in chapter_results]
             else:
                 # Derive text per chapter from global segments
-                for ch in meta.chapters or []:
-                    text = " ".join(s.text for s in segments if s.start >= ch.start and s.end <= ch.end).strip()
-                    summ = summarizer.summarize(text, language=language, max_chars=500) if text else ""
-                    chapters_for_doc.append(type(ch)(title=ch.title, start=ch.start, end=ch.end, summary=summ))
+                from .chapters import chapter_texts
+
+                pairs = list(zip(meta.chapters or [], chapter_texts(meta.chapters or [], segments)))
+            texts = [text for _, text in pairs]
+            if batch_chapter_summaries:
+                summaries = summarizer.summarize_batch(
+                    texts, titles=[ch.title for ch, _ in pairs], language=language, max_chars=500
+                )
+            else:
+                summaries = summarizer.summarize_many(texts, language=language, max_chars=500)
+            chapters_for_doc = [
+                type(ch)(title=ch.title, start=ch.start, end=ch.end, summary=summ)
+                for (ch, _), summ in zip(pairs, summaries)
+            ]
         except Exception as e:
             console.print(f"[yellow]Chapter summaries unavailable: {e}[/]")
 
@@ -458,10 +603,10 @@ def transcribe(
     if summarize:
         try:
             from .summarizer import GeminiSummarizer
-            summarizer = GeminiSummarizer()
+            summarizer = GeminiSummarizer(window_tokens=used_cfg.summary_window_tokens)
             full_text = "\n".join(s.text for s in segments if s.text).strip()
             if full_text:
-                res = summarizer.summarize_long(full_text, language=language, bullets=5, max_tldr=500)
+                res = summarizer.summarize_long(segments, language=language, bullets=5, max_tldr=500)
                 from .models import Summary as SummaryModel
 
                 overall_summary = SummaryModel(tldr=res.get("tldr", ""), bullets=list(res.get("bullets", [])))
@@ -493,12 +638,180 @@ def transcribe(
         write_summary(final_paths, overall_summary.model_dump())
     write_meta(final_paths, build_meta_payload(video_id=meta.id, config=used_cfg, source=meta, provider=used_engine_name))
     console.print("[green]Done[/]: " + ", ".join(p.name for p in written))
+    _print_connection_stats()
+    _auto_gc(keep=[outdir_final])
     # If user requested an explicit output_dir different from cache dir, also write there
     if output_dir and output_dir.resolve() != outdir_final.resolve():
         copied = export_all(doc, output_dir, parse_formats("json,srt"))
         console.print("[dim]Also wrote[/]: " + ", ".join(p.name for p in copied))
 
 
+@app.command()
+def batch(
+    sources: list[str] | None = typer.Argument(None, help="Video, playlist, or channel URLs"),
+    url_file: Path | None = typer.Option(
+        None,
+        "--file",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+        help="Text file with one URL per line (# comments allowed)",
+    ),
+    engine: str = typer.Option("whisper", "--engine", help="Transcription engine"),
+    model: str = typer.Option("small", "--model", help="Model name for the selected engine"),
+    engine_opts: str | None = typer.Option(None, "--engine-opts", help="JSON for provider-specific options"),
+    timestamps: str = typer.Option("native", "--timestamps", help="Timestamp policy: native|chunked|none"),
+    overwrite: bool = typer.Option(False, "--overwrite", "-f", help="Ignore cache and reprocess"),
+    download_workers: int = typer.Option(2, "--download-workers", min=1, help="Concurrent metadata/download workers"),
+    normalize_workers: int = typer.Option(2, "--normalize-workers", min=1, help="Concurrent ffmpeg normalization workers"),
+    transcribe_workers: int = typer.Option(1, "--transcribe-workers", min=1, help="Concurrent transcription workers"),
+    async_transcribe: bool = typer.Option(
+        False,
+        "--async-transcribe/--no-async-transcribe",
+        help="Transcribe on an asyncio loop; --transcribe-workers then sets videos in flight (for cloud engines)",
+    ),
+    max_download_abr_kbps: int | None = typer.Option(
+        96,
+        "--max-download-abr-kbps",
+        help="Cap YouTube audio bitrate (kbps) during download; set 0 to disable",
+    ),
+    stream_download: bool = typer.Option(
+        False,
+        "--stream-download/--no-stream-download",
+        help="Pipe downloads straight into ffmpeg (no intermediate audio file)",
+    ),
+    word_timestamps: bool = typer.Option(
+        False,
+        "--word-timestamps/--no-word-timestamps",
+        help="Keep per-word timings and cut chunk/chapter overlaps exactly",
+    ),
+    upload_codec: str = typer.Option(
+        "auto", "--upload-codec", help="Cloud upload encoding: auto|opus|mp3|flac|wav (auto = per-provider default)"
+    ),
+    speech_only: bool = typer.Option(
+        False,
+        "--speech-only/--no-speech-only",
+        help="Cloud engines: upload only the speech (long silences removed); timestamps are mapped back",
+    ),
+    whisper_workers: int = typer.Option(
+        1, "--whisper-workers", min=1, help="Worker processes for chunk-parallel local Whisper (1 = single pass)"
+    ),
+    whisper_threads: int | None = typer.Option(
+        None, "--whisper-threads", min=1, help="CPU threads per Whisper worker (default: cores / workers)"
+    ),
+) -> None:
+    """Transcribe many videos (URL list, playlist, or channel) as a staged pipeline."""
+    from .batch import BatchPipeline, read_url_file, CACHED, DONE, FAILED
+    from .downloader import expand_playlist
+
+    if engine not in _ALLOWED_ENGINES:
+        raise typer.BadParameter("Unsupported engine", param_hint=["engine"])
+    if timestamps not in {"native", "chunked", "none"}:
+        raise typer.BadParameter("--timestamps must be one of native|chunked|none", param_hint=["--timestamps"])
+    if upload_codec not in {"auto", "wav", "opus", "mp3", "flac"}:
+        raise typer.BadParameter("--upload-codec must be one of auto|opus|mp3|flac|wav", param_hint=["--upload-codec"])
+    raw: list[str] = list(sources or [])
+    if url_file is not None:
+        raw.extend(read_url_file(url_file))
+    if not raw:
+        raise typer.BadParameter("Provide URLs as arguments or via --file")
+    opts = _parse_engine_opts(engine_opts)
+    abr_cap = None if (max_download_abr_kbps is None or max_download_abr_kbps <= 0) else int(max_download_abr_kbps)
+    cfg = load_config(
+        engine=engine,
+        model=model,
+        engine_options=opts,
+        timestamp_policy=timestamps,
+        max_download_abr_kbps=abr_cap,
+        stream_download=stream_download,
+        word_timestamps=word_timestamps,
+        speech_only=speech_only,
+        upload_codec=upload_codec,
+        whisper_workers=whisper_workers,
+        whisper_threads=whisper_threads,
+    )
+
+    # Expand playlists/channels and drop duplicate videos (keeps first occurrence)
+    urls: list[str] = []
+    seen: set[str] = set()
+    for src in raw:
+        try:
+            expanded = expand_playlist(src, timeout=cfg.network_timeout) if not extract_video_id(src) else [src]
+        except Exception as e:
+            console.print(f"[red]Failed to expand[/] {src}: {e}")
+            continue
+        for u in expanded:
+            key = extract_video_id(u) or u
+            if key not in seen:
+                seen.add(key)
+                urls.append(u)
+    if not urls:
+        console.print("[yellow]No videos to process[/]")
+        raise typer.Exit(code=1)
+
+    def on_update(it) -> None:  # type: ignore[no-untyped-def]
+        label = it.video_id or it.url
+        if it.status == CACHED:
+            console.print(f"[dim]Cache hit[/]: {label}")
+        elif it.status == DONE:
+            took = sum(it.timings.values())
+            title = (it.meta.title if it.meta else None) or ""
+            console.print(f"[green]Done[/]: {label} {title} ({took:.1f}s)")
+        elif it.status == FAILED:
+            console.print(f"[red]Failed[/] ({it.stage or 'input'}): {label}: {it.error}")
+
+    console.print(
+        f"[bold]Batch[/]: {len(urls)} video(s) | workers download={download_workers} "
+        f"normalize={normalize_workers} transcribe={transcribe_workers}"
+    )
+    pipeline = BatchPipeline(
+        cfg,
+        engine_factory=lambda: _make_engine(engine, cfg),
+        download_workers=download_workers,
+        normalize_workers=normalize_workers,
+        transcribe_workers=transcribe_workers,
+        async_transcribe=async_transcribe,
+        overwrite=overwrite,
+        on_update=on_update,
+    )
+    report = pipeline.run(urls)
+    console.print(
+        f"[bold]Batch complete[/]: {report.done} transcribed, {report.cached} cached, {report.failed} failed "
+        f"in {report.elapsed:.1f}s — {report.videos_per_hour:.1f} videos/hour"
+    )
+    _print_connection_stats()
+    _auto_gc()
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind (keep on localhost)"),
+    port: int = typer.Option(8765, "--port", help="Port to listen on (0 picks a free port)"),
+    preload: list[str] | None = typer.Option(None, "--preload", help="Whisper model(s) to load at startup (repeatable)"),
+) -> None:
+    """Run a local daemon that keeps Whisper models warm across transcribe jobs."""
+    from .server import TranscriptionServer
+
+    def on_job(info: dict) -> None:
+        console.print(f"[green]Job done[/]: {info['video_id']} ({info['model']}) in {info['seconds']:.1f}s")
+
+    srv = TranscriptionServer(host=host, port=port, on_job=on_job)
+    for name in preload or []:
+        with console.status(f"[bold blue]Loading model {name}…", spinner="dots"):
+            srv.preload(load_config(engine="whisper", model=name))
+    info = srv.start()
+    console.print(f"[bold]ytx serve[/] listening on {info.url} (pid {info.pid}); Ctrl-C to stop")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        console.print("[yellow]Stopping ytx serve[/]")
+    finally:
+        srv.close()
+
+
 # Cache command group
 cache_app = typer.Typer(help="Manage local cache")
 
@@ -551,6 +864,69 @@ def cache_stats() -> None:
     )
 
 
+@cache_app.command("reindex")
+def cache_reindex() -> None:
+    """Rebuild the cache index database from the artifacts on disk."""
+    from .cache import rebuild_index
+
+    with console.status("[bold blue]Scanning cache…", spinner="dots"):
+        n = rebuild_index()
+    console.print(f"[green]Indexed[/]: {n} cache entrie(s)")
+
+
+@cache_app.command("gc")
+def cache_gc(
+    max_size: str | None = typer.Option(
+        None, "--max-size", help="Size limit such as 200G or 512M (default: YTX_CACHE_MAX_SIZE)"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would be deleted without deleting"),
+) -> None:
+    """Evict least-recently-used cache data until the cache fits under --max-size."""
+    if max_size is not None:
+        try:
+            limit = parse_size(max_size)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint=["--max-size"])
+    else:
+        limit = get_max_size_from_env()
+        if limit is None:
+            raise typer.BadParameter("Provide --max-size or set YTX_CACHE_MAX_SIZE", param_hint=["--max-size"])
+    rep = gc_cache(limit, dry_run=dry_run)
+    verb = "Would free" if dry_run else "Freed"
+    console.print(
+        f"[green]{verb}[/]: {rep.freed_bytes} bytes | trimmed {len(rep.trimmed)} intermediate(s), "
+        f"evicted {len(rep.removed)} artifact set(s) | size {rep.size_before} -> {rep.size_after} bytes "
+        f"(limit {rep.max_bytes})"
+    )
+
+
+@cache_app.command("uploads")
+def cache_uploads(
+    purge: bool = typer.Option(False, "--purge", help="Delete the recorded provider uploads (remote files too)"),
+    confirm: bool = typer.Option(False, "--yes", help="Confirm --purge"),
+) -> None:
+    """List (or purge) provider-side audio uploads reused across runs."""
+    if purge:
+        if not confirm:
+            console.print("[yellow]Refusing to purge uploads without --yes[/]")
+            raise typer.Exit(code=1)
+        from .engines.gemini_engine import purge_uploads
+
+        console.print(f"[green]Purged[/]: {purge_uploads()} upload(s)")
+        return
+    from .cache import cache_root
+    from .cache_index import CacheIndex
+    import time
+
+    idx = CacheIndex(cache_root())
+    recs = idx.uploads() if idx.exists() else []
+    now = time.time()
+    for r in recs:
+        left = "expired" if r.expires_at is not None and r.expires_at <= now else f"{((r.expires_at or now) - now) / 3600:.1f}h left"
+        console.print(f"{r.provider}  {r.name}  {r.size_bytes} bytes  {left}")
+    console.print(f"[dim]{len(recs)} upload(s)[/]")
+
+
 app.add_typer(cache_app, name="cache")
 
 
@@ -582,14 +958,14 @@ def summarize_file(
             raise typer.BadParameter(f"Invalid TranscriptDoc JSON: {e}")
     try:
         from .summarizer import GeminiSummarizer
-        summarizer = GeminiSummarizer()
+        summarizer = GeminiSummarizer(window_tokens=load_config().summary_window_tokens)
         txt = "\n".join(s.text for s in doc.segments if s.text).strip()
         if not txt:
             console.print("[yellow]No text content to summarize[/]")
             raise typer.Exit(code=1)
         lang = language or doc.language
         console.print("[bold]Summarizing transcript…[/]")
-        res = summarizer.summarize_long(txt, language=lang, bullets=5, max_tldr=500)
+        res = summarizer.summarize_long(doc.segments, language=lang, bullets=5, max_tldr=500)
         from .models import Summary as _Summary
 
         summ = _Summary(tldr=res.get("tldr", ""), bullets=list(res.get("bullets", [])))
@@ -698,7 +1074,7 @@ def export_notes(
     else:
         # Resolve latest cache entry for video_id and read transcript.json
         from .cache import scan_cache, TRANSCRIPT_JSON
-        entries = [e for e in scan_cache() if e.video_id == video_id]
+        entries = scan_cache(video_id=video_id)
         if not entries:
             raise typer.BadParameter(f"No cache found for video id: {video_id}")
         # pick latest by created_at, fallback to lexicographic dir
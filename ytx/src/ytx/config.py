@@ -30,6 +30,7 @@ Engine = Literal["whisper", "whispercpp", "gemini", "openai", "deepgram", "eleve
 Device = Literal["cpu", "auto", "cuda", "metal"]
 ComputeType = Literal["auto", "int8", "int8_float16", "float16", "float32"]
 TimestampPolicy = Literal["native", "chunked", "none"]
+UploadCodec = Literal["auto", "wav", "opus", "mp3", "flac"]
 
 
 class AppConfig(BaseSettings):
@@ -43,17 +44,49 @@ class AppConfig(BaseSettings):
     # Cross-provider options
     timestamp_policy: TimestampPolicy = Field(default="native", description="Timestamp handling policy")
     engine_options: dict[str, Any] = Field(default_factory=dict, description="Provider-specific options")
+    word_timestamps: bool = Field(
+        default=False,
+        description="Request per-word timings (whisper/openai/deepgram) for exact chunk-boundary stitching",
+    )
+    speech_only: bool = Field(
+        default=False,
+        description="Cloud engines: drop long silences before upload and map timestamps back",
+    )
+    upload_codec: UploadCodec = Field(
+        default="auto",
+        description="Audio encoding sent to cloud engines; auto picks a compressed format each provider accepts",
+    )
     # Timeouts (seconds)
     network_timeout: int = Field(default=90, description="Metadata/network timeout (s)")
     download_timeout: int = Field(default=1800, description="Download timeout (s)")
     transcribe_timeout: int = Field(default=600, description="Transcription API timeout (s)")
     summarize_timeout: int = Field(default=180, description="Summarization API timeout (s)")
+    summary_window_tokens: int | None = Field(
+        default=None,
+        description="Transcript tokens per long-summary window; defaults to a per-model budget",
+    )
+
+    # Pooled HTTP clients for provider APIs (see ytx.http_pool)
+    http2: bool = Field(default=True, description="Use HTTP/2 for provider APIs when the optional h2 package is installed")
+    http_max_connections: int = Field(default=10, description="Connections kept open per provider")
+    http_keepalive_seconds: float = Field(default=60.0, description="Idle time before a pooled connection is closed (s)")
+    http_connect_timeout: float = Field(default=10.0, description="Connect timeout for provider APIs (s)")
 
     # whisper.cpp (Metal) settings
     whispercpp_bin: str = Field(default="main", description="Path or name of whisper.cpp binary (main)")
     whispercpp_ngl: int = Field(default=35, description="Number of layers to offload to GPU (Metal)")
     whispercpp_threads: int | None = Field(default=None, description="Threads for whisper.cpp; defaults to CPU count")
 
+    # Chunk-parallel local Whisper (faster-whisper)
+    whisper_workers: int = Field(
+        default=1,
+        description="Worker processes for chunk-parallel faster-whisper; 1 transcribes the file in one pass",
+    )
+    whisper_threads: int | None = Field(
+        default=None,
+        description="CPU threads per Whisper worker; defaults to splitting the cores evenly across workers",
+    )
+
     # Downloader controls
     max_download_abr_kbps: int | None = Field(
         default=96,
@@ -63,8 +96,34 @@ class AppConfig(BaseSettings):
         default=False,
         description="Use yt-dlp FFmpegExtractAudio postprocessor to extract to a target format at download time",
     )
+    cache_dedup: bool = Field(
+        default=True,
+        description="Share downloaded audio and normalized WAVs across artifact sets via the blob store",
+    )
+    stream_download: bool = Field(
+        default=False,
+        description="Pipe yt-dlp output straight into ffmpeg to write the WAV without an intermediate audio file",
+    )
+
+    # Cloud request scheduling (does not affect outputs; excluded from config hash)
+    chunk_concurrency: int | None = Field(
+        default=None,
+        description="Max chunks transcribed concurrently by cloud engines; defaults per provider",
+    )
+    provider_rate_limit: float | None = Field(
+        default=None,
+        description="Max API requests per minute to the cloud provider; defaults per provider",
+    )
+    silence_cuts: bool = Field(
+        default=True,
+        description="Move chunk cuts into nearby pauses (no overlap needed there) instead of fixed windows",
+    )
+    chunk_prefetch: int = Field(
+        default=2,
+        description="Chunks sliced ahead of the ones being transcribed (bounds temp disk use)",
+    )
 
-    # Later we can add cache/output dirs, concurrency, and API keys.
+    # Later we can add cache/output dirs and API keys.
 
     # For now, only pick up variables starting with YTX_.
     model_config = SettingsConfigDict(env_prefix="YTX_", extra="ignore", env_file=(".env",), env_file_encoding="utf-8")
@@ -84,6 +143,15 @@ class AppConfig(BaseSettings):
             "timestamp_policy": self.timestamp_policy,
             "engine_options": self.engine_options or {},
         }
+        if self.word_timestamps:
+            # Only keyed when enabled so existing cache entries keep their hash
+            data["word_timestamps"] = True
+        if self.speech_only and self.engine not in ("whisper", "whispercpp"):
+            # Compacted uploads can shift segment boundaries; local engines ignore it
+            data["speech_only"] = True
+        if self.engine == "whisper" and self.whisper_workers > 1:
+            # Chunked decoding changes segment boundaries; thread counts do not
+            data["whisper_chunked"] = True
         # Engine-specific knobs that impact output determinism
         if self.engine == "whispercpp":
             data.update({
@@ -115,4 +183,5 @@ __all__ = [
     "Device",
     "ComputeType",
     "TimestampPolicy",
+    "UploadCodec",
 ]
@@ -7,7 +7,6 @@ Actual metadata fetching via yt-dlp is implemented in DOWNLOAD-002.
 """
 
 import logging
-import re
 from pathlib import Path
 from typing import Final, Any
 
@@ -15,7 +14,7 @@ from rich.logging import RichHandler
 
 from .models import VideoMetadata
 from .chapters import parse_yt_dlp_chapters
-from .audio import ensure_ffmpeg
+from .audio import ensure_ffmpeg, build_normalize_wav_command, FFmpegError
 from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 
@@ -33,71 +32,9 @@ if not logger.handlers:
     logger.propagate = False
 
 
-_YT_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
-_HOST_RE = re.compile(r"^(?:.+\.)?(youtube\.com|youtu\.be|youtube-nocookie\.com)$", re.I)
-
-
-def extract_video_id(url: str) -> str | None:
-    """Extract the 11-char YouTube video ID from common URL shapes.
-
-    Supports:
-    - https://www.youtube.com/watch?v=VIDEOID
-    - https://youtu.be/VIDEOID
-    - https://www.youtube.com/shorts/VIDEOID
-    - https://www.youtube.com/live/VIDEOID
-    - https://www.youtube.com/embed/VIDEOID
-    - music.youtube.com/watch?v=VIDEOID
-    Ignores extra params like `t=`, `si=`, `feature=`.
-    """
-    from urllib.parse import urlparse, parse_qs
-
-    s = url.strip()
-    if not s:
-        return None
-    # Handle bare IDs passed by user
-    if _YT_ID_RE.match(s):
-        return s
-
-    parsed = urlparse(s)
-    host = (parsed.netloc or "").lower()
-    host = host.split(":")[0]
-    if not _HOST_RE.match(host):
-        return None
-
-    path = parsed.path or ""
-    # youtu.be/<id>
-    if host.endswith("youtu.be"):
-        parts = [p for p in path.split("/") if p]
-        if parts:
-            candidate = parts[0]
-            return candidate if _YT_ID_RE.match(candidate) else None
-
-    # youtube.com/watch?v=<id>
-    qs = parse_qs(parsed.query)
-    v = qs.get("v", [None])[0]
-    if v and _YT_ID_RE.match(v):
-        return v
-
-    # youtube.com/shorts/<id>, /live/<id>, /embed/<id>
-    parts = [p for p in path.split("/") if p]
-    if parts:
-        if parts[0] in {"shorts", "live", "embed"} and len(parts) >= 2:
-            candidate = parts[1]
-            return candidate if _YT_ID_RE.match(candidate) else None
-
-    return None
-
-
-def is_youtube_url(url: str) -> bool:
-    """Return True if URL appears to reference a specific YouTube video."""
-    return extract_video_id(url) is not None
-
-
-def canonical_url(video_id: str) -> str:
-    """Return a canonical short URL for the given video id."""
-    if not _YT_ID_RE.match(video_id):
-        raise ValueError("Invalid YouTube video id")
-    return f"https://youtu.be/{video_id}"
+# URL parsing lives in the dependency-free `urls` module so the CLI can resolve
+# video ids (e.g. for cache hits) without importing the download stack.
+from .urls import _YT_ID_RE, canonical_url, extract_video_id, is_youtube_url
 
 
 from .errors import ExternalToolError
@@ -239,6 +176,96 @@ def fetch_metadata(
     return vm
 
 
+def _build_yt_dlp_flat_playlist_cmd(
+    url: str,
+    *,
+    cookies_from_browser: str | None = None,
+    cookies_file: str | None = None,
+) -> list[str]:
+    cmd: list[str] = [
+        "yt-dlp",
+        "--flat-playlist",
+        "--dump-json",
+        "--no-warnings",
+        "-q",
+    ]
+    if cookies_from_browser:
+        cmd.extend(["--cookies-from-browser", cookies_from_browser])
+    if cookies_file:
+        cmd.extend(["--cookies", cookies_file])
+    cmd.append(url)
+    return cmd
+
+
+def _parse_flat_playlist(stdout: str) -> list[str]:
+    """Return canonical video URLs from yt-dlp --flat-playlist --dump-json output.
+
+    Each line is one JSON object; entries without a valid video id (e.g. nested
+    channel tabs) are skipped. Order is preserved and duplicates are dropped.
+    """
+    import json
+
+    urls: list[str] = []
+    seen: set[str] = set()
+    for line in stdout.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(entry, dict):
+            continue
+        vid = str(entry.get("id") or "")
+        if not _YT_ID_RE.match(vid):
+            vid = extract_video_id(str(entry.get("url") or "")) or ""
+        if not vid or vid in seen:
+            continue
+        seen.add(vid)
+        urls.append(canonical_url(vid))
+    return urls
+
+
+def expand_playlist(
+    url: str,
+    *,
+    timeout: int = 90,
+    cookies_from_browser: str | None = None,
+    cookies_file: str | None = None,
+) -> list[str]:
+    """Expand a playlist or channel URL into canonical per-video URLs.
+
+    Uses yt-dlp --flat-playlist so no per-video metadata is fetched. A single
+    video URL expands to itself without invoking yt-dlp.
+    """
+    import shutil
+    import subprocess
+
+    vid = extract_video_id(url)
+    if vid:
+        return [canonical_url(vid)]
+    if not shutil.which("yt-dlp"):
+        raise YTDLPError("yt-dlp is not installed or not on PATH")
+    cmd = _build_yt_dlp_flat_playlist_cmd(
+        url,
+        cookies_from_browser=cookies_from_browser,
+        cookies_file=cookies_file,
+    )
+    logger.debug("Running yt-dlp: %s", " ".join(cmd))
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        from .errors import TimeoutError
+
+        raise TimeoutError(f"yt-dlp timed out after {timeout}s")
+    if proc.returncode != 0:
+        raise YTDLPError(_friendly_yt_dlp_error((proc.stderr or "").strip(), url))
+    urls = _parse_flat_playlist(proc.stdout or "")
+    logger.info("Expanded %s → %d video(s)", url, len(urls))
+    return urls
+
+
 def download_audio(
     meta: VideoMetadata,
     out_dir: Path,
@@ -251,10 +278,17 @@ def download_audio(
     cookies_file: str | None = None,
     use_api: bool = True,
     max_abr_kbps: int | None = None,
+    download_extract_audio: bool = False,
+    show_progress: bool = True,
+    blob_root: Path | None = None,
 ) -> Path:
     """Download best audio and extract to requested format.
 
     Returns the path to the extracted audio file (e.g. <out_dir>/<id>.m4a).
+    Pass `show_progress=False` when several downloads run concurrently, since
+    only one Rich live display can be active at a time. With `blob_root`, audio
+    already downloaded for another artifact set (same video and format
+    selection) is hardlinked instead of downloaded again.
     """
     import shutil
     import subprocess
@@ -271,6 +305,19 @@ def download_audio(
         logger.info("Audio exists and is non-empty, skipping: %s", expected)
         return expected
 
+    key: str | None = None
+    if blob_root is not None:
+        from .blobs import audio_blob_path, audio_key, find_audio_blob, link_or_copy
+
+        selector = _format_selector(max_abr_kbps)
+        if download_extract_audio:
+            selector += f"|extract:{audio_format}:{audio_quality}"
+        key = audio_key(meta.id, selector)
+        blob = find_audio_blob(blob_root, key) if not overwrite else None
+        if blob is not None:
+            logger.info("Reusing downloaded audio for %s from blob store", meta.id)
+            return link_or_copy(blob, out_dir / f"{meta.id}{blob.suffix}")
+
     # Retry wrapper: attempt up to 3 times on YTDLPError with exponential backoff (jitter)
     for attempt in Retrying(
         stop=stop_after_attempt(3),
@@ -291,15 +338,144 @@ def download_audio(
                 cookies_file=cookies_file,
                 use_api=use_api,
                 max_abr_kbps=max_abr_kbps,
+                download_extract_audio=download_extract_audio,
+                show_progress=show_progress,
             )
             if not _is_nonempty_file(path):
                 raise YTDLPError(f"download produced empty file: {path}")
+            if blob_root is not None and key is not None:
+                _store_blob_safe(path, audio_blob_path(blob_root, key, path.suffix))
             return path
 
     # Should not reach here because reraise=True will raise on final failure
     raise YTDLPError("download failed after retries")
 
 
+def _build_yt_dlp_stream_cmd(
+    url: str,
+    *,
+    max_abr_kbps: int | None = None,
+    cookies_from_browser: str | None = None,
+    cookies_file: str | None = None,
+) -> list[str]:
+    cmd: list[str] = [
+        "yt-dlp",
+        "--no-playlist",
+        "-q",
+        "--no-progress",
+        "--no-warnings",
+        "-f",
+        _format_selector(max_abr_kbps),
+        "-o",
+        "-",
+    ]
+    if cookies_from_browser:
+        cmd.extend(["--cookies-from-browser", cookies_from_browser])
+    if cookies_file:
+        cmd.extend(["--cookies", cookies_file])
+    cmd.append(url)
+    return cmd
+
+
+def stream_audio_to_wav(
+    meta: VideoMetadata,
+    dst: Path,
+    *,
+    timeout: int = 60 * 30,
+    overwrite: bool = False,
+    max_abr_kbps: int | None = None,
+    cookies_from_browser: str | None = None,
+    cookies_file: str | None = None,
+    blob_root: Path | None = None,
+) -> Path:
+    """Download audio and normalize it in one streaming pass.
+
+    yt-dlp writes the audio stream to stdout, which is piped straight into
+    ffmpeg's stdin; ffmpeg writes the 16 kHz mono WAV while bytes arrive, so no
+    intermediate `<id>.m4a` is stored and normalization ends with the download.
+    The WAV is written to a temporary name and renamed on success.
+    """
+    import shutil
+    import subprocess
+    import tempfile
+    import time
+
+    if not shutil.which("yt-dlp"):
+        raise YTDLPError("yt-dlp is not installed or not on PATH")
+    ensure_ffmpeg()
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if _is_nonempty_file(dst) and not overwrite:
+        logger.info("WAV exists and is non-empty, skipping: %s", dst)
+        return dst
+
+    blob: Path | None = None
+    if blob_root is not None:
+        from .blobs import audio_key, link_or_copy, wav_blob_path
+
+        blob = wav_blob_path(blob_root, "stream:" + audio_key(meta.id, _format_selector(max_abr_kbps)))
+        if not overwrite and _is_nonempty_file(blob):
+            logger.info("Reusing normalized audio for %s from blob store", meta.id)
+            return link_or_copy(blob, dst)
+
+    tmp = dst.with_name(dst.stem + ".part.wav")
+    ytcmd = _build_yt_dlp_stream_cmd(
+        meta.url,
+        max_abr_kbps=max_abr_kbps,
+        cookies_from_browser=cookies_from_browser,
+        cookies_file=cookies_file,
+    )
+    ffcmd = build_normalize_wav_command("pipe:0", tmp)
+    logger.info("Streaming audio for %s → %s", meta.id, dst.name)
+    # Stderr goes to temp files: a full stderr pipe would stall either process
+    with tempfile.TemporaryFile() as yt_err, tempfile.TemporaryFile() as ff_err:
+        yt = subprocess.Popen(ytcmd, stdout=subprocess.PIPE, stderr=yt_err)
+        try:
+            ff = subprocess.Popen(ffcmd, stdin=yt.stdout, stdout=subprocess.DEVNULL, stderr=ff_err)
+        except Exception:
+            yt.kill()
+            yt.wait()
+            raise
+        assert yt.stdout is not None
+        yt.stdout.close()  # ffmpeg owns the read end; yt-dlp gets SIGPIPE if ffmpeg dies
+        deadline = time.monotonic() + timeout
+        try:
+            ff_rc = ff.wait(timeout=max(0.0, deadline - time.monotonic()))
+            yt_rc = yt.wait(timeout=max(1.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            for proc in (yt, ff):
+                proc.kill()
+                proc.wait()
+            tmp.unlink(missing_ok=True)
+            from .errors import TimeoutError
+
+            raise TimeoutError(f"streaming download timed out after {timeout}s")
+        yt_err.seek(0)
+        ff_err.seek(0)
+        yt_stderr = yt_err.read().decode("utf-8", "replace")
+        ff_stderr = ff_err.read().decode("utf-8", "replace")
+    if yt_rc != 0:
+        tmp.unlink(missing_ok=True)
+        raise YTDLPError(_friendly_yt_dlp_error(yt_stderr.strip(), meta.url))
+    if ff_rc != 0 or not _is_nonempty_file(tmp):
+        tmp.unlink(missing_ok=True)
+        raise FFmpegError(f"ffmpeg failed on streamed audio: {ff_stderr.strip()}")
+    tmp.replace(dst)
+    if blob is not None:
+        _store_blob_safe(dst, blob)
+    return dst
+
+
+def _store_blob_safe(path: Path, blob: Path) -> None:
+    # Dedup is an optimization; never fail a download because of it
+    from .blobs import store_blob
+
+    try:
+        store_blob(path, blob)
+    except OSError as e:
+        logger.debug("Could not add %s to blob store: %s", path, e)
+
+
 def _is_nonempty_file(path: Path) -> bool:
     try:
         return path.is_file() and path.stat().st_size > 0
@@ -320,7 +496,11 @@ def _download_audio_once(
     cookies_file: str | None,
     use_api: bool,
     max_abr_kbps: int | None,
+    download_extract_audio: bool = False,
+    show_progress: bool = True,
 ) -> Path:
+    import subprocess
+
     if use_api:
         try:
             return _download_audio_api(
@@ -332,6 +512,8 @@ def _download_audio_once(
                 cookies_from_browser=cookies_from_browser,
                 cookies_file=cookies_file,
                 max_abr_kbps=max_abr_kbps,
+                download_extract_audio=download_extract_audio,
+                show_progress=show_progress,
             )
         except Exception as e:  # fallback to subprocess for resilience
             logger.warning("yt-dlp API failed (%s); falling back to subprocess", e)
@@ -431,6 +613,7 @@ def _download_audio_api(
     cookies_file: str | None,
     max_abr_kbps: int | None,
     download_extract_audio: bool,
+    show_progress: bool = True,
 ) -> Path:
     """Download audio using yt-dlp's Python API with a Rich progress bar."""
     from rich.progress import Progress, BarColumn, TimeRemainingColumn, DownloadColumn, TransferSpeedColumn, TextColumn
@@ -453,6 +636,8 @@ def _download_audio_api(
 
     def hook(d: dict[str, Any]) -> None:
         nonlocal task_id, total
+        if not show_progress:
+            return
         status = d.get("status")
         if status == "downloading":
             downloaded = int(d.get("downloaded_bytes") or 0)
@@ -494,13 +679,15 @@ def _download_audio_api(
         ydl_opts["cookiefile"] = cookies_file
 
     logger.info("Downloading audio for %s → %s", meta.id, expected.name)
-    with Progress(
+    progress = Progress(
         TextColumn("{task.description}"),
         BarColumn(),
         DownloadColumn(),
         TransferSpeedColumn(),
         TimeRemainingColumn(),
-    ) as progress:
+        disable=not show_progress,
+    )
+    with progress:
         with YoutubeDL(ydl_opts) as ydl:
             ydl.download([meta.url])
 
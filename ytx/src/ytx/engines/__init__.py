@@ -22,11 +22,40 @@ def register_engine(cls: Type[Any]) -> Type[Any]:
     return cls
 
 
+_BUILTIN_MODULES = (
+    "whisper_engine",
+    "whispercpp_engine",
+    "gemini_engine",
+    "openai_engine",
+    "deepgram_engine",
+    "eleven_engine",
+)
+
+
+def _ensure_registry_loaded() -> None:
+    """Import built-in engine modules to populate the registry.
+
+    Engines defer their heavy SDK imports until first use, so importing the
+    modules here is cheap. Failures are ignored so one broken engine does not
+    hide the others.
+    """
+    from importlib import import_module
+
+    for mod in _BUILTIN_MODULES:
+        try:
+            import_module(f"{__name__}.{mod}")
+        except Exception:
+            pass
+
+
 def available_engines() -> list[str]:
+    _ensure_registry_loaded()
     return sorted(_ENGINES)
 
 
 def get_engine_class(name: str) -> Type[Any]:
+    if name not in _ENGINES:
+        _ensure_registry_loaded()
     try:
         return _ENGINES[name]
     except KeyError as e:
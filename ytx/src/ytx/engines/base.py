@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
+from functools import partial
 from pathlib import Path
-from typing import Protocol, runtime_checkable, Callable
+from typing import Any, Protocol, runtime_checkable, Callable
+import asyncio
 
 from ..config import AppConfig
 from ..models import TranscriptSegment
@@ -19,11 +22,15 @@ class TranscriptionEngine(Protocol):
     """Protocol for transcription engines.
 
     Engines consume a normalized audio file (e.g., 16 kHz mono WAV) and return
-    a list of transcript segments for the entire file.
+    a list of transcript segments for the entire file. Engines that can take
+    downloaded audio as is list the file suffixes in `input_formats` (see
+    `accepts_input`); the pipeline then skips `normalize_wav` for them.
     """
 
     # Unique engine name (e.g., "whisper", "gemini")
     name: str
+    # Lower-case suffixes accepted without normalization (optional; WAV only if absent)
+    input_formats: tuple[str, ...]
 
     def transcribe(
         self,
@@ -49,4 +56,67 @@ class TranscriptionEngine(Protocol):
         ...
 
 
-__all__ = ["EngineError", "TranscriptionEngine"]
+@runtime_checkable
+class AsyncTranscriptionEngine(Protocol):
+    """Engines that can also transcribe as a coroutine.
+
+    Cloud engines (`CloudEngineBase`) implement this; HTTP engines keep their
+    requests on the event loop instead of blocking a thread per request. Use
+    `transcribe_async` to drive any engine from asyncio.
+    """
+
+    name: str
+
+    async def transcribe_async(
+        self,
+        audio_path: Path,
+        *,
+        config: AppConfig,
+        on_progress: Callable[[float], None] | None = None,
+    ) -> list[TranscriptSegment]:
+        ...
+
+
+async def transcribe_async(
+    engine: Any,
+    audio_path: Path,
+    *,
+    config: AppConfig,
+    on_progress: Callable[[float], None] | None = None,
+    executor: Executor | None = None,
+) -> list[TranscriptSegment]:
+    """Await `engine`'s transcription: natively if it implements `transcribe_async`,
+    otherwise by running its blocking `transcribe` in `executor` (default: the
+    loop's default executor).
+    """
+    if isinstance(engine, AsyncTranscriptionEngine):
+        return await engine.transcribe_async(audio_path, config=config, on_progress=on_progress)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(engine.transcribe, audio_path, config=config, on_progress=on_progress))
+
+
+DEFAULT_INPUT_FORMATS: tuple[str, ...] = (".wav",)
+
+
+def accepts_input(engine: Any, path: Path, *, config: AppConfig) -> bool:
+    """True if `engine` (an instance or class) can transcribe `path` without normalization.
+
+    Speech-only compaction and an explicit upload codec both work from the
+    normalized WAV, so they always require it.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".wav":
+        return True
+    if getattr(config, "speech_only", False) or getattr(config, "upload_codec", "auto") != "auto":
+        return False
+    return suffix in getattr(engine, "input_formats", DEFAULT_INPUT_FORMATS)
+
+
+__all__ = [
+    "AsyncTranscriptionEngine",
+    "DEFAULT_INPUT_FORMATS",
+    "EngineError",
+    "TranscriptionEngine",
+    "accepts_input",
+    "transcribe_async",
+]
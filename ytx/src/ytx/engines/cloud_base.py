@@ -4,12 +4,128 @@ from __future__ import annotations
 
 Provides retryable request wrapper and basic rate-limit detection. Engines can
 override `_is_rate_limit_error` to provide provider-specific checks.
+
+Long audio is transcribed as fixed windows; `_map_chunks` dispatches them
+concurrently (bounded per provider) and every outgoing request first takes a
+token from a per-provider bucket shared by all engine instances in the process.
+HTTP requests go through the process-wide client pool in `ytx.http_pool`.
+
+With `config.speech_only`, `transcribe` first drops long silences from the WAV
+(`ytx.silence.compact_speech`), sends the compacted audio to the provider via
+the engine's `_transcribe_audio` and maps segment times back.
+
+Engines supply `_transcribe_single` (one request for one file); the base
+decides between a single request and overlapping `CHUNK_WINDOW_SECONDS` windows
+(`_plan_ranges`), stitches chunk results and applies `timestamp_policy="none"`
+(`_collapse_none`).
+
+`transcribe_async` is the coroutine form. Engines that also implement
+`_transcribe_single_async` (OpenAI, Deepgram) send their requests through a
+pooled `httpx.AsyncClient` with async retries and rate limiting, so many
+requests can be in flight without a thread each; other engines (and speech-only
+runs) run the blocking path on a worker thread.
 """
 
-from tenacity import Retrying, stop_after_attempt, wait_random_exponential, retry_if_exception
-from ..errors import APIError
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
+import tempfile
+import threading
+import time
+
+from tenacity import AsyncRetrying, Retrying, stop_after_attempt, wait_random_exponential, retry_if_exception
+from ..chunking import ChunkPrefetcher, plan_chunks, slice_encoded_segment, slice_wav_segment
+from ..config import AppConfig
+from ..errors import APIError, FileSystemError
+from ..http_pool import get_async_client, get_client, request_timeout
+from ..logging import get_logger
+from ..models import TranscriptSegment
+from ..stitch import shift_words, stitch_chunks
 import httpx
 
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Conservative defaults that stay under free/entry tier limits.
+DEFAULT_CHUNK_CONCURRENCY: dict[str, int] = {"gemini": 4, "openai": 4, "deepgram": 8, "elevenlabs": 2}
+DEFAULT_REQUESTS_PER_MINUTE: dict[str, float] = {"gemini": 60.0, "openai": 50.0, "deepgram": 100.0, "elevenlabs": 20.0}
+# Upload encodings each API documents as accepted (see `ytx.audio.UPLOAD_CODECS`)
+DEFAULT_UPLOAD_CODEC: dict[str, str] = {"gemini": "mp3", "openai": "opus", "deepgram": "opus", "elevenlabs": "mp3"}
+# Audio longer than one window (or any audio with timestamp_policy="chunked")
+# is sent as windows overlapping by a couple of seconds, stitched afterwards
+CHUNK_WINDOW_SECONDS = 600.0
+CHUNK_OVERLAP_SECONDS = 2.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self._lock = threading.Lock()
+        self.rate, self.capacity = self._normalize(rate, capacity)
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+
+    @staticmethod
+    def _normalize(rate: float, capacity: float | None) -> tuple[float, float]:
+        r = max(1e-6, float(rate))
+        return r, max(1.0, float(capacity if capacity is not None else max(1.0, r)))
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def configure(self, rate: float, capacity: float | None = None) -> None:
+        """Change the rate; tokens accrued so far are credited at the old rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate, self.capacity = self._normalize(rate, capacity)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def _take(self, tokens: float) -> float:
+        """Take `tokens` if available (returns 0) or return the seconds until they are."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; return seconds spent waiting."""
+        waited = 0.0
+        while (delay := self._take(tokens)) > 0:
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """`acquire` for coroutines: waits with `asyncio.sleep` instead of blocking."""
+        waited = 0.0
+        while (delay := self._take(tokens)) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        return waited
+
+
+_BUCKETS: dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def rate_limiter_for(provider: str, requests_per_minute: float | None = None) -> TokenBucket:
+    """Return the process-wide bucket for `provider`, (re)configuring its rate if given."""
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(provider)
+        rpm = requests_per_minute or DEFAULT_REQUESTS_PER_MINUTE.get(provider, 60.0)
+        if bucket is None:
+            bucket = _BUCKETS[provider] = TokenBucket(rpm / 60.0, capacity=max(1.0, rpm / 60.0 * 5))
+        elif requests_per_minute:
+            bucket.configure(rpm / 60.0, capacity=max(1.0, rpm / 60.0 * 5))
+        return bucket
+
 
 class CloudEngineBase:
     @property
@@ -19,6 +135,342 @@ class CloudEngineBase:
         s = str(e).lower()
         return any(x in s for x in ("rate limit", "quota", "too many requests", "429"))
 
+    def _transcribe_single(
+        self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None
+    ) -> list[TranscriptSegment]:  # pragma: no cover - implemented by engines
+        raise NotImplementedError
+
+    def _prefer_sdk(self) -> bool:
+        return os.environ.get("YTX_PREFER_SDK", "").lower() in ("1", "true", "yes")
+
+    def _probe_duration_safe(self, path: Path) -> float:
+        try:
+            from ..audio import probe_duration
+
+            return float(probe_duration(path))
+        except Exception:
+            return 0.0
+
+    @staticmethod
+    def _wants_chunks(config: AppConfig, duration: float) -> bool:
+        return config.timestamp_policy == "chunked" or duration > CHUNK_WINDOW_SECONDS
+
+    def _plan_ranges(
+        self,
+        audio_path: Path,
+        config: AppConfig,
+        duration: float,
+        *,
+        window_seconds: float = CHUNK_WINDOW_SECONDS,
+        overlap_seconds: float = CHUNK_OVERLAP_SECONDS,
+    ) -> list[tuple[float, float]]:
+        """Chunk ranges for `audio_path`, cut at silences when `config.silence_cuts` is set."""
+        return plan_chunks(
+            duration,
+            window_seconds=window_seconds,
+            overlap_seconds=overlap_seconds,
+            audio_path=audio_path if config.silence_cuts else None,
+        )
+
+    @staticmethod
+    def _collapse_none(segs: Sequence[TranscriptSegment], duration: float) -> list[TranscriptSegment]:
+        """One untimed block of text, for `timestamp_policy="none"`."""
+        text = " ".join(s.text for s in segs if s.text).strip()
+        end = max((s.end for s in segs), default=duration)
+        return [TranscriptSegment(id=0, start=0.0, end=max(0.001, float(end)), text=text)]
+
+    def _transcribe_audio(
+        self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None
+    ) -> list[TranscriptSegment]:
+        duration = self._probe_duration_safe(audio_path)
+        if self._wants_chunks(config, duration):
+            return self._transcribe_chunked(audio_path, config=config, on_progress=on_progress)
+        segs = self._transcribe_single(audio_path, config=config, on_progress=on_progress)
+        return self._collapse_none(segs, duration) if config.timestamp_policy == "none" else segs
+
+    def _transcribe_chunked(
+        self,
+        audio_path: Path,
+        *,
+        config: AppConfig,
+        on_progress: Callable[[float], None] | None = None,
+        window_seconds: float = CHUNK_WINDOW_SECONDS,
+        overlap_seconds: float = CHUNK_OVERLAP_SECONDS,
+    ) -> list[TranscriptSegment]:
+        total = self._probe_duration_safe(audio_path)
+        ranges = self._plan_ranges(
+            audio_path, config, total, window_seconds=window_seconds, overlap_seconds=overlap_seconds
+        )
+        if not ranges:
+            return self._transcribe_single(audio_path, config=config, on_progress=on_progress)
+        with tempfile.TemporaryDirectory(prefix=f"ytx-{self._provider_name}-chunks-") as td:
+            # Chunks are pre-sliced in the background and run concurrently;
+            # results come back in chunk order for offsetting. The slicer is
+            # passed explicitly so this module's name is resolved at call time.
+            results = self._map_sliced_chunks(
+                audio_path, ranges, Path(td),
+                lambda chunk, start, end: self._transcribe_single(chunk, config=config, on_progress=None),
+                config=config, on_progress=on_progress, slicer=slice_wav_segment,
+            )
+        # Word timings (when requested) let overlaps be cut exactly at their midpoint
+        return stitch_chunks(self._offset_chunks(ranges, results))
+
+    async def _transcribe_audio_async(
+        self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None
+    ) -> list[TranscriptSegment]:
+        """`_transcribe_audio` over `_transcribe_single_async`."""
+        if self._prefer_sdk():
+            # The SDKs are blocking; keep them on a worker thread
+            return await asyncio.to_thread(self._transcribe_audio, audio_path, config=config, on_progress=on_progress)
+        single = self._transcribe_single_async  # type: ignore[attr-defined]
+        duration = await asyncio.to_thread(self._probe_duration_safe, audio_path)
+        if self._wants_chunks(config, duration):
+            ranges = await asyncio.to_thread(self._plan_ranges, audio_path, config, duration)
+            if ranges:
+                with tempfile.TemporaryDirectory(prefix=f"ytx-{self._provider_name}-chunks-") as td:
+                    results = await self._map_sliced_chunks_async(
+                        audio_path, ranges, Path(td),
+                        lambda chunk, start, end: single(chunk, config=config),
+                        config=config, on_progress=on_progress, slicer=slice_wav_segment,
+                    )
+                return stitch_chunks(self._offset_chunks(ranges, results))
+            return await single(audio_path, config=config)
+        segs = await single(audio_path, config=config)
+        return self._collapse_none(segs, duration) if config.timestamp_policy == "none" else segs
+
+    def transcribe(
+        self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None
+    ) -> list[TranscriptSegment]:
+        """Transcribe `audio_path`, uploading only its speech when `config.speech_only` is set."""
+        if not getattr(config, "speech_only", False):
+            return self._transcribe_audio(audio_path, config=config, on_progress=on_progress)
+        from ..silence import compact_speech
+
+        with tempfile.TemporaryDirectory(prefix="ytx-speech-") as td:
+            speech = compact_speech(Path(audio_path), Path(td) / "speech.wav")
+            if speech is None:
+                return self._transcribe_audio(audio_path, config=config, on_progress=on_progress)
+            logger.info(
+                "%s: sending %.0fs of speech out of %.0fs (%d regions)",
+                self._provider_name, speech.speech_seconds, speech.original_seconds, len(speech.regions),
+            )
+            segs = self._transcribe_audio(speech.path, config=config, on_progress=on_progress)
+        return speech.remap_segments(segs)
+
+    async def transcribe_async(
+        self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None
+    ) -> list[TranscriptSegment]:
+        """Coroutine form of `transcribe` (see the module docstring)."""
+        if not hasattr(self, "_transcribe_single_async") or getattr(config, "speech_only", False):
+            return await asyncio.to_thread(self.transcribe, audio_path, config=config, on_progress=on_progress)
+        return await self._transcribe_audio_async(audio_path, config=config, on_progress=on_progress)
+
+    def _chunk_concurrency(self, config: AppConfig) -> int:
+        n = getattr(config, "chunk_concurrency", None) or DEFAULT_CHUNK_CONCURRENCY.get(self._provider_name, 2)
+        return max(1, int(n))
+
+    def _upload_codec(self, config: AppConfig) -> str:
+        codec = getattr(config, "upload_codec", "auto") or "auto"
+        return DEFAULT_UPLOAD_CODEC.get(self._provider_name, "wav") if codec == "auto" else codec
+
+    def _upload_file(self, audio_path: Path, config: AppConfig) -> Path:
+        """The file to send for `audio_path`: its compressed encoding, or the WAV itself.
+
+        Only WAVs are encoded (chunks sliced from an encoding already are one).
+        If encoding fails the WAV is uploaded as before.
+        """
+        p = Path(audio_path)
+        codec = self._upload_codec(config)
+        if codec == "wav" or p.suffix.lower() != ".wav":
+            return p
+        from ..audio import encode_for_upload
+
+        try:
+            return encode_for_upload(p, codec)
+        except FileSystemError as e:
+            logger.warning("%s: %s upload encoding failed, sending WAV: %s", self._provider_name, codec, e)
+            return p
+
+    def _throttle(self) -> None:
+        rate_limiter_for(self._provider_name).acquire()
+
+    async def _throttle_async(self) -> None:
+        await rate_limiter_for(self._provider_name).acquire_async()
+
+    def _map_chunks(
+        self,
+        ranges: Sequence[tuple[float, float]],
+        work: Callable[[int, float, float], T],
+        *,
+        config: AppConfig,
+        on_progress: Callable[[float], None] | None = None,
+    ) -> list[T]:
+        """Run `work(idx, start, end)` for every chunk and return results in chunk order.
+
+        Up to `_chunk_concurrency(config)` chunks are in flight at once; the first
+        failure cancels chunks that have not started yet and is re-raised.
+        """
+        rate_limiter_for(self._provider_name, getattr(config, "provider_rate_limit", None))
+        return self._map_items(
+            ranges,
+            lambda idx, r: work(idx, r[0], r[1]),
+            workers=self._chunk_concurrency(config),
+            on_progress=on_progress,
+        )
+
+    def _map_items(
+        self,
+        items: Sequence[Any],
+        work: Callable[[int, Any], T],
+        *,
+        workers: int,
+        on_progress: Callable[[float], None] | None = None,
+    ) -> list[T]:
+        """Run `work(idx, item)` on up to `workers` threads; results keep item order."""
+        n = len(items)
+        results: list[Any] = [None] * n
+        done_count = [0]
+        lock = threading.Lock()
+
+        def run(idx: int, item: Any) -> None:
+            results[idx] = work(idx, item)
+            if on_progress:
+                with lock:
+                    done_count[0] += 1
+                    frac = min(1.0, done_count[0] / max(1, n))
+                try:
+                    on_progress(frac)
+                except Exception:
+                    pass
+
+        workers = min(n, max(1, int(workers)))
+        if workers <= 1:
+            for idx, item in enumerate(items):
+                run(idx, item)
+            return results
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"ytx-{self._provider_name}-chunk") as pool:
+            futures = [pool.submit(run, idx, item) for idx, item in enumerate(items)]
+            finished, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for f in pending:
+                f.cancel()
+            for f in futures:
+                if f in finished and f.exception() is not None:
+                    raise f.exception()  # type: ignore[misc]
+        return results
+
+    def _map_sliced_chunks(
+        self,
+        audio_path: Path,
+        ranges: Sequence[tuple[float, float]],
+        out_dir: Path,
+        work: Callable[[Path, float, float], T],
+        *,
+        config: AppConfig,
+        on_progress: Callable[[float], None] | None = None,
+        slicer: Callable[..., Path] = slice_wav_segment,
+    ) -> list[T]:
+        """Like `_map_chunks`, but hands `work` a pre-sliced chunk file.
+
+        Slicing runs `chunk_prefetch` chunks ahead of the in-flight ones on a
+        background thread; each chunk file is deleted once its work is done.
+        With a compressed upload codec, chunks are cut from the encoded file.
+        """
+        ahead = self._chunk_concurrency(config) + max(0, int(getattr(config, "chunk_prefetch", 2) or 0))
+        src, suffix = Path(audio_path), ".wav"
+        upload = self._upload_file(src, config) if ranges else src
+        if upload.suffix.lower() != ".wav":
+            # A compressed upload (encoded once, or the download itself when the
+            # engine accepts it) is cut into chunks by stream copy
+            src, suffix, slicer = upload, upload.suffix, slice_encoded_segment
+        with ChunkPrefetcher(src, ranges, out_dir, max_ahead=ahead, slicer=slicer, suffix=suffix) as pf:
+
+            def run(idx: int, start: float, end: float) -> T:
+                try:
+                    return work(pf.get(idx), start, end)
+                except BaseException:
+                    # Wake workers waiting on chunks that will no longer be sliced
+                    pf.cancel()
+                    raise
+                finally:
+                    pf.release(idx)
+
+            return self._map_chunks(ranges, run, config=config, on_progress=on_progress)
+
+    async def _map_sliced_chunks_async(
+        self,
+        audio_path: Path,
+        ranges: Sequence[tuple[float, float]],
+        out_dir: Path,
+        work: Callable[[Path, float, float], Awaitable[T]],
+        *,
+        config: AppConfig,
+        on_progress: Callable[[float], None] | None = None,
+        slicer: Callable[..., Path] = slice_wav_segment,
+    ) -> list[T]:
+        """Async `_map_sliced_chunks`: up to `_chunk_concurrency(config)` chunks are
+        sliced (on a worker thread) and sent at once; results keep chunk order.
+        The first failure cancels the remaining chunks and is re-raised.
+        """
+        rate_limiter_for(self._provider_name, getattr(config, "provider_rate_limit", None))
+        src, suffix = Path(audio_path), ".wav"
+        upload = await asyncio.to_thread(self._upload_file, src, config) if ranges else src
+        if upload.suffix.lower() != ".wav":
+            src, suffix, slicer = upload, upload.suffix, slice_encoded_segment
+        sem = asyncio.Semaphore(self._chunk_concurrency(config))
+        done = [0]
+
+        async def run(idx: int, start: float, end: float) -> T:
+            async with sem:
+                chunk = Path(out_dir) / f"chunk_{idx:04d}{suffix}"
+                await asyncio.to_thread(slicer, src, chunk, start=start, end=end)
+                try:
+                    result = await work(chunk, start, end)
+                finally:
+                    chunk.unlink(missing_ok=True)
+            done[0] += 1
+            if on_progress:
+                try:
+                    on_progress(min(1.0, done[0] / max(1, len(ranges))))
+                except Exception:
+                    pass
+            return result
+
+        tasks = [asyncio.ensure_future(run(idx, start, end)) for idx, (start, end) in enumerate(ranges)]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    @staticmethod
+    def _offset_chunks(
+        ranges: Sequence[tuple[float, float]], results: Sequence[Sequence[TranscriptSegment]]
+    ) -> list[tuple[float, float, list[TranscriptSegment]]]:
+        """Shift per-chunk segments to the file timeline, ready for `stitch_chunks`."""
+        chunks: list[tuple[float, float, list[TranscriptSegment]]] = []
+        for (start, end), segs in zip(ranges, results):
+            segs_out: list[TranscriptSegment] = []
+            # Avoid in-place mutation of validated models; construct new instances
+            for s in segs:
+                new_start = float(start) + float(getattr(s, "start", 0.0) or 0.0)
+                new_end = float(start) + float(getattr(s, "end", 0.0) or 0.0)
+                if new_end <= new_start:
+                    new_end = new_start + 0.001
+                segs_out.append(
+                    TranscriptSegment(
+                        id=len(segs_out),
+                        start=new_start,
+                        end=new_end,
+                        text=str(getattr(s, "text", "")).strip(),
+                        confidence=getattr(s, "confidence", None),
+                        words=shift_words(getattr(s, "words", None), float(start)),
+                    )
+                )
+            chunks.append((float(start), float(end), segs_out))
+        return chunks
+
     def _generate_with_retries(self, model, parts, *, timeout: int = 600, attempts: int = 3):  # type: ignore[no-untyped-def]
         def _retry_predicate(exc: Exception) -> bool:
             return self._is_rate_limit_error(exc)
@@ -30,6 +482,7 @@ class CloudEngineBase:
             reraise=True,
         ):
             with attempt:
+                self._throttle()
                 try:
                     return model.generate_content(parts, request_options={"timeout": timeout})  # type: ignore[attr-defined]
                 except Exception as e:
@@ -39,7 +492,11 @@ class CloudEngineBase:
 
     def _http_post_with_retries(self, url: str, *, headers: dict | None = None, data: dict | None = None,
                                  json: dict | None = None, files: dict | None = None,
-                                 timeout: int = 600, attempts: int = 3) -> httpx.Response:
+                                 timeout: int = 600, attempts: int = 3,
+                                 config: AppConfig | None = None) -> httpx.Response:
+        # One pooled client per provider: retries and sibling chunks reuse its connections
+        client = get_client(self._provider_name, config)
+        per_request = request_timeout(timeout, config)
         def _retry_predicate(exc: Exception) -> bool:
             # Retry on rate limit or transient httpx errors
             return self._is_rate_limit_error(exc) or isinstance(exc, httpx.HTTPError)
@@ -51,18 +508,49 @@ class CloudEngineBase:
             reraise=True,
         ):
             with attempt:
+                self._throttle()
                 try:
-                    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-                        r = client.post(url, headers=headers, data=data, json=json, files=files)
-                        if r.status_code == 429:
-                            raise APIError("Rate limited", provider=self._provider_name)
-                        if r.status_code >= 500:
-                            raise APIError(f"Server error {r.status_code}", provider=self._provider_name)
-                        return r
+                    r = client.post(url, headers=headers, data=data, json=json, files=files, timeout=per_request)
+                    if r.status_code == 429:
+                        raise APIError("Rate limited", provider=self._provider_name)
+                    if r.status_code >= 500:
+                        raise APIError(f"Server error {r.status_code}", provider=self._provider_name)
+                    return r
                 except Exception as e:
                     if not self._is_rate_limit_error(e):
                         raise
                     raise
 
+    async def _http_post_async(self, url: str, *, headers: dict | None = None, data: dict | bytes | None = None,
+                               json: dict | None = None, files: dict | None = None,
+                               timeout: int = 600, attempts: int = 3,
+                               config: AppConfig | None = None) -> httpx.Response:
+        """Async `_http_post_with_retries` over the loop's pooled `httpx.AsyncClient`."""
+        client = get_async_client(self._provider_name, config)
+        per_request = request_timeout(timeout, config)
+        # Raw bodies go in `content`; httpx only takes form fields in `data`
+        content = data if isinstance(data, (bytes, bytearray)) else None
+        form = None if content is not None else data
+
+        def _retry_predicate(exc: BaseException) -> bool:
+            return isinstance(exc, Exception) and (self._is_rate_limit_error(exc) or isinstance(exc, httpx.HTTPError))
+
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(attempts),
+            wait=wait_random_exponential(multiplier=1, max=8),
+            retry=retry_if_exception(_retry_predicate),
+            reraise=True,
+        ):
+            with attempt:
+                await self._throttle_async()
+                r = await client.post(
+                    url, headers=headers, content=content, data=form, json=json, files=files, timeout=per_request
+                )
+                if r.status_code == 429:
+                    raise APIError("Rate limited", provider=self._provider_name)
+                if r.status_code >= 500:
+                    raise APIError(f"Server error {r.status_code}", provider=self._provider_name)
+                return r
+
 
-__all__ = ["CloudEngineBase"]
+__all__ = ["CHUNK_OVERLAP_SECONDS", "CHUNK_WINDOW_SECONDS", "CloudEngineBase", "TokenBucket", "rate_limiter_for"]
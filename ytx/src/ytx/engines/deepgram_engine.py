@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any, Callable
+import asyncio
 import os
 import json as _json
 
@@ -9,8 +10,8 @@ from .base import TranscriptionEngine, EngineError
 from .cloud_base import CloudEngineBase
 from ..config import AppConfig
 from ..models import TranscriptSegment
-from ..chunking import compute_chunks, slice_wav_segment
-from ..stitch import stitch_segments
+from . import register_engine
+from ..audio import upload_mime
 
 
 def _load_api_key() -> str:
@@ -20,24 +21,11 @@ def _load_api_key() -> str:
     return key
 
 
+@register_engine
 class DeepgramEngine(CloudEngineBase, TranscriptionEngine):
     name = "deepgram"
-
-    def _prefer_sdk(self) -> bool:
-        return os.environ.get("YTX_PREFER_SDK", "").lower() in ("1", "true", "yes")
-
-    def transcribe(self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None) -> list[TranscriptSegment]:
-        window = 600.0
-        overlap = 2.0
-        try:
-            from ..audio import probe_duration
-
-            duration = probe_duration(audio_path)
-        except Exception:
-            duration = 0.0
-        if config.timestamp_policy == "chunked" or duration > window:
-            return self._transcribe_chunked(audio_path, config=config, on_progress=on_progress, window_seconds=window, overlap_seconds=overlap)
-        return self._transcribe_single(audio_path, config=config, on_progress=on_progress)
+    # Formats the API documents as accepted; downloads in these skip normalization
+    input_formats = (".wav", ".m4a", ".mp3", ".mp4", ".webm", ".ogg", ".opus", ".flac", ".aac")
 
     def _endpoint(self, cfg: AppConfig) -> str:
         base = "https://api.deepgram.com/v1/listen"
@@ -55,22 +43,39 @@ class DeepgramEngine(CloudEngineBase, TranscriptionEngine):
     def _transcribe_single(self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None) -> list[TranscriptSegment]:
         key = _load_api_key()
         # Try SDK first (optional), fallback to HTTP
+        upload = self._upload_file(audio_path, config)
         if self._prefer_sdk():
-            segs = self._try_sdk_transcribe(audio_path, config=config)
+            segs = self._try_sdk_transcribe(upload, config=config)
             if segs is not None:
                 return segs
         endpoint = self._endpoint(config)
-        headers = {
+        headers = self._headers(key, upload)
+        data = upload.read_bytes()
+        r = self._http_post_with_retries(endpoint, headers=headers, data=data, timeout=getattr(config, 'transcribe_timeout', 600), config=config)
+        return self._segments_from_response(r, audio_path, config=config)
+
+    async def _transcribe_single_async(self, audio_path: Path, *, config: AppConfig) -> list[TranscriptSegment]:
+        key = _load_api_key()
+        upload = await asyncio.to_thread(self._upload_file, audio_path, config)
+        data = await asyncio.to_thread(upload.read_bytes)
+        r = await self._http_post_async(
+            self._endpoint(config), headers=self._headers(key, upload), data=data,
+            timeout=getattr(config, 'transcribe_timeout', 600), config=config,
+        )
+        return self._segments_from_response(r, audio_path, config=config)
+
+    def _headers(self, key: str, upload: Path) -> dict[str, str]:
+        return {
             "Authorization": f"Token {key}",
-            "Content-Type": "audio/wav",
+            "Content-Type": upload_mime(upload),
         }
-        data = Path(audio_path).read_bytes()
-        r = self._http_post_with_retries(endpoint, headers=headers, data=data, timeout=getattr(config, 'transcribe_timeout', 600))
+
+    def _segments_from_response(self, r: Any, audio_path: Path, *, config: AppConfig) -> list[TranscriptSegment]:
         try:
             payload = r.json()
         except Exception:
             return []
-        segs = self._parse_deepgram_segments(payload)
+        segs = self._parse_deepgram_segments(payload, words=config.word_timestamps)
         if not segs:
             # Fallback to transcript text
             alt = (((payload.get("results") or {}).get("channels") or [{}])[0].get("alternatives") or [{}])[0]
@@ -79,46 +84,7 @@ class DeepgramEngine(CloudEngineBase, TranscriptionEngine):
             return [TranscriptSegment(id=0, start=0.0, end=end or 0.001, text=txt)]
         return segs
 
-    def _transcribe_chunked(self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None, window_seconds: float = 600.0, overlap_seconds: float = 2.0) -> list[TranscriptSegment]:
-        try:
-            from ..audio import probe_duration
-
-            total = probe_duration(audio_path)
-        except Exception:
-            total = 0.0
-        ranges = compute_chunks(total, window_seconds=window_seconds, overlap_seconds=overlap_seconds)
-        if not ranges:
-            return self._transcribe_single(audio_path, config=config, on_progress=on_progress)
-        segs_out: list[TranscriptSegment] = []
-        with __import__('tempfile').TemporaryDirectory(prefix='ytx-deepgram-chunks-') as td:  # type: ignore
-            tdir = Path(td)
-            for idx, (start, end) in enumerate(ranges):
-                chunk = tdir / f"chunk_{idx:04d}.wav"
-                slice_wav_segment(audio_path, chunk, start=start, end=end)
-                segs = self._transcribe_single(chunk, config=config, on_progress=None)
-                # Avoid in-place mutation of validated models; construct new instances
-                for s in segs:
-                    new_start = float(start) + float(getattr(s, "start", 0.0) or 0.0)
-                    new_end = float(start) + float(getattr(s, "end", 0.0) or 0.0)
-                    if new_end <= new_start:
-                        new_end = new_start + 0.001
-                    segs_out.append(
-                        TranscriptSegment(
-                            id=len(segs_out),
-                            start=new_start,
-                            end=new_end,
-                            text=str(getattr(s, "text", "")).strip(),
-                            confidence=getattr(s, "confidence", None),
-                        )
-                    )
-                if on_progress:
-                    try:
-                        on_progress(min(1.0, (idx + 1) / max(1, len(ranges))))
-                    except Exception:
-                        pass
-        return stitch_segments(segs_out)
-
-    def _parse_deepgram_segments(self, payload: dict[str, Any]) -> list[TranscriptSegment]:
+    def _parse_deepgram_segments(self, payload: dict[str, Any], *, words: bool = False) -> list[TranscriptSegment]:
         segs: list[TranscriptSegment] = []
         res = payload.get("results") or {}
         chans = res.get("channels") or []
@@ -143,16 +109,21 @@ class DeepgramEngine(CloudEngineBase, TranscriptionEngine):
             if end <= start:
                 end = start + 0.001
             prev_end = end
-            segs.append(TranscriptSegment(id=len(segs), start=start, end=end, text=txt))
+            segs.append(TranscriptSegment(id=len(segs), start=start, end=end, text=txt, words=self._parse_words(u) if words else None))
         return segs
 
-    def _probe_duration_safe(self, path: Path) -> float:
-        try:
-            from ..audio import probe_duration
-
-            return float(probe_duration(path))
-        except Exception:
-            return 0.0
+    def _parse_words(self, utterance: dict[str, Any]) -> list[tuple[float, float, str]] | None:
+        out: list[tuple[float, float, str]] = []
+        for w in utterance.get("words") or []:
+            try:
+                w0 = float(w.get("start"))
+                w1 = float(w.get("end", w0))
+                txt = str(w.get("punctuated_word") or w.get("word") or "").strip()
+            except Exception:
+                continue
+            if txt:
+                out.append((w0, w1, txt))
+        return out or None
 
     def _try_sdk_transcribe(self, audio_path: Path, *, config: AppConfig) -> list[TranscriptSegment] | None:
         try:
@@ -179,7 +150,7 @@ class DeepgramEngine(CloudEngineBase, TranscriptionEngine):
             # Try a generic call signature; if it fails, fallback to HTTP.
             try:
                 result = client.listen.prerecorded.v('1').transcribe_file(  # type: ignore[attr-defined]
-                    {'buffer': buf, 'mimetype': 'audio/wav'},
+                    {'buffer': buf, 'mimetype': upload_mime(audio_path)},
                     options
                 )
             except Exception:
@@ -194,7 +165,7 @@ class DeepgramEngine(CloudEngineBase, TranscriptionEngine):
                 payload = result  # assume dict
         except Exception:
             return None
-        segs = self._parse_deepgram_segments(payload)
+        segs = self._parse_deepgram_segments(payload, words=config.word_timestamps)
         if not segs:
             alt = (((payload.get("results") or {}).get("channels") or [{}])[0].get("alternatives") or [{}])[0]
             txt = alt.get("transcript", "").strip()
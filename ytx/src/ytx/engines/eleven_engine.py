@@ -8,6 +8,7 @@ from .base import TranscriptionEngine, EngineError
 from .cloud_base import CloudEngineBase
 from ..config import AppConfig
 from ..models import TranscriptSegment
+from . import register_engine
 
 
 def _load_api_key() -> str:
@@ -17,10 +18,11 @@ def _load_api_key() -> str:
     return key
 
 
+@register_engine
 class ElevenLabsEngine(CloudEngineBase, TranscriptionEngine):
     name = "elevenlabs"
 
-    def transcribe(self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None) -> list[TranscriptSegment]:
+    def _transcribe_audio(self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None) -> list[TranscriptSegment]:
         # Placeholder: pending stable STT endpoint documentation variations.
         # For now, raise a clear error indicating implementation is pending.
         _ = _load_api_key()  # validate presence
@@ -8,26 +8,38 @@ GEMINI-001..003 scope:
 - Configure the client and basic model setup via `GenerativeModel`.
 
 Actual audio handling and transcription prompt will be implemented in later tickets.
+
+Uploads are recorded in the cache index by content digest together with the
+provider's expiry, so re-running the same audio (retries, `--overwrite`, A/B
+runs against other engines, identical chunks) references the existing Files
+API handle instead of uploading again. `purge_uploads` deletes handles that
+are no longer wanted.
 """
 
 import os
+import time
 from pathlib import Path
 from typing import Any, Callable
-import mimetypes
-from ..audio import probe_duration
-from ..chunking import compute_chunks, slice_wav_segment
+from ..audio import probe_duration, upload_mime
+from ..chunking import slice_wav_segment
 from ..stitch import stitch_segments
 import tempfile
 from tenacity import Retrying, stop_after_attempt, wait_random_exponential, retry_if_exception
 
 from .base import EngineError, TranscriptionEngine
-from .cloud_base import CloudEngineBase
+from .cloud_base import CHUNK_OVERLAP_SECONDS, CHUNK_WINDOW_SECONDS, CloudEngineBase
 from ..config import AppConfig
 from ..models import TranscriptSegment
 from . import register_engine
 
 _GENAI_AVAILABLE = None  # lazy import
 
+# The Files API keeps uploads for 48 hours; a handle this close to expiry is
+# not reused (it could vanish mid-request) and is deleted instead.
+UPLOAD_TTL_SECONDS = 48 * 3600
+UPLOAD_REUSE_MARGIN_SECONDS = 30 * 60
+_PROVIDER = "gemini"
+
 
 def _load_api_key() -> str:
     """Load Gemini API key from environment.
@@ -78,6 +90,8 @@ def _resolve_model_name(model: str | None) -> str:
 @register_engine
 class GeminiEngine(CloudEngineBase, TranscriptionEngine):
     name = "gemini"
+    # Formats the API documents as accepted; downloads in these skip normalization
+    input_formats = (".wav", ".mp3", ".aac", ".ogg", ".flac", ".aiff")
 
     def __init__(self) -> None:
         # Defer hard failures until use; allow CLI to list engines even if dep missing.
@@ -96,8 +110,7 @@ class GeminiEngine(CloudEngineBase, TranscriptionEngine):
             raise EngineError(f"Failed to initialize Gemini model '{model_name}': {e}") from e
 
     def _guess_mime(self, path: Path) -> str | None:
-        mt, _ = mimetypes.guess_type(str(path))
-        return mt
+        return upload_mime(path)
 
     def _upload_audio(self, path: Path):  # type: ignore[no-untyped-def]
         """Upload audio via Files API and return file handle/reference.
@@ -113,14 +126,64 @@ class GeminiEngine(CloudEngineBase, TranscriptionEngine):
         if size > two_gb:
             raise EngineError("audio file is larger than 2GB; exceeds common Files API limits")
         mime = self._guess_mime(p) or "audio/wav"
+        from ..blobs import file_digest
+
+        digest = f"{file_digest(p)}:{mime}"
+        index = _upload_index()
+        reused = self._reuse_upload(index, digest)
+        if reused is not None:
+            return reused
+        # Uploads count against the provider quota just like generate calls
+        self._throttle()
         try:
             # google-generativeai accepts path as 'path=' or file object; include display_name where supported.
             file = genai.upload_file(path=str(p), mime_type=mime)  # type: ignore[attr-defined]
         except Exception as e:  # pragma: no cover
             raise EngineError(f"Gemini file upload failed: {e}") from e
         # Expect object with .uri, .name, .mime_type
+        now = time.time()
+        try:
+            from ..cache_index import UploadRecord
+
+            index.record_upload(
+                UploadRecord(
+                    provider=_PROVIDER,
+                    digest=digest,
+                    name=str(file.name),
+                    uri=getattr(file, "uri", None),
+                    mime_type=mime,
+                    size_bytes=size,
+                    created_at=now,
+                    expires_at=_expiry(file) or now + UPLOAD_TTL_SECONDS,
+                )
+            )
+        except Exception:
+            pass  # the upload cache is best effort
         return file
 
+    def _reuse_upload(self, index, digest: str):  # type: ignore[no-untyped-def]
+        """Return the live handle recorded for `digest`, or None (dropping stale records)."""
+        try:
+            rec = index.find_upload(_PROVIDER, digest)
+        except Exception:
+            return None
+        if rec is None:
+            return None
+        if rec.expires_at is not None and rec.expires_at - time.time() > UPLOAD_REUSE_MARGIN_SECONDS:
+            try:
+                file = genai.get_file(rec.name)  # type: ignore[attr-defined]
+                state = str(getattr(getattr(file, "state", None), "name", getattr(file, "state", "")) or "")
+                if state.upper() not in ("FAILED", "STATE_UNSPECIFIED"):
+                    return file
+            except Exception:
+                pass  # deleted remotely or owned by another key; upload again
+        _delete_remote(rec.name)
+        try:
+            index.forget_upload(_PROVIDER, digest)
+        except Exception:
+            pass
+        return None
+
     def _build_prompt(self, *, language: str | None) -> str:
         # Ask for strict JSON with segments and second-based timestamps.
         lang_clause = f"in {language} " if language else ""
@@ -132,30 +195,6 @@ class GeminiEngine(CloudEngineBase, TranscriptionEngine):
             "Ensure timestamps are in seconds with decimals, monotonic and non-overlapping."
         )
 
-    def transcribe(
-        self,
-        audio_path: Path,
-        *,
-        config: AppConfig,
-        on_progress: Callable[[float], None] | None = None,
-    ) -> list[TranscriptSegment]:
-        # Decide chunking by policy or duration threshold
-        try:
-            duration = probe_duration(audio_path)
-        except Exception:
-            duration = 0.0
-        window = 600.0  # 10 minutes
-        overlap = 2.0
-        if config.timestamp_policy == "chunked" or duration > window:
-            return self._transcribe_chunked(audio_path, config=config, on_progress=on_progress, window_seconds=window, overlap_seconds=overlap)
-        segs = self._transcribe_single(audio_path, config=config, on_progress=on_progress)
-        if config.timestamp_policy == "none":
-            # Collapse to a single text block
-            text = " ".join(s.text for s in segs if s.text).strip()
-            end = max((s.end for s in segs), default=duration)
-            return [TranscriptSegment(id=0, start=0.0, end=max(0.001, float(end)), text=text)]
-        return segs
-
     def _transcribe_single(
         self,
         audio_path: Path,
@@ -164,7 +203,7 @@ class GeminiEngine(CloudEngineBase, TranscriptionEngine):
         on_progress: Callable[[float], None] | None = None,
     ) -> list[TranscriptSegment]:
         model = self._get_model(config)
-        file = self._upload_audio(Path(audio_path))
+        file = self._upload_audio(self._upload_file(Path(audio_path), config))
         prompt = self._build_prompt(language=config.language)
         if on_progress:
             try:
@@ -192,53 +231,51 @@ class GeminiEngine(CloudEngineBase, TranscriptionEngine):
         *,
         config: AppConfig,
         on_progress: Callable[[float], None] | None = None,
-        window_seconds: float = 600.0,
-        overlap_seconds: float = 2.0,
+        window_seconds: float = CHUNK_WINDOW_SECONDS,
+        overlap_seconds: float = CHUNK_OVERLAP_SECONDS,
     ) -> list[TranscriptSegment]:
-        try:
-            total_dur = probe_duration(audio_path)
-        except Exception:
-            total_dur = 0.0
-        ranges = compute_chunks(total_dur, window_seconds=window_seconds, overlap_seconds=overlap_seconds)
+        total_dur = self._probe_duration_safe(audio_path)
+        ranges = self._plan_ranges(
+            audio_path, config, total_dur, window_seconds=window_seconds, overlap_seconds=overlap_seconds
+        )
         if not ranges:
             return self._transcribe_single(audio_path, config=config, on_progress=on_progress)
         model = self._get_model(config)
         prompt = self._build_prompt(language=config.language)
         segments_out: list[TranscriptSegment] = []
         with tempfile.TemporaryDirectory(prefix="ytx-chunks-") as td:
-            tdir = Path(td)
-            n = len(ranges)
-            for idx, (start, end) in enumerate(ranges):
-                chunk_path = tdir / f"chunk_{idx:04d}.wav"
-                slice_wav_segment(audio_path, chunk_path, start=start, end=end)
+            def work(chunk_path: Path, start: float, end: float) -> list[TranscriptSegment]:
                 file = self._upload_audio(chunk_path)
                 resp = self._generate_with_retries(model, [file, prompt], timeout=getattr(config, 'transcribe_timeout', 600))
                 payload_text = self._extract_text_from_response(resp)
                 data = self._loads_json_loose(self._strip_code_fences(payload_text or "")) if payload_text else None
-                segs = self._parse_segments_from_data_or_text(
+                return self._parse_segments_from_data_or_text(
                     data, payload_text, total_duration=(end - start)
                 )
-                # Offset by chunk start without mutating validated models to avoid
-                # transient end<=start during assignment (pydantic validate_assignment).
-                for s in segs:
-                    new_start = float(start) + float(getattr(s, "start", 0.0) or 0.0)
-                    new_end = float(start) + float(getattr(s, "end", 0.0) or 0.0)
-                    if new_end <= new_start:
-                        new_end = new_start + 0.001
-                    segments_out.append(
-                        TranscriptSegment(
-                            id=len(segments_out),
-                            start=new_start,
-                            end=new_end,
-                            text=str(getattr(s, "text", "")).strip(),
-                            confidence=getattr(s, "confidence", None),
-                        )
+
+            # Chunks are pre-sliced in the background and run concurrently;
+            # results come back in chunk order for offsetting. The slicer is
+            # passed explicitly so this module's name is resolved at call time.
+            results = self._map_sliced_chunks(
+                audio_path, ranges, Path(td), work, config=config, on_progress=on_progress, slicer=slice_wav_segment
+            )
+        for (start, _end), segs in zip(ranges, results):
+            # Offset by chunk start without mutating validated models to avoid
+            # transient end<=start during assignment (pydantic validate_assignment).
+            for s in segs:
+                new_start = float(start) + float(getattr(s, "start", 0.0) or 0.0)
+                new_end = float(start) + float(getattr(s, "end", 0.0) or 0.0)
+                if new_end <= new_start:
+                    new_end = new_start + 0.001
+                segments_out.append(
+                    TranscriptSegment(
+                        id=len(segments_out),
+                        start=new_start,
+                        end=new_end,
+                        text=str(getattr(s, "text", "")).strip(),
+                        confidence=getattr(s, "confidence", None),
                     )
-                if on_progress:
-                    try:
-                        on_progress(min(1.0, (idx + 1) / n))
-                    except Exception:
-                        pass
+                )
         # Stitch across chunk overlaps to remove duplicates and ensure continuity
         segments_out = stitch_segments(segments_out)
         return segments_out
@@ -418,4 +455,46 @@ class GeminiEngine(CloudEngineBase, TranscriptionEngine):
         return None
 
 
-__all__ = ["GeminiEngine"]
+def _upload_index():  # type: ignore[no-untyped-def]
+    from ..cache import cache_root
+    from ..cache_index import CacheIndex
+
+    return CacheIndex(cache_root())
+
+
+def _expiry(file: Any) -> float | None:
+    exp = getattr(file, "expiration_time", None)
+    try:
+        return float(exp.timestamp()) if exp is not None else None
+    except Exception:
+        return None
+
+
+def _delete_remote(name: str) -> bool:
+    try:
+        genai.delete_file(name)  # type: ignore[attr-defined]
+        return True
+    except Exception:
+        return False
+
+
+def purge_uploads(*, expired_only: bool = False) -> int:
+    """Delete recorded Gemini uploads (remotely and from the index); return how many.
+
+    With `expired_only`, only records past their expiry are dropped, which
+    needs no API call since the provider already removed the files.
+    """
+    index = _upload_index()
+    if not index.exists():
+        return 0
+    recs = index.uploads(_PROVIDER, expired_at=time.time() if expired_only else None)
+    if recs and not expired_only:
+        _ensure_client_configured()
+    for rec in recs:
+        if not expired_only:
+            _delete_remote(rec.name)
+        index.forget_upload(rec.provider, rec.digest)
+    return len(recs)
+
+
+__all__ = ["GeminiEngine", "purge_uploads"]
@@ -2,16 +2,16 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any, Callable
+import asyncio
 import os
-import mimetypes
 import json as _json
 
 from .base import TranscriptionEngine, EngineError
 from .cloud_base import CloudEngineBase
 from ..config import AppConfig
 from ..models import TranscriptSegment
-from ..chunking import compute_chunks, slice_wav_segment
-from ..stitch import stitch_segments
+from . import register_engine
+from ..audio import upload_mime
 
 
 def _load_api_key() -> str:
@@ -23,27 +23,11 @@ def _load_api_key() -> str:
     return key
 
 
+@register_engine
 class OpenAIEngine(CloudEngineBase, TranscriptionEngine):
     name = "openai"
-
-    def transcribe(self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None) -> list[TranscriptSegment]:
-        # Decide chunking
-        window = 600.0
-        overlap = 2.0
-        try:
-            from ..audio import probe_duration
-
-            duration = probe_duration(audio_path)
-        except Exception:
-            duration = 0.0
-        if config.timestamp_policy == "chunked" or duration > window:
-            return self._transcribe_chunked(audio_path, config=config, on_progress=on_progress, window_seconds=window, overlap_seconds=overlap)
-        segs = self._transcribe_single(audio_path, config=config, on_progress=on_progress)
-        if config.timestamp_policy == "none":
-            text = " ".join(s.text for s in segs if s.text).strip()
-            end = max((s.end for s in segs), default=duration)
-            return [TranscriptSegment(id=0, start=0.0, end=max(0.001, float(end)), text=text)]
-        return segs
+    # Formats the API documents as accepted; downloads in these skip normalization
+    input_formats = (".wav", ".m4a", ".mp3", ".mp4", ".webm", ".ogg", ".flac", ".mpeg", ".mpga")
 
     def _endpoint(self) -> str:
         # OpenAI Whisper transcription endpoint
@@ -54,35 +38,55 @@ class OpenAIEngine(CloudEngineBase, TranscriptionEngine):
         m = (cfg.model or "whisper-1").strip()
         return m if m else "whisper-1"
 
-    def _prefer_sdk(self) -> bool:
-        return os.environ.get("YTX_PREFER_SDK", "").lower() in ("1", "true", "yes")
-
     def _transcribe_single(self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None) -> list[TranscriptSegment]:
         key = _load_api_key()
         endpoint = self._endpoint()
         model = self._model_name(config)
-        mime = mimetypes.guess_type(str(audio_path))[0] or "audio/wav"
+        upload = self._upload_file(audio_path, config)
+        mime = upload_mime(upload)
         # Try SDK first (optional), then fallback to HTTP
         if self._prefer_sdk():
-            segs = self._try_sdk_transcribe(audio_path, model=model, language=config.language, timeout=getattr(config, 'transcribe_timeout', 600))
+            segs = self._try_sdk_transcribe(upload, model=model, language=config.language, timeout=getattr(config, 'transcribe_timeout', 600), words=config.word_timestamps)
             if segs is not None:
                 return segs
         headers = {"Authorization": f"Bearer {key}"}
         files = {
-            "file": (Path(audio_path).name, open(audio_path, "rb"), mime),
+            "file": (upload.name, open(upload, "rb"), mime),
         }
-        data = {
+        data = self._form(model, config)
+        r = self._http_post_with_retries(endpoint, headers=headers, files=files, data=data, timeout=getattr(config, 'transcribe_timeout', 600), config=config)
+        return self._segments_from_response(r, audio_path)
+
+    async def _transcribe_single_async(self, audio_path: Path, *, config: AppConfig) -> list[TranscriptSegment]:
+        key = _load_api_key()
+        upload = await asyncio.to_thread(self._upload_file, audio_path, config)
+        body = await asyncio.to_thread(upload.read_bytes)
+        r = await self._http_post_async(
+            self._endpoint(),
+            headers={"Authorization": f"Bearer {key}"},
+            files={"file": (upload.name, body, upload_mime(upload))},
+            data=self._form(self._model_name(config), config),
+            timeout=getattr(config, 'transcribe_timeout', 600),
+            config=config,
+        )
+        return self._segments_from_response(r, audio_path)
+
+    def _form(self, model: str, config: AppConfig) -> dict[str, Any]:
+        data: dict[str, Any] = {
             "model": model,
             "response_format": "verbose_json",  # attempt structured segments
         }
         if config.language:
             data["language"] = config.language
+        if config.word_timestamps:
+            data["timestamp_granularities[]"] = ["segment", "word"]
         # Map engine options if any
         for k, v in (config.engine_options or {}).items():
             if isinstance(v, (str, int, float)):
                 data[str(k)] = str(v)
+        return data
 
-        r = self._http_post_with_retries(endpoint, headers=headers, files=files, data=data, timeout=getattr(config, 'transcribe_timeout', 600))
+    def _segments_from_response(self, r: Any, audio_path: Path) -> list[TranscriptSegment]:
         try:
             payload = r.json()
         except Exception:
@@ -97,46 +101,6 @@ class OpenAIEngine(CloudEngineBase, TranscriptionEngine):
             return [TranscriptSegment(id=0, start=0.0, end=end or 0.001, text=txt.strip())]
         return segs
 
-    def _transcribe_chunked(self, audio_path: Path, *, config: AppConfig, on_progress: Callable[[float], None] | None = None, window_seconds: float = 600.0, overlap_seconds: float = 2.0) -> list[TranscriptSegment]:
-        try:
-            from ..audio import probe_duration
-
-            total = probe_duration(audio_path)
-        except Exception:
-            total = 0.0
-        ranges = compute_chunks(total, window_seconds=window_seconds, overlap_seconds=overlap_seconds)
-        if not ranges:
-            return self._transcribe_single(audio_path, config=config, on_progress=on_progress)
-        segs_out: list[TranscriptSegment] = []
-        with \
-            __import__('tempfile').TemporaryDirectory(prefix='ytx-openai-chunks-') as td:  # type: ignore
-            tdir = Path(td)
-            for idx, (start, end) in enumerate(ranges):
-                chunk = tdir / f"chunk_{idx:04d}.wav"
-                slice_wav_segment(audio_path, chunk, start=start, end=end)
-                segs = self._transcribe_single(chunk, config=config, on_progress=None)
-                # Avoid in-place mutation of validated models; construct new instances
-                for s in segs:
-                    new_start = float(start) + float(getattr(s, "start", 0.0) or 0.0)
-                    new_end = float(start) + float(getattr(s, "end", 0.0) or 0.0)
-                    if new_end <= new_start:
-                        new_end = new_start + 0.001
-                    segs_out.append(
-                        TranscriptSegment(
-                            id=len(segs_out),
-                            start=new_start,
-                            end=new_end,
-                            text=str(getattr(s, "text", "")).strip(),
-                            confidence=getattr(s, "confidence", None),
-                        )
-                    )
-                if on_progress:
-                    try:
-                        on_progress(min(1.0, (idx + 1) / max(1, len(ranges))))
-                    except Exception:
-                        pass
-        return stitch_segments(segs_out)
-
     def _parse_openai_verbose_segments(self, payload: dict[str, Any]) -> list[TranscriptSegment]:
         segs: list[TranscriptSegment] = []
         data = payload.get("segments")
@@ -157,17 +121,31 @@ class OpenAIEngine(CloudEngineBase, TranscriptionEngine):
                     end = start + 0.001
                 prev_end = end
                 segs.append(TranscriptSegment(id=len(segs), start=start, end=end, text=txt))
+        words = payload.get("words")
+        if segs and isinstance(words, list) and words:
+            segs = self._attach_words(segs, words)
         return segs
 
-    def _probe_duration_safe(self, path: Path) -> float:
-        try:
-            from ..audio import probe_duration
-
-            return float(probe_duration(path))
-        except Exception:
-            return 0.0
-
-    def _try_sdk_transcribe(self, audio_path: Path, *, model: str, language: str | None, timeout: int) -> list[TranscriptSegment] | None:
+    def _attach_words(self, segs: list[TranscriptSegment], words: list[Any]) -> list[TranscriptSegment]:
+        """Distribute verbose_json's flat `words` list over segments by word midpoint."""
+        buckets: list[list[tuple[float, float, str]]] = [[] for _ in segs]
+        j = 0
+        for w in words:
+            try:
+                w0 = float(w.get("start"))
+                w1 = float(w.get("end", w0))
+                txt = str(w.get("word") or "").strip()
+            except Exception:
+                continue
+            if not txt:
+                continue
+            mid = (w0 + w1) / 2.0
+            while j < len(segs) - 1 and mid >= float(segs[j].end):
+                j += 1
+            buckets[j].append((w0, w1, txt))
+        return [s.model_copy(update={"words": b or None}) for s, b in zip(segs, buckets)]
+
+    def _try_sdk_transcribe(self, audio_path: Path, *, model: str, language: str | None, timeout: int, words: bool = False) -> list[TranscriptSegment] | None:
         try:
             # Lazy import OpenAI SDK v1+ interface
             from openai import OpenAI  # type: ignore
@@ -179,11 +157,13 @@ class OpenAIEngine(CloudEngineBase, TranscriptionEngine):
             client = OpenAI()
             with open(audio_path, "rb") as f:
                 # Attempt verbose JSON for segments; fallback will be handled if not supported
+                extra: dict[str, Any] = {"timestamp_granularities": ["segment", "word"]} if words else {}
                 resp = client.audio.transcriptions.create(  # type: ignore[attr-defined]
                     model=model,
                     file=f,
                     response_format="verbose_json",
                     language=language or None,
+                    **extra,
                 )
         except Exception:
             return None
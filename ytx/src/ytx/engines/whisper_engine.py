@@ -14,12 +14,25 @@ subsequent tickets.
 
 from pathlib import Path
 from typing import Any, Dict, Tuple, Callable
+import math
+import tempfile
+import threading
+import time
 
 from .base import EngineError, TranscriptionEngine
 from ..config import AppConfig
 from ..models import TranscriptSegment
 from . import register_engine
 from ..audio import probe_duration
+from ..chunking import plan_chunks, slice_wav_segments
+from ..logging import get_logger
+from ..stitch import shift_words, stitch_chunks
+
+logger = get_logger(__name__)
+
+# Chunk-parallel mode: longest chunk handed to one worker, and chunk overlap
+PARALLEL_MAX_WINDOW = 600.0
+PARALLEL_OVERLAP = 2.0
 
 _FW_AVAILABLE = None  # lazy import status
 
@@ -30,10 +43,15 @@ class WhisperEngine(TranscriptionEngine):
 
     def __init__(self) -> None:  # light ctor; defer heavy work to methods
         # Lazy import; no heavy work on construction
-        pass
+        # Language reported by the most recent transcribe() call, if any
+        self.last_language: str | None = None
+        # Timing of the most recent transcribe() call (audio/wall seconds, RTF)
+        self.last_stats: dict[str, Any] | None = None
 
     # Simple in-process cache of loaded models keyed by (model, device, compute_type)
     _MODEL_CACHE: Dict[Tuple[str, str, str], Any] = {}
+    # Guards model loading so concurrent callers (e.g. `ytx serve`) load each model once
+    _MODEL_LOCK = threading.Lock()
 
     def _ensure_available(self) -> None:
         global _FW_AVAILABLE
@@ -102,14 +120,17 @@ class WhisperEngine(TranscriptionEngine):
         key = self._model_key(config)
         if key in self._MODEL_CACHE:
             return self._MODEL_CACHE[key]
-        model_name, device, compute_type = key
-        try:
-            model = WhisperModel(model_name, device=device, compute_type=compute_type)  # type: ignore[name-defined]
-        except Exception as e:  # pragma: no cover - depends on local env/network
-            raise EngineError(
-                f"Failed to load Whisper model '{model_name}' on {device} ({compute_type}): {e}"
-            ) from e
-        self._MODEL_CACHE[key] = model
+        with self._MODEL_LOCK:
+            if key in self._MODEL_CACHE:
+                return self._MODEL_CACHE[key]
+            model_name, device, compute_type = key
+            try:
+                model = WhisperModel(model_name, device=device, compute_type=compute_type)  # type: ignore[name-defined]
+            except Exception as e:  # pragma: no cover - depends on local env/network
+                raise EngineError(
+                    f"Failed to load Whisper model '{model_name}' on {device} ({compute_type}): {e}"
+                ) from e
+            self._MODEL_CACHE[key] = model
         return model
 
     def transcribe(
@@ -120,12 +141,50 @@ class WhisperEngine(TranscriptionEngine):
         on_progress: Callable[[float], None] | None = None,
     ) -> list[TranscriptSegment]:
         self._ensure_available()
-        model = self._get_model(config)
         total_dur = None
         try:
             total_dur = probe_duration(audio_path)
         except Exception:
             total_dur = None
+        t0 = time.perf_counter()
+        if config.whisper_workers > 1 and total_dur and total_dur > 2 * PARALLEL_OVERLAP:
+            from .whisper_pool import split_threads
+
+            workers, threads = split_threads(config.whisper_workers, config.whisper_threads)
+            results = self._transcribe_parallel(
+                audio_path, config=config, total=float(total_dur), workers=workers, threads=threads, on_progress=on_progress
+            )
+        else:
+            workers, threads = 1, None  # CTranslate2 picks its own thread count
+            results = self._transcribe_single(audio_path, config=config, total_dur=total_dur, on_progress=on_progress)
+        self._record_stats(total_dur, time.perf_counter() - t0, workers=workers, threads=threads)
+        return results
+
+    def _record_stats(self, audio_seconds: float | None, wall: float, *, workers: int, threads: int | None) -> None:
+        """Keep and log the real-time factor (wall time / audio duration) of the last run."""
+        rtf = (wall / audio_seconds) if audio_seconds else None
+        self.last_stats = {
+            "audio_seconds": audio_seconds,
+            "wall_seconds": wall,
+            "rtf": rtf,
+            "workers": workers,
+            "threads_per_worker": threads,
+        }
+        if rtf is not None:
+            logger.info(
+                "whisper: %.0fs of audio in %.1fs (RTF %.3f, %d worker(s) x %s thread(s))",
+                audio_seconds, wall, rtf, workers, threads or "auto",
+            )
+
+    def _transcribe_single(
+        self,
+        audio_path: Path,
+        *,
+        config: AppConfig,
+        total_dur: float | None,
+        on_progress: Callable[[float], None] | None,
+    ) -> list[TranscriptSegment]:
+        model = self._get_model(config)
         try:
             try:
                 segments_iter, info = model.transcribe(
@@ -134,7 +193,7 @@ class WhisperEngine(TranscriptionEngine):
                     vad_filter=True,
                     beam_size=5,
                     batch_size=8,
-                    word_timestamps=False,
+                    word_timestamps=config.word_timestamps,
                 )
             except TypeError:
                 # Older faster-whisper versions may not support batch_size
@@ -143,10 +202,11 @@ class WhisperEngine(TranscriptionEngine):
                     language=config.language,
                     vad_filter=True,
                     beam_size=5,
-                    word_timestamps=False,
+                    word_timestamps=config.word_timestamps,
                 )
         except Exception as e:  # pragma: no cover
             raise EngineError(f"Whisper transcription failed: {e}") from e
+        self.last_language = getattr(info, "language", None)
 
         results: list[TranscriptSegment] = []
         prev_end = 0.0
@@ -156,6 +216,11 @@ class WhisperEngine(TranscriptionEngine):
                 end = float(getattr(s, "end", start))
                 text = str(getattr(s, "text", "")).strip()
                 conf = getattr(s, "avg_logprob", None)
+                words = [
+                    (float(w.start), float(w.end), str(w.word).strip())
+                    for w in (getattr(s, "words", None) or [])
+                    if str(w.word).strip()
+                ]
             except Exception:
                 continue
             if not text:
@@ -172,7 +237,7 @@ class WhisperEngine(TranscriptionEngine):
                     on_progress(ratio)
                 except Exception:
                     pass
-            results.append(TranscriptSegment(id=i, start=start, end=end, text=text, confidence=conf))
+            results.append(TranscriptSegment(id=i, start=start, end=end, text=text, confidence=conf, words=words or None))
         if on_progress:
             try:
                 on_progress(1.0)
@@ -180,6 +245,65 @@ class WhisperEngine(TranscriptionEngine):
                 pass
         return results
 
+    def _transcribe_parallel(
+        self,
+        audio_path: Path,
+        *,
+        config: AppConfig,
+        total: float,
+        workers: int,
+        threads: int,
+        on_progress: Callable[[float], None] | None,
+    ) -> list[TranscriptSegment]:
+        """Fan chunks of `audio_path` out to a pool of single-model worker processes."""
+        from .whisper_pool import discard_pool, get_pool
+
+        # Use a multiple of `workers` chunks so the last round keeps every worker busy
+        rounds = max(1, math.ceil(total / (workers * PARALLEL_MAX_WINDOW)))
+        window = max(PARALLEL_OVERLAP * 4, total / (workers * rounds) + PARALLEL_OVERLAP)
+        ranges = plan_chunks(
+            total,
+            window_seconds=window,
+            overlap_seconds=PARALLEL_OVERLAP,
+            audio_path=audio_path if config.silence_cuts else None,
+            tolerance_seconds=min(30.0, window / 4),
+        )
+        pool = get_pool(self._model_key(config), workers=workers, threads=threads)
+        try:
+            with tempfile.TemporaryDirectory(prefix="ytx-whisper-chunks-") as td:
+                paths = slice_wav_segments(
+                    audio_path, [(Path(td) / f"chunk_{i:04d}.wav", s, e) for i, (s, e) in enumerate(ranges)]
+                )
+                # Detect once so every chunk is decoded in the same language
+                language = config.language or pool.detect_language(paths[0])
+                self.last_language = language
+                futures = [pool.submit(p, language=language, word_timestamps=config.word_timestamps) for p in paths]
+                done = 0
+                results = []
+                for fut in futures:
+                    results.append(fut.result())
+                    done += 1
+                    if on_progress:
+                        try:
+                            on_progress(done / len(futures))
+                        except Exception:
+                            pass
+        except EngineError:
+            raise
+        except Exception as e:
+            discard_pool(pool)
+            raise EngineError(code="ENGINE", message=f"Parallel Whisper transcription failed: {e}") from e
+        chunks = []
+        for (start, end), raw in zip(ranges, results):
+            segs = []
+            for s0, s1, text, conf, words in raw:
+                a, b = start + s0, start + max(s1, s0 + 0.001)
+                segs.append(
+                    TranscriptSegment(id=0, start=a, end=b, text=text, confidence=conf, words=shift_words(words, start))
+                )
+            chunks.append((start, end, segs))
+        return stitch_chunks(chunks)
+
     def detect_language(self, audio_path: Path, *, config: AppConfig) -> str | None:
         self._ensure_available()
         model = self._get_model(config)
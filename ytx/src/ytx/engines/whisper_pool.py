@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+"""Process pool for chunk-parallel faster-whisper transcription.
+
+A single `model.transcribe` call only scales through CTranslate2's intra-op
+threads, which tops out well below the core count of large CPU boxes. The
+pool runs `workers` processes that each hold their own `WhisperModel` with
+`cpu_threads` set to a slice of the cores; chunks of one file are fanned out
+across them. Pools are cached per (model, device, compute type, workers,
+threads) so batch runs and `ytx serve` pay the model load once per worker.
+
+Workers use the `spawn` start method: forking a parent that already runs
+CTranslate2/OpenMP threads is not safe.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import atexit
+import multiprocessing
+import os
+import threading
+
+# Plain-data segment returned by workers: (start, end, text, confidence, words)
+RawSegment = Tuple[float, float, str, Optional[float], Optional[List[Tuple[float, float, str]]]]
+
+_WORKER_MODEL: Any = None  # the model loaded in this worker process
+
+
+def _init_worker(model_name: str, device: str, compute_type: str, cpu_threads: int) -> None:
+    global _WORKER_MODEL
+    from faster_whisper import WhisperModel  # type: ignore
+
+    _WORKER_MODEL = WhisperModel(
+        model_name, device=device, compute_type=compute_type, cpu_threads=cpu_threads, num_workers=1
+    )
+
+
+def _detect_language(path: str) -> str | None:
+    _, info = _WORKER_MODEL.transcribe(path, language=None, vad_filter=True, beam_size=1)
+    return getattr(info, "language", None)
+
+
+def _transcribe_chunk(path: str, language: str | None, word_timestamps: bool) -> List[RawSegment]:
+    segments, _info = _WORKER_MODEL.transcribe(
+        path, language=language, vad_filter=True, beam_size=5, word_timestamps=word_timestamps
+    )
+    out: List[RawSegment] = []
+    for s in segments:
+        text = str(getattr(s, "text", "")).strip()
+        if not text:
+            continue
+        words = [
+            (float(w.start), float(w.end), str(w.word).strip())
+            for w in (getattr(s, "words", None) or [])
+            if str(w.word).strip()
+        ]
+        start = float(getattr(s, "start", 0.0) or 0.0)
+        out.append((start, float(getattr(s, "end", start)), text, getattr(s, "avg_logprob", None), words or None))
+    return out
+
+
+def split_threads(workers: int, threads: int | None = None) -> Tuple[int, int]:
+    """Resolve (workers, threads per worker), partitioning the CPU cores by default."""
+    cores = os.cpu_count() or 1
+    workers = max(1, min(int(workers), cores))
+    if not threads:
+        threads = max(1, cores // workers)
+    return workers, max(1, int(threads))
+
+
+class WhisperPool:
+    """`workers` processes, each with one `WhisperModel` using `threads` threads."""
+
+    def __init__(self, key: Tuple[str, str, str], *, workers: int, threads: int) -> None:
+        self.key = key
+        self.workers = workers
+        self.threads = threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(*key, threads),
+        )
+
+    def detect_language(self, path: Path) -> str | None:
+        return self._executor.submit(_detect_language, str(path)).result()
+
+    def submit(self, path: Path, *, language: str | None, word_timestamps: bool = False) -> "Future[List[RawSegment]]":
+        return self._executor.submit(_transcribe_chunk, str(path), language, word_timestamps)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_POOLS: Dict[Tuple[Any, ...], WhisperPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(key: Tuple[str, str, str], *, workers: int, threads: int) -> WhisperPool:
+    """Return the shared pool for this model and sizing, starting it on first use."""
+    pool_key = (*key, workers, threads)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(pool_key)
+        if pool is None:
+            pool = _POOLS[pool_key] = WhisperPool(key, workers=workers, threads=threads)
+        return pool
+
+
+def discard_pool(pool: WhisperPool) -> None:
+    """Drop a pool that failed (e.g. a worker died) so the next call starts fresh."""
+    with _POOLS_LOCK:
+        for k, v in list(_POOLS.items()):
+            if v is pool:
+                del _POOLS[k]
+    try:
+        pool.close()
+    except Exception:
+        pass
+
+
+@atexit.register
+def shutdown_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        try:
+            pool.close()
+        except Exception:
+            pass
+
+
+__all__ = ["WhisperPool", "get_pool", "discard_pool", "shutdown_pools", "split_threads"]
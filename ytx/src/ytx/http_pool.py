@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+"""Shared, long-lived httpx clients for provider APIs.
+
+Each provider gets one `httpx.Client` per process, created on first use and
+closed at interpreter exit (or by `close_clients`). Chunk uploads from all
+worker threads go through it, so DNS, TCP and TLS setup is paid once per
+connection instead of once per request. HTTP/2 is negotiated when enabled and
+the optional `h2` package is installed (`pip install httpx[http2]`); otherwise
+clients speak HTTP/1.1 with keep-alive.
+
+`get_async_client` is the asyncio counterpart: one `httpx.AsyncClient` per
+provider and event loop (connections belong to the loop that opened them),
+closed with `aclose_async_clients()` before the loop ends.
+
+`connection_stats()` reports, per provider, how many requests were sent and how
+many new connections they needed, counted from httpcore's trace events.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+import asyncio
+import atexit
+import threading
+
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .config import AppConfig
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_SECONDS = 60.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    http2: bool = True
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+
+    @classmethod
+    def from_config(cls, config: "AppConfig | None") -> "PoolSettings":
+        if config is None:
+            return cls()
+        return cls(
+            http2=bool(config.http2),
+            max_connections=max(1, int(config.http_max_connections)),
+            keepalive_seconds=max(0.0, float(config.http_keepalive_seconds)),
+            connect_timeout=max(0.1, float(config.http_connect_timeout)),
+        )
+
+
+@dataclass
+class ConnectionStats:
+    requests: int = 0
+    connections: int = 0  # new TCP connections opened
+    http2_requests: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(0, self.requests - self.connections)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "reused": self.reused, "reuse_ratio": round(self.reuse_ratio, 3)}
+
+
+_lock = threading.Lock()
+_clients: dict[str, tuple[PoolSettings, "httpx.Client"]] = {}
+_retired: list["httpx.Client"] = []
+# (provider, id(loop)) -> (settings, client, loop); the loop reference keeps its id unique
+_async_clients: dict[tuple[str, int], tuple[PoolSettings, "httpx.AsyncClient", Any]] = {}
+_retired_async: list[tuple["httpx.AsyncClient", Any]] = []
+_stats: dict[str, ConnectionStats] = {}
+_H2_AVAILABLE: bool | None = None
+
+
+def http2_available() -> bool:
+    global _H2_AVAILABLE
+    if _H2_AVAILABLE is None:
+        try:
+            import h2  # type: ignore  # noqa: F401
+
+            _H2_AVAILABLE = True
+        except Exception:
+            _H2_AVAILABLE = False
+    return _H2_AVAILABLE
+
+
+def _count_connection(provider: str, event: str) -> None:
+    if event == "connection.connect_tcp.complete":
+        with _lock:
+            _stats.setdefault(provider, ConnectionStats()).connections += 1
+
+
+def _count_response(provider: str, response: "httpx.Response") -> None:
+    with _lock:
+        st = _stats.setdefault(provider, ConnectionStats())
+        st.requests += 1
+        if response.http_version == "HTTP/2":
+            st.http2_requests += 1
+
+
+def _hooks(provider: str) -> dict[str, list]:
+    def on_trace(event: str, info: dict) -> None:
+        _count_connection(provider, event)
+
+    def on_request(request: "httpx.Request") -> None:
+        request.extensions["trace"] = on_trace
+
+    def on_response(response: "httpx.Response") -> None:
+        _count_response(provider, response)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def _async_hooks(provider: str) -> dict[str, list]:
+    # AsyncClient awaits its hooks and httpcore awaits async trace callbacks
+    async def on_trace(event: str, info: dict) -> None:
+        _count_connection(provider, event)
+
+    async def on_request(request: "httpx.Request") -> None:
+        request.extensions["trace"] = on_trace
+
+    async def on_response(response: "httpx.Response") -> None:
+        _count_response(provider, response)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def _client_options(settings: PoolSettings) -> dict[str, Any]:
+    import httpx
+
+    return {
+        "http2": settings.http2 and http2_available(),
+        "limits": httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_connections,
+            keepalive_expiry=settings.keepalive_seconds,
+        ),
+        "timeout": httpx.Timeout(60.0, connect=settings.connect_timeout),
+        "follow_redirects": True,
+    }
+
+
+def _build_client(provider: str, settings: PoolSettings) -> "httpx.Client":
+    import httpx
+
+    return httpx.Client(event_hooks=_hooks(provider), **_client_options(settings))
+
+
+def get_client(provider: str, config: "AppConfig | None" = None) -> "httpx.Client":
+    """Return the shared client for `provider`, creating it on first use.
+
+    A client built with different pool settings is replaced; the old one may
+    still have requests in flight on other threads, so it is only closed by
+    `close_clients`.
+    """
+    settings = PoolSettings.from_config(config)
+    with _lock:
+        entry = _clients.get(provider)
+        if entry is not None and entry[0] == settings:
+            return entry[1]
+        if entry is not None:
+            logger.debug("Pool settings for %s changed; replacing HTTP client", provider)
+            _retired.append(entry[1])
+        client = _build_client(provider, settings)
+        _clients[provider] = (settings, client)
+    return client
+
+
+def get_async_client(provider: str, config: "AppConfig | None" = None) -> "httpx.AsyncClient":
+    """Return the shared async client for `provider` on the running event loop."""
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    settings = PoolSettings.from_config(config)
+    key = (provider, id(loop))
+    with _lock:
+        entry = _async_clients.get(key)
+        if entry is not None and entry[0] == settings:
+            return entry[1]
+        # Tasks on this loop may still hold a replaced client; it is closed with the others
+        client = httpx.AsyncClient(event_hooks=_async_hooks(provider), **_client_options(settings))
+        _async_clients[key] = (settings, client, loop)
+        if entry is not None:
+            _retired_async.append((entry[1], loop))
+    return client
+
+
+async def aclose_async_clients() -> None:
+    """Close the async clients bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        keys = [k for k, (_, _, lp) in _async_clients.items() if lp is loop]
+        clients = [_async_clients.pop(k)[1] for k in keys] + [c for c, lp in _retired_async if lp is loop]
+        _retired_async[:] = [(c, lp) for c, lp in _retired_async if lp is not loop]
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            pass
+
+
+def request_timeout(seconds: float, config: "AppConfig | None" = None) -> "httpx.Timeout":
+    """Per-request timeout: `seconds` for reads/writes, the pool's connect timeout."""
+    import httpx
+
+    return httpx.Timeout(float(seconds), connect=PoolSettings.from_config(config).connect_timeout)
+
+
+def connection_stats() -> dict[str, dict[str, Any]]:
+    """Requests, new connections and reuse ratio per provider since start (or reset)."""
+    with _lock:
+        return {p: s.as_dict() for p, s in sorted(_stats.items())}
+
+
+def reset_stats() -> None:
+    with _lock:
+        _stats.clear()
+
+
+def close_clients() -> None:
+    """Close every pooled client; later requests open fresh ones."""
+    with _lock:
+        clients = [c for _, c in _clients.values()] + _retired
+        _clients.clear()
+        _retired[:] = []
+        # Async clients can only be closed on their own loop; drop any left over
+        _async_clients.clear()
+        _retired_async[:] = []
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+    stats = connection_stats()
+    if stats:
+        logger.debug("HTTP connection reuse: %s", stats)
+
+
+atexit.register(close_clients)
+
+
+__all__ = [
+    "ConnectionStats",
+    "PoolSettings",
+    "aclose_async_clients",
+    "close_clients",
+    "connection_stats",
+    "get_async_client",
+    "get_client",
+    "http2_available",
+    "request_timeout",
+    "reset_stats",
+]
@@ -52,7 +52,10 @@ __all__ = [
 
 
 # Transcript models
-from pydantic import Field, model_validator
+from pydantic import Field, model_serializer, model_validator
+
+# Compact per-word timing: (start, end, text) on the same timeline as the segment
+Word = tuple[float, float, str]
 
 
 class TranscriptSegment(ModelBase):
@@ -61,6 +64,9 @@ class TranscriptSegment(ModelBase):
     Notes on confidence:
     - Range and meaning depend on engine. For Whisper it may be a log-probability
       (often negative). For LLM-based engines it may be omitted.
+
+    `words` is only populated when word timestamps were requested and the
+    engine provides them; it is omitted from serialized output otherwise.
     """
 
     id: int = Field(ge=0)
@@ -68,6 +74,14 @@ class TranscriptSegment(ModelBase):
     end: Seconds
     text: NonEmptyStr
     confidence: float | None = None
+    words: list[Word] | None = None
+
+    @model_serializer(mode="wrap")
+    def _omit_missing_words(self, handler):  # type: ignore[no-untyped-def]
+        data = handler(self)
+        if isinstance(data, dict) and data.get("words") is None:
+            data.pop("words", None)
+        return data
 
     @model_validator(mode="after")
     def _validate_times(self) -> "TranscriptSegment":
@@ -80,7 +94,7 @@ class TranscriptSegment(ModelBase):
         return float(self.end - self.start)
 
 
-__all__.append("TranscriptSegment")
+__all__ += ["Word", "TranscriptSegment"]
 
 
 class Chapter(ModelBase):
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+"""Local transcription daemon (`ytx serve`) that keeps Whisper models warm.
+
+A CLI process only lives for one video, so every `ytx transcribe` would pay
+the full faster-whisper model load. `ytx serve` runs a long-lived localhost
+HTTP server whose `WhisperEngine._MODEL_CACHE` survives across jobs; the CLI
+discovers it through a state file in the cache root and submits jobs to it.
+
+Protocol (JSON over HTTP, bound to 127.0.0.1 by default):
+- GET  /health      → {"status": "ok", "pid", "models": [[model, device, compute], ...]}
+- POST /transcribe  → body {"audio_path", "config"} → TranscriptDoc JSON
+
+Requests must carry the `X-YTX-Token` header from the state file, which is
+created with owner-only permissions. If the daemon becomes unreachable or
+fails a job, `RemoteWhisperEngine` falls back to in-process transcription.
+"""
+
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+import json as _json
+import os
+import secrets
+import threading
+import time
+
+from .cache import cache_root, write_bytes_atomic
+from .config import AppConfig
+from .engines.base import EngineError, TranscriptionEngine
+from .http_pool import get_client
+from .logging import get_logger
+from .models import TranscriptDoc, TranscriptSegment
+
+
+logger = get_logger(__name__)
+
+
+SERVER_STATE_FILE = "serve.json"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+TOKEN_HEADER = "X-YTX-Token"
+
+
+def state_path(root: Path | None = None) -> Path:
+    return (root or cache_root()) / SERVER_STATE_FILE
+
+
+@dataclass(frozen=True)
+class ServerInfo:
+    host: str
+    port: int
+    pid: int
+    token: str
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+
+def _default_engine_factory() -> Any:
+    from .engines.whisper_engine import WhisperEngine
+
+    return WhisperEngine()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_HTTPServer"  # type: ignore[assignment]
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        # Keep the daemon quiet; per-job lines are printed by the service callback
+        pass
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        data = payload if isinstance(payload, bytes) else _json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _authorized(self) -> bool:
+        if secrets.compare_digest(self.headers.get(TOKEN_HEADER, ""), self.server.service.token):
+            return True
+        self._send_json(403, {"error": "invalid token"})
+        return False
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        if not self._authorized():
+            return
+        if self.path == "/health":
+            self._send_json(200, self.server.service.health())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+        if not self._authorized():
+            return
+        if self.path != "/transcribe":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = _json.loads(self.rfile.read(length) or b"{}")
+        except Exception as e:
+            self._send_json(400, {"error": f"invalid request: {e}"})
+            return
+        try:
+            doc = self.server.service.transcribe_job(body)
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send_json(200, doc.model_dump_json().encode("utf-8"))
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    service: "TranscriptionServer"
+
+
+class TranscriptionServer:
+    """Long-lived transcription service holding warm engine models.
+
+    Engines are created per job via `engine_factory` (construction is cheap);
+    loaded models live in the engine's class-level cache and are reused.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        engine_factory: Callable[[], Any] = _default_engine_factory,
+        root: Path | None = None,
+        on_job: Callable[[dict], None] | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.engine_factory = engine_factory
+        self.root = root
+        self.on_job = on_job
+        self.token = secrets.token_hex(16)
+        self.started_at = time.time()
+        self.jobs = 0
+        self._jobs_lock = threading.Lock()
+        self._httpd: _HTTPServer | None = None
+
+    # --- lifecycle ---
+
+    def start(self) -> ServerInfo:
+        """Bind the socket and write the discovery state file."""
+        httpd = _HTTPServer((self.host, self.port), _Handler)
+        httpd.service = self
+        self._httpd = httpd
+        self.port = int(httpd.server_address[1])
+        info = ServerInfo(host=self.host, port=self.port, pid=os.getpid(), token=self.token)
+        path = state_path(self.root)
+        write_bytes_atomic(path, _json.dumps(info.__dict__).encode("utf-8"))
+        try:
+            os.chmod(path, 0o600)
+        except OSError:  # pragma: no cover - platform dependent
+            pass
+        return info
+
+    def serve_forever(self) -> None:
+        if self._httpd is None:
+            self.start()
+        assert self._httpd is not None
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+
+    def close(self) -> None:
+        if self._httpd is not None:
+            self._httpd.server_close()
+        try:
+            path = state_path(self.root)
+            data = _json.loads(path.read_text(encoding="utf-8"))
+            if data.get("token") == self.token:
+                path.unlink()
+        except Exception:
+            pass
+
+    # --- jobs ---
+
+    def preload(self, config: AppConfig) -> None:
+        eng = self.engine_factory()
+        getter = getattr(eng, "_get_model", None)
+        if callable(getter):
+            getter(config)
+
+    def health(self) -> dict:
+        models: list = []
+        try:
+            from .engines.whisper_engine import WhisperEngine
+
+            models = [list(k) for k in WhisperEngine._MODEL_CACHE]
+        except Exception:
+            pass
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "jobs": self.jobs,
+            "uptime": round(time.time() - self.started_at, 1),
+            "models": models,
+        }
+
+    def transcribe_job(self, body: dict) -> TranscriptDoc:
+        audio_path = Path(str(body.get("audio_path") or ""))
+        if not audio_path.is_file():
+            raise EngineError(code="ENGINE", message=f"audio file does not exist: {audio_path}")
+        cfg = AppConfig(**(body.get("config") or {}))
+        eng = self.engine_factory()
+        t0 = time.perf_counter()
+        segments = eng.transcribe(audio_path, config=cfg, on_progress=None)
+        language = cfg.language or getattr(eng, "last_language", None)
+        if language is None:
+            language = eng.detect_language(audio_path, config=cfg)
+        with self._jobs_lock:
+            self.jobs += 1
+        vid = audio_path.stem
+        # Only segments and language matter to the client; it builds the real doc
+        doc = TranscriptDoc(
+            video_id=vid,
+            source_url=audio_path.as_uri(),
+            language=language,
+            engine=cfg.engine,
+            model=cfg.model,
+            segments=segments,
+        )
+        if self.on_job:
+            try:
+                self.on_job({"video_id": vid, "model": cfg.model, "seconds": time.perf_counter() - t0})
+            except Exception:
+                pass
+        return doc
+
+
+# --- client side ---
+
+
+def find_server(root: Path | None = None, *, timeout: float = 0.5) -> ServerInfo | None:
+    """Return the running server from the state file, or None.
+
+    Checks that the recorded process is alive and answers /health quickly so a
+    stale state file never slows down or breaks a normal CLI run.
+    """
+    if os.environ.get("YTX_NO_SERVER", "").lower() in ("1", "true", "yes"):
+        return None
+    path = state_path(root)
+    try:
+        data = _json.loads(path.read_text(encoding="utf-8"))
+        info = ServerInfo(host=str(data["host"]), port=int(data["port"]), pid=int(data["pid"]), token=str(data["token"]))
+    except Exception:
+        return None
+    try:
+        os.kill(info.pid, 0)
+    except ProcessLookupError:
+        return None
+    except Exception:
+        pass  # e.g. PermissionError: process exists under another user
+    try:
+        import httpx
+
+        r = httpx.get(info.url + "/health", headers={TOKEN_HEADER: info.token}, timeout=timeout)
+        if r.status_code != 200:
+            return None
+    except Exception:
+        return None
+    return info
+
+
+class RemoteWhisperEngine(TranscriptionEngine):
+    """Engine adapter that submits jobs to a running `ytx serve` daemon.
+
+    On a connection failure or server error the job is retried once with an
+    in-process engine from `fallback_factory`, which is then used for the rest
+    of the run.
+    """
+
+    name = "whisper"
+
+    def __init__(self, info: ServerInfo, *, fallback_factory: Callable[[], Any] = _default_engine_factory) -> None:
+        self.info = info
+        self.last_language: str | None = None
+        self._fallback_factory = fallback_factory
+        self._local: Any = None
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        *,
+        config: AppConfig,
+        on_progress: Callable[[float], None] | None = None,
+    ) -> list[TranscriptSegment]:
+        if self._local is not None:
+            return self._local.transcribe(audio_path, config=config, on_progress=on_progress)
+        try:
+            segments = self._transcribe_remote(audio_path, config=config)
+        except EngineError as e:
+            logger.warning("%s; falling back to in-process transcription", e)
+            self._local = self._fallback_factory()
+            return self._local.transcribe(audio_path, config=config, on_progress=on_progress)
+        if on_progress:
+            try:
+                on_progress(1.0)
+            except Exception:
+                pass
+        return segments
+
+    def _transcribe_remote(self, audio_path: Path, *, config: AppConfig) -> list[TranscriptSegment]:
+        import httpx
+
+        body = {
+            "audio_path": str(Path(audio_path).resolve()),
+            "config": config.model_dump(mode="json"),
+        }
+        try:
+            r = get_client("ytx-serve", config).post(
+                self.info.url + "/transcribe",
+                json=body,
+                headers={TOKEN_HEADER: self.info.token},
+                timeout=httpx.Timeout(10.0, read=None),
+            )
+        except httpx.HTTPError as e:
+            raise EngineError(code="ENGINE", message=f"ytx serve request failed: {e}") from e
+        if r.status_code != 200:
+            try:
+                msg = r.json().get("error")
+            except Exception:
+                msg = r.text
+            raise EngineError(code="ENGINE", message=f"ytx serve error ({r.status_code}): {msg}")
+        doc = TranscriptDoc.model_validate_json(r.content)
+        self.last_language = doc.language
+        return list(doc.segments)
+
+    def detect_language(self, audio_path: Path, *, config: AppConfig) -> str | None:
+        if self._local is not None:
+            lang = getattr(self._local, "last_language", None)
+            return lang or self._local.detect_language(audio_path, config=config)
+        # The daemon reports the detected language with each transcription
+        return self.last_language
+
+
+__all__ = [
+    "SERVER_STATE_FILE",
+    "DEFAULT_HOST",
+    "DEFAULT_PORT",
+    "ServerInfo",
+    "TranscriptionServer",
+    "find_server",
+    "RemoteWhisperEngine",
+    "state_path",
+]
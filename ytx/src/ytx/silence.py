@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+"""Cheap energy-based silence detection on canonical WAVs.
+
+The normalized 16 kHz mono PCM16 WAV is memory-mapped with NumPy and only the
+stretches that are asked about are read: frames of `FRAME_SECONDS` are reduced
+to mean-square energy, smoothed over `MIN_SILENCE_SECONDS` and compared with a
+dBFS threshold. This is a level detector, not a speech model, but it is enough
+to place chunk cuts in pauses instead of mid-word, and to drop long silent
+stretches before audio is uploaded (`compact_speech` / `SpeechMap`).
+
+NumPy is optional (it ships with faster-whisper); without it, or for inputs
+that are not canonical WAVs, `open_pcm` returns None and callers fall back to
+fixed windows.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Sequence, Tuple
+import struct
+import wave
+
+from .chunking import CANONICAL_RATE, is_canonical_wav
+
+if TYPE_CHECKING:
+    from .models import TranscriptSegment
+
+FRAME_SECONDS = 0.02
+MIN_SILENCE_SECONDS = 0.3
+SILENCE_DBFS = -35.0  # ceiling; quiet recordings use noise floor + NOISE_MARGIN_DB
+NOISE_MARGIN_DB = 8.0
+NOISE_FLOOR_MIN_DBFS = -60.0
+# Speech-only compaction: gaps shorter than this stay in, and kept speech is
+# padded on both sides so onsets and trailing consonants are not clipped.
+MIN_GAP_SECONDS = 1.0
+SPEECH_PAD_SECONDS = 0.25
+MIN_SAVED_FRACTION = 0.05  # below this, uploading the original is simpler
+_LEVEL_BLOCK_SECONDS = 300.0
+
+
+def _data_chunk(path: Path) -> tuple[int, int]:
+    """Return (offset, byte length) of the WAV `data` chunk."""
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            raise ValueError(f"not a RIFF/WAVE file: {path}")
+        while True:
+            head = f.read(8)
+            if len(head) < 8:
+                raise ValueError(f"WAV has no data chunk: {path}")
+            cid, n = head[:4], struct.unpack("<I", head[4:])[0]
+            if cid == b"data":
+                offset = f.tell()
+                # Streamed writers may leave a placeholder length; trust the file size
+                return offset, min(n, size - offset)
+            f.seek(n + (n & 1), 1)
+
+
+def open_pcm(path: Path | str | None) -> Any | None:
+    """Memory-map the samples of a canonical WAV as int16, or None if unavailable."""
+    if path is None:
+        return None
+    path = Path(path)
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    if not is_canonical_wav(path):
+        return None
+    try:
+        offset, nbytes = _data_chunk(path)
+    except (OSError, ValueError):
+        return None
+    if nbytes < 2:
+        return None
+    return np.memmap(path, dtype="<i2", mode="r", offset=offset, shape=(nbytes // 2,))
+
+
+def frame_levels(pcm: Any, start: float, end: float, *, frame_seconds: float = FRAME_SECONDS) -> Any:
+    """dBFS level of each `frame_seconds` frame in [start, end) of `pcm`."""
+    import numpy as np
+
+    hop = max(1, int(round(frame_seconds * CANONICAL_RATE)))
+    first = max(0, int(start * CANONICAL_RATE))
+    last = min(len(pcm), int(end * CANONICAL_RATE))
+    n = max(0, (last - first) // hop)
+    if n == 0:
+        return np.empty(0, dtype=np.float32)
+    x = np.asarray(pcm[first : first + n * hop], dtype=np.float32).reshape(n, hop)
+    power = np.einsum("ij,ij->i", x, x) / (hop * 32768.0 * 32768.0)
+    return (10.0 * np.log10(power + 1e-12)).astype(np.float32)
+
+
+def _smooth_db(levels: Any, frames: int) -> Any:
+    import numpy as np
+
+    if frames <= 1 or len(levels) < frames:
+        return levels
+    power = np.power(10.0, levels / 10.0)
+    kernel = np.ones(frames, dtype=np.float64) / frames
+    # 'valid' so every value covers a full window; pad back to align centres
+    avg = np.convolve(power, kernel, mode="valid")
+    pad = frames // 2
+    avg = np.pad(avg, (pad, len(levels) - len(avg) - pad), mode="edge")
+    return 10.0 * np.log10(avg + 1e-12)
+
+
+def silence_threshold(levels: Any) -> float:
+    """dBFS below which a smoothed frame counts as silence for this stretch."""
+    import numpy as np
+
+    if len(levels) == 0:
+        return SILENCE_DBFS
+    # Digital silence (-120 dB) would drag the floor below any real room noise
+    floor = max(NOISE_FLOOR_MIN_DBFS, float(np.percentile(levels, 5)))
+    return min(SILENCE_DBFS, floor + NOISE_MARGIN_DB)
+
+
+def find_silence(
+    pcm: Any,
+    lo: float,
+    hi: float,
+    *,
+    min_silence: float = MIN_SILENCE_SECONDS,
+    frame_seconds: float = FRAME_SECONDS,
+) -> float | None:
+    """Latest point in [lo, hi] inside a pause of at least `min_silence` seconds.
+
+    Returns the time (seconds) of the centre of the qualifying quiet window
+    closest to `hi`, or None when the stretch has no pause.
+    """
+    import numpy as np
+
+    lo = max(0.0, float(lo))
+    hi = min(float(hi), len(pcm) / CANONICAL_RATE)
+    if hi - lo < min_silence:
+        return None
+    levels = frame_levels(pcm, lo, hi, frame_seconds=frame_seconds)
+    frames = max(1, int(round(min_silence / frame_seconds)))
+    if len(levels) < frames:
+        return None
+    smooth = _smooth_db(levels, frames)
+    quiet = np.flatnonzero(smooth <= silence_threshold(levels))
+    # Centres within frames//2 of the edges are padded, not fully measured
+    quiet = quiet[(quiet >= frames // 2) & (quiet < len(levels) - frames // 2)]
+    if quiet.size == 0:
+        return None
+    return round(lo + float(quiet[-1]) * frame_seconds, 3)
+
+
+def speech_regions(
+    pcm: Any,
+    *,
+    min_gap: float = MIN_GAP_SECONDS,
+    pad: float = SPEECH_PAD_SECONDS,
+    frame_seconds: float = FRAME_SECONDS,
+) -> List[Tuple[float, float]]:
+    """(start, end) ranges of `pcm` that are not part of a silence of `min_gap`+ seconds.
+
+    Levels are computed block by block so memory stays bounded on long files;
+    the threshold is global to the file. Ranges are padded by `pad` and merged.
+    """
+    import numpy as np
+
+    duration = len(pcm) / CANONICAL_RATE
+    blocks = []
+    t = 0.0
+    while t < duration:
+        blocks.append(frame_levels(pcm, t, min(duration, t + _LEVEL_BLOCK_SECONDS), frame_seconds=frame_seconds))
+        t += _LEVEL_BLOCK_SECONDS
+    levels = np.concatenate(blocks) if blocks else np.empty(0, dtype=np.float32)
+    if len(levels) == 0:
+        return []
+    smooth = _smooth_db(levels, max(1, int(round(MIN_SILENCE_SECONDS / frame_seconds))))
+    loud = np.concatenate(([False], smooth > silence_threshold(levels), [False]))
+    edges = np.flatnonzero(np.diff(loud.astype(np.int8)))
+    regions: List[Tuple[float, float]] = []
+    for a, b in zip(edges[::2], edges[1::2]):
+        start = max(0.0, a * frame_seconds - pad)
+        end = min(duration, b * frame_seconds + pad)
+        if regions and start - regions[-1][1] < min_gap:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return [(round(float(a), 3), round(float(b), 3)) for a, b in regions]
+
+
+@dataclass
+class SpeechMap:
+    """Timeline mapping between a compacted WAV and its original.
+
+    `regions[i]` is the (start, end) original range copied to the compacted file
+    at offset `offsets[i]`; regions are back to back there.
+    """
+
+    path: Path
+    regions: List[Tuple[float, float]]
+    original_seconds: float
+    offsets: List[float] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.offsets:
+            acc = 0.0
+            for a, b in self.regions:
+                self.offsets.append(acc)
+                acc += b - a
+
+    @property
+    def speech_seconds(self) -> float:
+        return sum(b - a for a, b in self.regions)
+
+    def to_original(self, t: float, *, end: bool = False) -> float:
+        """Map compacted time `t` to the original timeline.
+
+        A time exactly at a join belongs to the later region, or to the
+        earlier one when `end` is set (so segment ends do not jump a gap).
+        """
+        if not self.regions:
+            return float(t)
+        find = bisect_left if end else bisect_right
+        i = min(len(self.regions) - 1, max(0, find(self.offsets, float(t)) - 1))
+        a, b = self.regions[i]
+        return round(min(b, a + max(0.0, float(t) - self.offsets[i])), 3)
+
+    def remap_segments(self, segments: Sequence["TranscriptSegment"]) -> List["TranscriptSegment"]:
+        out = []
+        for s in segments:
+            start = self.to_original(float(s.start))
+            update: dict[str, Any] = {"start": start, "end": max(start, self.to_original(float(s.end), end=True))}
+            if s.words:
+                update["words"] = [
+                    (self.to_original(ws), max(self.to_original(ws), self.to_original(we, end=True)), w)
+                    for ws, we, w in s.words
+                ]
+            out.append(s.model_copy(update=update))
+        return out
+
+
+def compact_speech(src: Path, dst: Path, **kwargs: Any) -> SpeechMap | None:
+    """Write the speech regions of canonical WAV `src` back to back into `dst`.
+
+    Returns None (and writes nothing) when the audio cannot be analysed or
+    when dropping silence would save less than `MIN_SAVED_FRACTION`.
+    """
+    pcm = open_pcm(src)
+    if pcm is None:
+        return None
+    total = len(pcm) / CANONICAL_RATE
+    regions = speech_regions(pcm, **kwargs)
+    if not regions or total - sum(b - a for a, b in regions) < MIN_SAVED_FRACTION * total:
+        return None
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(dst), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(CANONICAL_RATE)
+        for a, b in regions:
+            # Copied straight from the mapping in bounded blocks
+            first, last = int(round(a * CANONICAL_RATE)), int(round(b * CANONICAL_RATE))
+            for i in range(first, last, 1 << 18):
+                w.writeframesraw(pcm[i : min(last, i + (1 << 18))].tobytes())
+    return SpeechMap(path=dst, regions=regions, original_seconds=total)
+
+
+__all__ = [
+    "FRAME_SECONDS",
+    "MIN_SILENCE_SECONDS",
+    "SILENCE_DBFS",
+    "SpeechMap",
+    "compact_speech",
+    "find_silence",
+    "frame_levels",
+    "open_pcm",
+    "speech_regions",
+]
@@ -5,22 +5,105 @@ from __future__ import annotations
 Merges overlapping or duplicate segments while preserving time continuity.
 """
 
-from typing import List
+from typing import List, Sequence, Tuple
 import difflib
 
-from .models import TranscriptSegment
+from .models import TranscriptSegment, Word
 
 
 def _normalize_text(s: str) -> str:
     return " ".join(s.lower().strip().split())
 
 
+# Words compared on each side of a seam by `_similar`
+_SIMILAR_TOKENS = 24
+_PUNCT = ".,!?;:\"'()[]-"
+
+
+def _seam_tokens(s: str, *, tail: bool) -> list[str]:
+    parts = s.rsplit(None, _SIMILAR_TOKENS)[-_SIMILAR_TOKENS:] if tail else s.split(None, _SIMILAR_TOKENS)[:_SIMILAR_TOKENS]
+    return [t for t in (p.strip(_PUNCT) for p in parts) if t]
+
+
+def _tokens_match(ta: list[str], tb: list[str], threshold: float) -> bool:
+    if not ta or not tb:
+        return False
+    # ratio() <= 2*min(len)/(len(a)+len(b)): reject on length alone
+    if 2.0 * min(len(ta), len(tb)) < threshold * (len(ta) + len(tb)):
+        return False
+    return difflib.SequenceMatcher(None, ta, tb, autojunk=False).ratio() >= threshold
+
+
 def _similar(a: str, b: str, *, threshold: float = 0.8) -> bool:
+    """Whether normalized `a` and `b` read as the same words.
+
+    Compares word lists capped at `_SIMILAR_TOKENS`: `b`'s opening words
+    against `a`'s closing words (`b` continues `a`) or `a`'s opening words
+    (the same utterance transcribed twice), so the cost stays flat as a
+    merged segment keeps growing.
+    """
     if not a or not b:
         return False
     if a in b or b in a:
         return True
-    return difflib.SequenceMatcher(None, a, b).ratio() >= threshold
+    tb = _seam_tokens(b, tail=False)
+    return _tokens_match(_seam_tokens(a, tail=True), tb, threshold) or _tokens_match(
+        _seam_tokens(a, tail=False), tb, threshold
+    )
+
+
+# Candidate overlaps checked with C-level compares before switching to KMP
+_OVERLAP_ANCHOR = 8
+_OVERLAP_PROBES = 16
+
+
+def _overlap_len(a: str, b: str) -> int:
+    """Length of the longest prefix of `b` that is a suffix of `a`.
+
+    Equivalent to trying `a.endswith(b[:k])` for k from min(len(a), len(b))
+    down, which is quadratic. Ordinary text has few places where `b`'s opening
+    characters recur in `a`'s tail, so those are probed directly; repetitive
+    text (e.g. "ha ha ha", hallucination loops) falls back to linear KMP.
+    """
+    n = min(len(a), len(b))
+    if not n:
+        return 0
+    tail = a[len(a) - n:]
+    m = min(_OVERLAP_ANCHOR, n)
+    head = b[:m]
+    p = tail.find(head)
+    for _ in range(_OVERLAP_PROBES):
+        if p == -1:
+            # No overlap of length >= m; the few shorter ones are cheap to try
+            for k in range(m - 1, 0, -1):
+                if tail.endswith(b[:k]):
+                    return k
+            return 0
+        if b.startswith(tail[p:]):
+            return n - p
+        p = tail.find(head, p + 1)
+    return _kmp_overlap(tail, b)
+
+
+def _kmp_overlap(a: str, b: str) -> int:
+    """KMP: longest prefix of `b` that is a suffix of `a`, in O(len(a) + len(b))."""
+    fail = [0] * len(b)
+    k = 0
+    for i in range(1, len(b)):
+        while k and b[i] != b[k]:
+            k = fail[k - 1]
+        if b[i] == b[k]:
+            k += 1
+        fail[i] = k
+    k = 0
+    for ch in a:
+        if k == len(b):  # full match before the end of `a`: keep looking for a border
+            k = fail[k - 1]
+        while k and ch != b[k]:
+            k = fail[k - 1]
+        if ch == b[k]:
+            k += 1
+    return k
 
 
 def _merge_text_dedup(a: str, b: str) -> str:
@@ -37,14 +120,81 @@ def _merge_text_dedup(a: str, b: str) -> str:
     if bl in al:
         return a_s
     # Suffix-prefix overlap merge
-    max_k = min(len(a_s), len(b_s))
-    for k in range(max_k, 0, -1):
-        if a_s.endswith(b_s[:k]):
-            return a_s + b_s[k:]
+    k = _overlap_len(a_s, b_s)
+    if k:
+        return a_s + b_s[k:]
     # Default: join with space
     return a_s + " " + b_s
 
 
+def _merge_words(a: list[Word] | None, b: list[Word] | None) -> list[Word] | None:
+    # Text-merged duplicates: keep `a`'s words and only the later words of `b`
+    if not a or not b:
+        return None
+    last_end = float(a[-1][1])
+    return list(a) + [w for w in b if float(w[0]) >= last_end]
+
+
+def shift_words(words: Sequence[Word] | None, offset: float) -> list[Word] | None:
+    """Move chunk-local word timings onto the global timeline."""
+    if not words:
+        return None
+    return [(float(w0) + offset, float(w1) + offset, text) for w0, w1, text in words]
+
+
+def _words_text(words: Sequence[Word], like: str) -> str:
+    # Words are stored stripped; scripts written without spaces stay unspaced
+    sep = " " if " " in like.strip() else ""
+    return sep.join(w[2] for w in words if w[2]).strip()
+
+
+def _cut_segment(seg: TranscriptSegment, lo: float, hi: float) -> TranscriptSegment | None:
+    """Keep the part of `seg` whose words have their midpoint in [lo, hi)."""
+    if not seg.words:
+        return seg
+    kept = [w for w in seg.words if lo <= (float(w[0]) + float(w[1])) / 2.0 < hi]
+    if len(kept) == len(seg.words):
+        return seg
+    if not kept:
+        return None
+    text = _words_text(kept, seg.text)
+    if not text:
+        return None
+    # Keep the segment's own edge wherever its first/last word survived
+    start = float(seg.start) if kept[0] is seg.words[0] else float(kept[0][0])
+    end = float(seg.end) if kept[-1] is seg.words[-1] else float(kept[-1][1])
+    if end <= start:
+        end = start + 0.001
+    return TranscriptSegment(id=0, start=max(0.0, start), end=end, text=text, confidence=seg.confidence, words=kept)
+
+
+def stitch_chunks(
+    chunks: Sequence[Tuple[float, float, List[TranscriptSegment]]], *, epsilon: float = 0.01
+) -> List[TranscriptSegment]:
+    """Stitch per-chunk segments that overlap at chunk boundaries.
+
+    `chunks` holds (chunk_start, chunk_end, segments) in order, with segments
+    already on the global timeline. Where two chunks overlap, words are cut at
+    the midpoint of the overlap: the earlier chunk keeps words centred before
+    it and the later chunk the rest, so nothing is duplicated or dropped.
+    Segments without word timings pass through untouched; `stitch_segments`
+    then resolves whatever overlap remains heuristically.
+    """
+    # cuts[i] separates chunk i from chunk i + 1 (+inf when they do not overlap)
+    cuts: list[float] = []
+    for (_s0, e0, _), (s1, _e1, _) in zip(chunks, chunks[1:]):
+        cuts.append((float(s1) + float(e0)) / 2.0 if float(e0) > float(s1) else float("inf"))
+    out: List[TranscriptSegment] = []
+    for i, (_start, _end, segs) in enumerate(chunks):
+        lo = cuts[i - 1] if i > 0 and cuts[i - 1] != float("inf") else float("-inf")
+        hi = cuts[i] if i < len(cuts) else float("inf")
+        for seg in segs:
+            kept = _cut_segment(seg, lo, hi)
+            if kept is not None:
+                out.append(kept)
+    return stitch_segments(out, epsilon=epsilon)
+
+
 def stitch_segments(segments: List[TranscriptSegment], *, epsilon: float = 0.01) -> List[TranscriptSegment]:
     """Merge overlapping/duplicate segments and ensure monotonic timelines.
 
@@ -58,26 +208,32 @@ def stitch_segments(segments: List[TranscriptSegment], *, epsilon: float = 0.01)
     # Work on a sorted copy
     segs = sorted(segments, key=lambda s: (float(s.start), float(s.end)))
     out: List[TranscriptSegment] = []
+    last_norm: str | None = None  # normalized text of out[-1], computed lazily
     for s in segs:
         if not out:
-            out.append(TranscriptSegment(id=0, start=float(s.start), end=float(s.end), text=s.text, confidence=s.confidence))
+            out.append(TranscriptSegment(id=0, start=float(s.start), end=float(s.end), text=s.text, confidence=s.confidence, words=s.words))
             continue
         last = out[-1]
         # Overlap check
         if float(s.start) <= float(last.end) + epsilon:
-            a = _normalize_text(last.text)
+            if last_norm is None:
+                last_norm = _normalize_text(last.text)
             b = _normalize_text(s.text)
-            if _similar(a, b):
+            if _similar(last_norm, b):
                 # Merge into last
                 merged_text = _merge_text_dedup(last.text, s.text)
                 last.text = merged_text
                 last.end = max(float(last.end), float(s.end))
+                last.words = _merge_words(last.words, s.words)
+                last_norm = None
                 continue
             # No textual similarity: trim overlap
             start = max(float(s.start), float(last.end))
-            out.append(TranscriptSegment(id=0, start=start, end=float(s.end) if float(s.end) > start else start + 0.001, text=s.text, confidence=s.confidence))
+            out.append(TranscriptSegment(id=0, start=start, end=float(s.end) if float(s.end) > start else start + 0.001, text=s.text, confidence=s.confidence, words=s.words))
+            last_norm = b
         else:
-            out.append(TranscriptSegment(id=0, start=float(s.start), end=float(s.end), text=s.text, confidence=s.confidence))
+            out.append(TranscriptSegment(id=0, start=float(s.start), end=float(s.end), text=s.text, confidence=s.confidence, words=s.words))
+            last_norm = None
     # Renumber ids
     for i, s in enumerate(out):
         s.id = i
@@ -86,5 +242,7 @@ def stitch_segments(segments: List[TranscriptSegment], *, epsilon: float = 0.01)
 
 __all__ = [
     "stitch_segments",
+    "stitch_chunks",
+    "shift_words",
 ]
 
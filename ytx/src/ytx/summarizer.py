@@ -4,16 +4,151 @@ from __future__ import annotations
 
 Provides a small wrapper to summarize text snippets, used for per-chapter
 summaries when requested by the CLI.
+
+Long transcripts are summarized map-reduce style. Windows are packed from
+whole transcript segments up to a per-model token budget (`window_tokens_for`,
+estimated locally by `estimate_tokens`) and keep their time range; they are
+summarized concurrently (bounded, through the shared Gemini rate limiter and retries of
+`CloudEngineBase`), then the partial TL;DRs are reduced in a tree of fixed
+fan-in so no prompt grows with transcript length. Partial TL;DRs enter the
+reduce prompts prefixed with their `[start-end]` range.
+
+Every call is memoized in the cache index (`summaries` table), keyed by a
+digest of the whitespace-normalized text plus model, language, length limits
+and `PROMPT_VERSION`. Window summaries are cached individually, so editing one
+part of a transcript only re-summarizes the windows (and reduce groups) whose
+text changed.
 """
 
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Callable, Sequence, TypeVar
+import math
 
-from .engines.cloud_base import CloudEngineBase
+from .engines.cloud_base import DEFAULT_CHUNK_CONCURRENCY, CloudEngineBase
 from dotenv import load_dotenv
 from .engines.gemini_engine import _resolve_model_name  # reuse model selection
 
 
+from .config import _dumps
 from .errors import YTXError
+from .exporters.utils import seconds_to_hhmmss
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from .models import TranscriptSegment
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+PROMPT_VERSION = 2  # bump when prompts or parsing change so cached summaries are not reused
+REDUCE_FAN_IN = 8  # partial TL;DRs combined per reduce call
+# Window budgets (estimated tokens of transcript per map call), by model prefix.
+# Far below the context limits: summaries of very large windows lose detail.
+MODEL_WINDOW_TOKENS: tuple[tuple[str, int], ...] = (
+    ("gemini-2.5", 24000),
+    ("gemini-2.0", 16000),
+    ("gemini-1.5", 16000),
+)
+DEFAULT_WINDOW_TOKENS = 8000
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate: ~4 ASCII characters per token, one per other character.
+
+    Overestimates accented Latin text slightly and is close for CJK, which is
+    the safe side for a budget.
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def window_tokens_for(model: str) -> int:
+    m = (model or "").lower()
+    for prefix, budget in MODEL_WINDOW_TOKENS:
+        if m.startswith(prefix):
+            return budget
+    return DEFAULT_WINDOW_TOKENS
+
+
+@dataclass
+class SummaryWindow:
+    """Consecutive transcript text within one token budget and its time range."""
+
+    text: str
+    tokens: int
+    start: float | None = None
+    end: float | None = None
+
+    @property
+    def label(self) -> str:
+        if self.start is None or self.end is None:
+            return ""
+        return f"[{seconds_to_hhmmss(self.start)}-{seconds_to_hhmmss(self.end)}]"
+
+
+def _split_words(text: str, max_tokens: int) -> List[str]:
+    """Split one oversized unit on word boundaries into pieces within `max_tokens`."""
+    pieces: List[str] = []
+    cur: List[str] = []
+    used = 0
+    for w in text.split():
+        n = estimate_tokens(w) + 1
+        if cur and used + n > max_tokens:
+            pieces.append(" ".join(cur))
+            cur, used = [], 0
+        cur.append(w)
+        used += n
+    if cur:
+        pieces.append(" ".join(cur))
+    return pieces
+
+
+def pack_windows(
+    segments: "Sequence[TranscriptSegment] | str", *, max_tokens: int = DEFAULT_WINDOW_TOKENS
+) -> List[SummaryWindow]:
+    """Greedily pack whole segments (or lines of a plain string) into windows.
+
+    A window is closed before the segment that would take it over `max_tokens`;
+    only a single segment larger than the budget is split, on word boundaries.
+    """
+    if isinstance(segments, str):
+        units: List[tuple[str, float | None, float | None]] = [
+            (line.strip(), None, None) for line in segments.splitlines() if line.strip()
+        ]
+    else:
+        units = [(s.text.strip(), float(s.start), float(s.end)) for s in segments if s.text and s.text.strip()]
+    budget = max(1, int(max_tokens))
+    windows: List[SummaryWindow] = []
+    cur: List[str] = []
+    used = 0
+    start: float | None = None
+    end: float | None = None
+
+    def close() -> None:
+        nonlocal cur, used, start, end
+        if cur:
+            windows.append(SummaryWindow(text="\n".join(cur), tokens=used, start=start, end=end))
+        cur, used, start, end = [], 0, None, None
+
+    for text, s0, s1 in units:
+        n = estimate_tokens(text) + 1
+        if n > budget:
+            close()
+            windows.extend(SummaryWindow(text=p, tokens=estimate_tokens(p), start=s0, end=s1) for p in _split_words(text, budget))
+            continue
+        if cur and used + n > budget:
+            close()
+        if not cur:
+            start = s0
+        cur.append(text)
+        used += n
+        end = s1 if s1 is not None else end
+    close()
+    return windows
 
 
 class SummarizerError(YTXError):
@@ -53,9 +188,29 @@ def _ensure_client() -> None:
 
 
 class GeminiSummarizer(CloudEngineBase):
-    def __init__(self, model: str = "gemini-2.5-flash") -> None:
+    name = "gemini"  # shares the Gemini request bucket with transcription
+
+    _cache: Any = None
+
+    def __init__(
+        self,
+        model: str = "gemini-2.5-flash",
+        *,
+        concurrency: int | None = None,
+        window_tokens: int | None = None,
+        cache: bool = True,
+    ) -> None:
         _ensure_client()
+        self.concurrency = max(1, int(concurrency or DEFAULT_CHUNK_CONCURRENCY["gemini"]))
+        if cache:
+            try:
+                from .cache import _open_index
+
+                self._cache = _open_index()
+            except Exception as e:  # a broken cache must not block summaries
+                logger.debug("Summary cache unavailable: %s", e)
         self.model_name = _resolve_model_name(model)
+        self.window_tokens = max(1, int(window_tokens or window_tokens_for(self.model_name)))
         import google.generativeai as genai  # type: ignore
 
         self._model = genai.GenerativeModel(self.model_name)  # type: ignore[attr-defined]
@@ -63,6 +218,12 @@ class GeminiSummarizer(CloudEngineBase):
     def summarize(self, text: str, *, language: Optional[str] = None, max_chars: int = 500) -> str:
         if not text or not text.strip():
             return ""
+        return self._cached(
+            "text", text, {"language": language, "max_chars": max_chars},
+            lambda: self._summarize(text, language=language, max_chars=max_chars),
+        )
+
+    def _summarize(self, text: str, *, language: Optional[str], max_chars: int) -> str:
         # Build concise prompt
         lang_clause = f" in {language}" if language else ""
         prompt = (
@@ -77,6 +238,12 @@ class GeminiSummarizer(CloudEngineBase):
     def summarize_structured(self, text: str, *, language: Optional[str] = None, bullets: int = 5, max_tldr: int = 500) -> Dict[str, Any]:
         if not text or not text.strip():
             return {"tldr": "", "bullets": []}
+        return self._cached(
+            "structured", text, {"language": language, "bullets": bullets, "max_tldr": max_tldr},
+            lambda: self._summarize_structured(text, language=language, bullets=bullets, max_tldr=max_tldr),
+        )
+
+    def _summarize_structured(self, text: str, *, language: Optional[str], bullets: int, max_tldr: int) -> Dict[str, Any]:
         lang_clause = f" in {language}" if language else ""
         prompt = (
             "You are a concise summarizer. "
@@ -106,34 +273,162 @@ class GeminiSummarizer(CloudEngineBase):
         bl = [str(x).strip()[:100] for x in bl if str(x).strip()]
         return {"tldr": t[:max_tldr], "bullets": bl[:bullets]}
 
-    def summarize_long(self, text: str, *, language: Optional[str] = None, bullets: int = 5, max_tldr: int = 500) -> Dict[str, Any]:
-        """Hierarchical summarization for long transcripts using sliding windows.
+    def summarize_many(
+        self, texts: Sequence[str], *, language: Optional[str] = None, max_chars: int = 500
+    ) -> List[str]:
+        """`summarize` each of `texts`, up to `concurrency` requests at a time; order is kept."""
+
+        def one(_idx: int, text: str) -> str:
+            return self.summarize(text, language=language, max_chars=max_chars) if text and text.strip() else ""
 
-        Chunks text into ~4000-char windows, summarizes each, then summarizes the
-        concatenated per-chunk TLDRs into a final structured summary.
+        return self._map_items(texts, one, workers=self.concurrency)
+
+    def summarize_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        titles: Optional[Sequence[str]] = None,
+        language: Optional[str] = None,
+        max_chars: int = 500,
+    ) -> List[str]:
+        """Summarize several texts (e.g. chapters) with one structured request per window.
+
+        Texts are grouped up to `window_tokens`, so usually a single request
+        covers all of them. A group whose response does not parse as a JSON
+        array of the right length falls back to `summarize_many`.
         """
-        s = (text or "").strip()
-        if not s:
+        names = list(titles) if titles is not None else [""] * len(texts)
+        items = [(i, names[i] or f"Part {i + 1}", t.strip()) for i, t in enumerate(texts) if t and t.strip()]
+        groups: List[List[tuple[int, str, str]]] = []
+        used = 0
+        for item in items:
+            n = estimate_tokens(item[2]) + estimate_tokens(item[1]) + 4
+            if not groups or used + n > self.window_tokens:
+                groups.append([])
+                used = 0
+            groups[-1].append(item)
+            used += n
+
+        def run(_idx: int, group: List[tuple[int, str, str]]) -> List[str]:
+            body = "\n\n".join(f"### {k + 1}. {title}\n{text}" for k, (_, title, text) in enumerate(group))
+            return self._cached(
+                "batch", body, {"language": language, "max_chars": max_chars, "n": len(group)},
+                lambda: self._summarize_batch(body, group, language=language, max_chars=max_chars),
+            )
+
+        out = [""] * len(texts)
+        for group, summaries in zip(groups, self._map_items(groups, run, workers=self.concurrency)):
+            for (i, _, _), summ in zip(group, summaries):
+                out[i] = summ
+        return out
+
+    def _summarize_batch(
+        self, body: str, group: Sequence[tuple[int, str, str]], *, language: Optional[str], max_chars: int
+    ) -> List[str]:
+        lang_clause = f" in {language}" if language else ""
+        prompt = (
+            f"Summarize each of the {len(group)} numbered sections below concisely{lang_clause}, "
+            f"each in plain text under {max_chars} characters. "
+            f"Return STRICT JSON only: an array of exactly {len(group)} strings, in section order."
+        )
+        resp = self._generate_with_retries(self._model, [prompt, body], timeout=180, attempts=3)
+        payload = self._strip_code_fences(getattr(resp, "text", None) or "")
+        try:
+            import json as _json
+
+            data = _json.loads(payload)
+        except Exception:
+            data = None
+        if isinstance(data, list) and len(data) == len(group):
+            return [str(x).strip()[:max_chars] for x in data]
+        logger.debug("Batched summary did not return %d items; summarizing one by one", len(group))
+        return self.summarize_many([t for _, _, t in group], language=language, max_chars=max_chars)
+
+    def summarize_long(
+        self,
+        text: "str | Sequence[TranscriptSegment]",
+        *,
+        language: Optional[str] = None,
+        bullets: int = 5,
+        max_tldr: int = 500,
+    ) -> Dict[str, Any]:
+        """Hierarchical summarization for long transcripts.
+
+        `text` is a list of transcript segments (preferred: windows stay on
+        segment boundaries and carry time ranges) or a plain string, packed by
+        line. Windows of up to `window_tokens` are summarized concurrently, then
+        the per-window TLDRs are reduced `REDUCE_FAN_IN` at a time until one
+        final structured summary is left.
+        """
+        windows = pack_windows(text, max_tokens=self.window_tokens)
+        if not windows:
             return {"tldr": "", "bullets": []}
-        win = 4000
-        if len(s) <= win:
-            return self.summarize_structured(s, language=language, bullets=bullets, max_tldr=max_tldr)
-        parts: List[str] = []
-        start = 0
-        while start < len(s):
-            end = min(len(s), start + win)
-            # slight overlap of 200 chars
-            parts.append(s[start:end])
-            if end >= len(s):
-                break
-            start = end - 200
-        # Summarize each chunk and combine TLDRs
-        tldrs: List[str] = []
-        for chunk in parts:
+        if len(windows) == 1:
+            return self.summarize_structured(windows[0].text, language=language, bullets=bullets, max_tldr=max_tldr)
+        params = {
+            "language": language, "bullets": bullets, "max_tldr": max_tldr,
+            "window_tokens": self.window_tokens, "fan_in": REDUCE_FAN_IN,
+        }
+        # Time ranges feed the reduce prompts, so they are part of the key
+        key_text = "\n".join(f"{w.label} {w.text}" for w in windows)
+        return self._cached(
+            "long", key_text, params,
+            lambda: self._summarize_long(windows, language=language, bullets=bullets, max_tldr=max_tldr),
+        )
+
+    def _summarize_long(
+        self, windows: Sequence[SummaryWindow], *, language: Optional[str], bullets: int, max_tldr: int
+    ) -> Dict[str, Any]:
+        def summarize(_idx: int, chunk: str) -> str:
             r = self.summarize_structured(chunk, language=language, bullets=bullets, max_tldr=max_tldr)
-            tldrs.append(r.get("tldr", ""))
-        combined = "\n".join(x for x in tldrs if x)
-        return self.summarize_structured(combined, language=language, bullets=bullets, max_tldr=max_tldr)
+            return r.get("tldr", "")
+
+        def anchored(parts: Sequence[SummaryWindow]) -> str:
+            return "\n".join(f"{p.label} {p.text}".strip() for p in parts)
+
+        tldrs = self._map_items(windows, lambda i, w: summarize(i, w.text), workers=self.concurrency)
+        level = [SummaryWindow(text=t, tokens=0, start=w.start, end=w.end) for w, t in zip(windows, tldrs) if t]
+        while len(level) > REDUCE_FAN_IN:
+            groups = [level[i : i + REDUCE_FAN_IN] for i in range(0, len(level), REDUCE_FAN_IN)]
+            # A trailing single TLDR is carried up as is rather than re-summarized
+            reduced = self._map_items(
+                groups, lambda i, g: g[0].text if len(g) == 1 else summarize(i, anchored(g)), workers=self.concurrency
+            )
+            level = [
+                SummaryWindow(text=t, tokens=0, start=g[0].start, end=g[-1].end)
+                for g, t in zip(groups, reduced)
+                if t
+            ]
+        return self.summarize_structured(anchored(level), language=language, bullets=bullets, max_tldr=max_tldr)
+
+    def _cached(self, kind: str, text: str, params: Dict[str, Any], compute: Callable[[], T]) -> T:
+        """Return the cached result for (`kind`, normalized `text`, `params`), else compute and store it."""
+        cache = self._cache
+        if cache is None:
+            return compute()
+        key_input = {
+            "kind": kind,
+            "text": sha256(" ".join(text.split()).encode("utf-8")).hexdigest(),
+            "model": self.model_name,
+            "prompt": PROMPT_VERSION,
+            **params,
+        }
+        key = sha256(_dumps(key_input).encode("utf-8")).hexdigest()
+        try:
+            hit = cache.get_summary(key)
+            if hit is not None:
+                import json as _json
+
+                return _json.loads(hit)
+        except Exception as e:
+            logger.debug("Summary cache read failed: %s", e)
+        value = compute()
+        if value and (not isinstance(value, dict) or value.get("tldr") or value.get("bullets")):
+            try:
+                cache.put_summary(key, _dumps(value), kind=kind, model=self.model_name)
+            except Exception as e:
+                logger.debug("Summary cache write failed: %s", e)
+        return value
 
     def _strip_code_fences(self, s: str) -> str:
         t = (s or "").strip()
@@ -147,4 +442,12 @@ class GeminiSummarizer(CloudEngineBase):
         return t
 
 
-__all__ = ["GeminiSummarizer", "SummarizerError"]
+__all__ = [
+    "PROMPT_VERSION",
+    "GeminiSummarizer",
+    "SummarizerError",
+    "SummaryWindow",
+    "estimate_tokens",
+    "pack_windows",
+    "window_tokens_for",
+]
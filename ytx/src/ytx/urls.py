@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+"""YouTube URL parsing helpers (stdlib only; cheap to import)."""
+
+import re
+
+_YT_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_HOST_RE = re.compile(r"^(?:.+\.)?(youtube\.com|youtu\.be|youtube-nocookie\.com)$", re.I)
+
+
+def extract_video_id(url: str) -> str | None:
+    """Extract the 11-char YouTube video ID from common URL shapes.
+
+    Supports:
+    - https://www.youtube.com/watch?v=VIDEOID
+    - https://youtu.be/VIDEOID
+    - https://www.youtube.com/shorts/VIDEOID
+    - https://www.youtube.com/live/VIDEOID
+    - https://www.youtube.com/embed/VIDEOID
+    - music.youtube.com/watch?v=VIDEOID
+    Ignores extra params like `t=`, `si=`, `feature=`.
+    """
+    from urllib.parse import urlparse, parse_qs
+
+    s = url.strip()
+    if not s:
+        return None
+    # Handle bare IDs passed by user
+    if _YT_ID_RE.match(s):
+        return s
+
+    parsed = urlparse(s)
+    host = (parsed.netloc or "").lower()
+    host = host.split(":")[0]
+    if not _HOST_RE.match(host):
+        return None
+
+    path = parsed.path or ""
+    # youtu.be/<id>
+    if host.endswith("youtu.be"):
+        parts = [p for p in path.split("/") if p]
+        if parts:
+            candidate = parts[0]
+            return candidate if _YT_ID_RE.match(candidate) else None
+
+    # youtube.com/watch?v=<id>
+    qs = parse_qs(parsed.query)
+    v = qs.get("v", [None])[0]
+    if v and _YT_ID_RE.match(v):
+        return v
+
+    # youtube.com/shorts/<id>, /live/<id>, /embed/<id>
+    parts = [p for p in path.split("/") if p]
+    if parts:
+        if parts[0] in {"shorts", "live", "embed"} and len(parts) >= 2:
+            candidate = parts[1]
+            return candidate if _YT_ID_RE.match(candidate) else None
+
+    return None
+
+
+def is_youtube_url(url: str) -> bool:
+    """Return True if URL appears to reference a specific YouTube video."""
+    return extract_video_id(url) is not None
+
+
+def canonical_url(video_id: str) -> str:
+    """Return a canonical short URL for the given video id."""
+    if not _YT_ID_RE.match(video_id):
+        raise ValueError("Invalid YouTube video id")
+    return f"https://youtu.be/{video_id}"
+
+
+__all__ = ["extract_video_id", "is_youtube_url", "canonical_url"]
@@ -0,0 +1,143 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import asyncio
+import json
+import threading
+import time
+
+from ytx.batch import BatchPipeline
+from ytx.config import AppConfig
+from ytx.engines.base import AsyncTranscriptionEngine, transcribe_async
+from ytx.http_pool import connection_stats, reset_stats
+from ytx.models import TranscriptSegment, VideoMetadata
+
+
+class _Deepgram(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    active = peak = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.1)
+        with cls.lock:
+            cls.active -= 1
+        utt = [{"start": 0.0, "end": 0.5, "transcript": body.decode()}]
+        out = json.dumps({"results": {"channels": [{"alternatives": [{"utterances": utt}]}]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_deepgram_async_sends_chunks_concurrently_on_one_loop(monkeypatch, tmp_path: Path):
+    from ytx.engines.deepgram_engine import DeepgramEngine
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Deepgram)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "k" * 32)
+    monkeypatch.setattr("ytx.engines.cloud_base.plan_chunks", lambda total, **_: [(0.0, 600.0), (600.0, 1200.0), (1200.0, 1500.0)])
+    monkeypatch.setattr(
+        "ytx.engines.cloud_base.slice_wav_segment",
+        lambda src, dst, *, start, end: Path(dst).write_bytes(f"chunk@{int(start)}".encode()) and Path(dst),
+    )
+    eng = DeepgramEngine()
+    monkeypatch.setattr(eng, "_probe_duration_safe", lambda p: 1500.0)
+    monkeypatch.setattr(eng, "_endpoint", lambda cfg: f"http://127.0.0.1:{srv.server_address[1]}/v1/listen")
+    assert isinstance(eng, AsyncTranscriptionEngine)
+    wav = tmp_path / "a.wav"
+    wav.write_bytes(b"RIFF")
+    cfg = AppConfig(engine="deepgram", upload_codec="wav", chunk_concurrency=3, provider_rate_limit=6000)
+    reset_stats()
+    try:
+        segs = asyncio.run(transcribe_async(eng, wav, config=cfg))
+    finally:
+        srv.shutdown()
+        srv.server_close()
+    assert [(s.start, s.text) for s in segs] == [(0.0, "chunk@0"), (600.0, "chunk@600"), (1200.0, "chunk@1200")]
+    assert _Deepgram.peak == 3
+    assert connection_stats()["deepgram"]["requests"] == 3
+
+
+def test_sync_and_async_paths_share_the_untimed_collapse(monkeypatch, tmp_path: Path):
+    from ytx.engines.openai_engine import OpenAIEngine
+
+    segs = [TranscriptSegment(id=0, start=0.0, end=1.0, text="a"), TranscriptSegment(id=1, start=1.0, end=2.5, text="b")]
+    eng = OpenAIEngine()
+    monkeypatch.setattr(eng, "_probe_duration_safe", lambda p: 3.0)
+    monkeypatch.setattr(eng, "_transcribe_single", lambda path, *, config, on_progress=None: segs)
+
+    async def single_async(path, *, config):
+        return segs
+
+    monkeypatch.setattr(eng, "_transcribe_single_async", single_async)
+    cfg = AppConfig(engine="openai", timestamp_policy="none")
+    sync_out = eng.transcribe(tmp_path / "a.wav", config=cfg)
+    async_out = asyncio.run(eng.transcribe_async(tmp_path / "a.wav", config=cfg))
+    assert [(s.start, s.end, s.text) for s in sync_out] == [(0.0, 2.5, "a b")]
+    assert async_out == sync_out
+
+
+def test_batch_async_stage_keeps_videos_in_flight(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("YTX_CACHE_DIR", str(tmp_path / "cache"))
+    state = {"active": 0, "peak": 0, "engines": 0}
+
+    class AsyncEngine:
+        name = "fake"
+
+        def __init__(self):
+            state["engines"] += 1
+
+        async def transcribe_async(self, audio_path, *, config, on_progress=None):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.05)
+            state["active"] -= 1
+            return [TranscriptSegment(id=0, start=0.0, end=0.5, text="hi")]
+
+        def detect_language(self, audio_path, *, config):
+            return "en"
+
+    def fetch(url, **kwargs):
+        vid = url.rsplit("/", 1)[-1]
+        return VideoMetadata(id=vid, title=vid, duration=1.0, url=url)
+
+    def download(meta, out_dir, **kwargs):
+        p = Path(out_dir) / f"{meta.id}.wav"
+        p.write_bytes(b"RIFF")
+        return p
+
+    urls = [f"https://youtu.be/{c * 11}" for c in "ABCDEF"]
+    report = BatchPipeline(
+        AppConfig(engine="deepgram"),
+        engine_factory=AsyncEngine,
+        download_workers=6,
+        transcribe_workers=4,
+        async_transcribe=True,
+        fetch=fetch,
+        download=download,
+        normalize=lambda src, dst, **kw: src,
+    ).run(urls)
+    assert report.done == 6 and report.failed == 0
+    # Several videos in flight on one loop thread; an engine serves one video at a time
+    assert 1 < state["peak"] <= 4 and state["engines"] == state["peak"]
+
+
+def test_sync_engines_run_on_the_executor():
+    class SyncEngine:
+        name = "local"
+
+        def transcribe(self, audio_path, *, config, on_progress=None):
+            return [TranscriptSegment(id=0, start=0.0, end=1.0, text=threading.current_thread().name)]
+
+    assert not isinstance(SyncEngine(), AsyncTranscriptionEngine)
+    segs = asyncio.run(transcribe_async(SyncEngine(), Path("x.wav"), config=AppConfig()))
+    assert segs[0].text != threading.current_thread().name
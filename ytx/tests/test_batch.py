@@ -0,0 +1,135 @@
+from pathlib import Path
+import threading
+import time
+
+from ytx.batch import BatchPipeline, read_url_file
+from ytx.config import AppConfig
+from ytx.models import TranscriptSegment, VideoMetadata
+
+
+def _fake_stages(tmp_path: Path, events: list, *, fail_id: str | None = None):
+    lock = threading.Lock()
+
+    def log(ev):
+        with lock:
+            events.append(ev)
+
+    def fetch(url, **kwargs):
+        vid = url.rsplit("/", 1)[-1]
+        return VideoMetadata(id=vid, title=f"T {vid}", duration=1.0, url=url)
+
+    def download(meta, out_dir, **kwargs):
+        assert kwargs.get("show_progress") is False
+        if meta.id == fail_id:
+            raise RuntimeError("boom")
+        log(("download", meta.id))
+        time.sleep(0.02)
+        p = Path(out_dir) / f"{meta.id}.m4a"
+        p.write_bytes(b"x")
+        return p
+
+    def normalize(src, dst, **kwargs):
+        Path(dst).write_bytes(b"RIFF")
+        return Path(dst)
+
+    class Engine:
+        def transcribe(self, audio_path, *, config, on_progress=None):
+            log(("transcribe-start", Path(audio_path).stem))
+            time.sleep(0.05)
+            log(("transcribe-end", Path(audio_path).stem))
+            return [TranscriptSegment(id=0, start=0.0, end=0.5, text="Hello")]
+
+        def detect_language(self, audio_path, *, config):
+            return "en"
+
+    return fetch, download, normalize, Engine
+
+
+def test_batch_pipeline_processes_and_skips_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("YTX_CACHE_DIR", str(tmp_path / "cache"))
+    events: list = []
+    fetch, download, normalize, Engine = _fake_stages(tmp_path, events, fail_id="CCCCCCCCCCC")
+    cfg = AppConfig(engine="whisper", model="small")
+    urls = [f"https://youtu.be/{c * 11}" for c in "ABC"]
+
+    pipe = BatchPipeline(
+        cfg,
+        engine_factory=Engine,
+        download_workers=2,
+        fetch=fetch,
+        download=download,
+        normalize=normalize,
+    )
+    report = pipe.run(urls)
+    assert report.done == 2 and report.failed == 1 and report.cached == 0
+    assert report.videos_per_hour > 0
+    failed = [it for it in report.items if it.status == "failed"]
+    assert failed[0].stage == "download" and "boom" in (failed[0].error or "")
+    # Second download finishes before the first transcription ends (stages overlap)
+    assert events.index(("download", "BBBBBBBBBBB")) < events.index(("transcribe-end", "AAAAAAAAAAA")) or \
+        events.index(("download", "AAAAAAAAAAA")) < events.index(("transcribe-end", "BBBBBBBBBBB"))
+
+    # A rerun hits the cache for the successful videos
+    report2 = BatchPipeline(cfg, engine_factory=Engine, fetch=fetch, download=download, normalize=normalize).run(urls[:2])
+    assert report2.cached == 2 and report2.done == 0
+
+
+def test_batch_pipeline_rejects_invalid_url(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("YTX_CACHE_DIR", str(tmp_path))
+    fetch, download, normalize, Engine = _fake_stages(tmp_path, [])
+    pipe = BatchPipeline(AppConfig(), engine_factory=Engine, fetch=fetch, download=download, normalize=normalize)
+    report = pipe.run(["https://example.com/nope"])
+    assert report.failed == 1 and report.items[0].stage is None
+
+
+def test_read_url_file(tmp_path: Path):
+    f = tmp_path / "urls.txt"
+    f.write_text("# comment\nhttps://youtu.be/AAAAAAAAAAA\n\n  https://youtu.be/BBBBBBBBBBB  \n", encoding="utf-8")
+    assert read_url_file(f) == ["https://youtu.be/AAAAAAAAAAA", "https://youtu.be/BBBBBBBBBBB"]
+
+
+def test_batch_stream_download_skips_normalize(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("YTX_CACHE_DIR", str(tmp_path / "cache"))
+    events: list = []
+    fetch, download, _normalize, Engine = _fake_stages(tmp_path, events)
+
+    def stream(meta, dst, **kwargs):
+        Path(dst).write_bytes(b"RIFF")
+        return Path(dst)
+
+    def normalize(src, dst, **kwargs):
+        raise AssertionError("normalize must be skipped for streamed downloads")
+
+    cfg = AppConfig(engine="whisper", model="small", stream_download=True)
+    report = BatchPipeline(
+        cfg, engine_factory=Engine, fetch=fetch, download=download, normalize=normalize, stream=stream
+    ).run(["https://youtu.be/DDDDDDDDDDD"])
+    assert report.done == 1
+    assert ("download", "DDDDDDDDDDD") not in events
+
+
+def test_batch_passes_accepted_downloads_straight_to_engine(tmp_path: Path, monkeypatch):
+    from ytx.engines.base import accepts_input
+    from ytx.engines.gemini_engine import GeminiEngine
+    from ytx.engines.openai_engine import OpenAIEngine
+
+    monkeypatch.setenv("YTX_CACHE_DIR", str(tmp_path / "cache"))
+    fetch, download, _normalize, Engine = _fake_stages(tmp_path, [])
+    seen: list[str] = []
+
+    class Recorder(Engine):
+        def transcribe(self, audio_path, *, config, on_progress=None):
+            seen.append(Path(audio_path).suffix)
+            return super().transcribe(audio_path, config=config, on_progress=on_progress)
+
+    def normalize(src, dst, **kwargs):
+        raise AssertionError("openai takes m4a downloads as is")
+
+    report = BatchPipeline(
+        AppConfig(engine="openai", model="whisper-1"), engine_factory=Recorder, fetch=fetch, download=download, normalize=normalize
+    ).run(["https://youtu.be/EEEEEEEEEEE"])
+    assert report.done == 1 and seen == [".m4a"]
+    m4a = Path("a.m4a")
+    assert not accepts_input(GeminiEngine, m4a, config=AppConfig(engine="gemini"))
+    assert not accepts_input(OpenAIEngine, m4a, config=AppConfig(engine="openai", speech_only=True))
+    assert not accepts_input(OpenAIEngine, m4a, config=AppConfig(engine="openai", upload_codec="flac"))
@@ -0,0 +1,66 @@
+from pathlib import Path
+import os
+
+from ytx import audio, downloader
+from ytx.blobs import blob_root, prune_blobs
+from ytx.cache import clear_cache, iter_artifact_dirs
+from ytx.models import VideoMetadata
+
+
+def test_normalize_reuses_wav_blob(tmp_path: Path, monkeypatch):
+    calls: list = []
+
+    class Proc:
+        returncode = 0
+        stderr = ""
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        Path(cmd[-1]).write_bytes(b"RIFF-normalized")
+        return Proc()
+
+    monkeypatch.setattr(audio, "ensure_ffmpeg", lambda: None)
+    monkeypatch.setattr(audio.subprocess, "run", fake_run)
+    blobs = blob_root(tmp_path)
+    src_a = tmp_path / "a" / "VID.m4a"
+    src_b = tmp_path / "b" / "VID.m4a"
+    for p in (src_a, src_b):
+        p.parent.mkdir()
+        p.write_bytes(b"same audio bytes")
+
+    wav_a = audio.normalize_wav(src_a, tmp_path / "a" / "VID.wav", blob_root=blobs)
+    wav_b = audio.normalize_wav(src_b, tmp_path / "b" / "VID.wav", blob_root=blobs)
+    assert len(calls) == 1
+    assert wav_b.read_bytes() == b"RIFF-normalized"
+    assert os.path.samefile(wav_a, wav_b)
+
+
+def test_download_reuses_audio_blob_and_prunes(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("shutil.which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(downloader, "ensure_ffmpeg", lambda: None)
+    downloads: list = []
+
+    def fake_once(meta, out_dir, expected, **kwargs):
+        downloads.append(out_dir)
+        expected.write_bytes(b"m4a bytes")
+        return expected
+
+    monkeypatch.setattr(downloader, "_download_audio_once", fake_once)
+    meta = VideoMetadata(id="AAAAAAAAAAA", title="t", duration=1.0, url="https://youtu.be/AAAAAAAAAAA")
+    blobs = blob_root(tmp_path)
+    d1 = tmp_path / "AAAAAAAAAAA" / "whisper" / "small" / "h1"
+    d2 = tmp_path / "AAAAAAAAAAA" / "openai" / "whisper-1" / "h2"
+    a1 = downloader.download_audio(meta, d1, max_abr_kbps=96, blob_root=blobs)
+    a2 = downloader.download_audio(meta, d2, max_abr_kbps=96, blob_root=blobs)
+    assert downloads == [d1]
+    assert a2.parent == d2 and os.path.samefile(a1, a2)
+    # A different format selection is a different blob
+    downloader.download_audio(meta, tmp_path / "AAAAAAAAAAA" / "whisper" / "base" / "h3", max_abr_kbps=None, blob_root=blobs)
+    assert len(downloads) == 2
+
+    # The blob store is not mistaken for an artifact directory
+    assert all(".blobs" not in d.parts for d in iter_artifact_dirs(tmp_path))
+    # Once no artifact set links to a blob it is pruned
+    assert prune_blobs(tmp_path) == (0, 0)
+    clear_cache(tmp_path, video_id="AAAAAAAAAAA")
+    assert not [p for p in blobs.rglob("*") if p.is_file()]
@@ -0,0 +1,73 @@
+from pathlib import Path
+import json
+
+import pytest
+
+from ytx.cache import (
+    artifact_paths_for,
+    build_artifact_paths,
+    build_meta_payload,
+    gc_cache,
+    parse_size,
+    read_transcript_doc,
+    scan_cache,
+    write_meta,
+)
+from ytx.cache_index import CacheIndex
+from ytx.config import AppConfig
+
+
+def _make_entry(root: Path, vid: str, *, wav_bytes: int = 4000) -> Path:
+    cfg = AppConfig(engine="whisper", model="small")
+    paths = build_artifact_paths(video_id=vid, engine="whisper", model="small", config_hash=cfg.config_hash(), root=root, create=True)
+    doc = {"video_id": vid, "source_url": f"https://youtu.be/{vid}", "engine": "whisper", "model": "small", "segments": []}
+    paths.transcript_json.write_text(json.dumps(doc), encoding="utf-8")
+    paths.captions_srt.write_text("1\n00:00:00,000 --> 00:00:00,500\nHi\n", encoding="utf-8")
+    (paths.dir / f"{vid}.wav").write_bytes(b"\0" * wav_bytes)
+    (paths.dir / "chapters").mkdir()
+    (paths.dir / "chapters" / "chapter_000.wav").write_bytes(b"\0" * wav_bytes)
+    write_meta(paths, build_meta_payload(video_id=vid, config=cfg))
+    return paths.dir
+
+
+def test_gc_trims_intermediates_before_evicting(tmp_path: Path):
+    dirs = [_make_entry(tmp_path, vid) for vid in ("AAAAAAAAAAA", "BBBBBBBBBBB", "CCCCCCCCCCC")]
+    idx = CacheIndex(tmp_path)
+    for i, d in enumerate(dirs):
+        idx.touch(d, when=1000.0 + i)
+    total = sum(e.size_bytes for e in scan_cache(tmp_path))
+
+    # Dropping the oldest set's audio (8000 bytes) is enough: nothing is evicted
+    rep = gc_cache(total - 5000, root=tmp_path)
+    assert rep.removed == [] and rep.size_after <= total - 5000
+    assert not (dirs[0] / "AAAAAAAAAAA.wav").exists() and not (dirs[0] / "chapters").exists()
+    assert (dirs[0] / "transcript.json").exists()
+    assert (dirs[1] / "BBBBBBBBBBB.wav").exists()
+    assert len(scan_cache(tmp_path)) == 3
+
+
+def test_gc_evicts_least_recently_used_sets(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("YTX_CACHE_DIR", str(tmp_path))
+    dirs = [_make_entry(tmp_path, vid) for vid in ("AAAAAAAAAAA", "BBBBBBBBBBB", "CCCCCCCCCCC")]
+    idx = CacheIndex(tmp_path)
+    for i, d in enumerate(dirs):
+        idx.touch(d, when=1000.0 + i)
+    # A cache hit on the oldest set makes it the most recently used
+    read_transcript_doc(artifact_paths_for(video_id="AAAAAAAAAAA", config=AppConfig(engine="whisper", model="small")))
+
+    dry = gc_cache(1, root=tmp_path, keep=[dirs[2]], dry_run=True)
+    assert dry.removed == [dirs[1], dirs[0]] and all(d.exists() for d in dirs)
+
+    rep = gc_cache(1, root=tmp_path, keep=[dirs[2]])
+    assert rep.removed == [dirs[1], dirs[0]]
+    assert [e.video_id for e in scan_cache(tmp_path)] == ["CCCCCCCCCCC"]
+    assert (dirs[2] / "transcript.json").exists() and not (dirs[2] / "CCCCCCCCCCC.wav").exists()
+
+
+def test_parse_size():
+    assert parse_size("200G") == 200 << 30
+    assert parse_size("1.5k") == 1536
+    assert parse_size("512MiB") == 512 << 20
+    assert parse_size("100") == 100
+    with pytest.raises(ValueError):
+        parse_size("lots")
@@ -0,0 +1,69 @@
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+import shutil
+
+from ytx.cache import (
+    build_artifact_paths,
+    build_meta_payload,
+    cache_statistics,
+    clear_cache,
+    expire_cache,
+    rebuild_index,
+    scan_cache,
+    write_meta,
+)
+from ytx.cache_index import INDEX_DB, CacheIndex
+from ytx.config import AppConfig
+
+
+def _make_entry(root: Path, vid: str, *, model: str = "small", age_days: float = 0.0) -> Path:
+    cfg = AppConfig(engine="whisper", model=model)
+    paths = build_artifact_paths(video_id=vid, engine="whisper", model=model, config_hash=cfg.config_hash(), root=root, create=True)
+    paths.transcript_json.write_text('{"x": 1}', encoding="utf-8")
+    paths.captions_srt.write_text("1\n00:00:00,000 --> 00:00:00,500\nHi\n", encoding="utf-8")
+    payload = build_meta_payload(video_id=vid, config=cfg)
+    created = datetime.now(timezone.utc) - timedelta(days=age_days)
+    payload["created_at"] = created.isoformat().replace("+00:00", "Z")
+    write_meta(paths, payload)
+    return paths.dir
+
+
+def test_index_tracks_writes_and_answers_queries(tmp_path: Path):
+    _make_entry(tmp_path, "AAAAAAAAAAA")
+    _make_entry(tmp_path, "AAAAAAAAAAA", model="base")
+    _make_entry(tmp_path, "BBBBBBBBBBB")
+    assert (tmp_path / INDEX_DB).is_file()
+
+    entries = scan_cache(tmp_path)
+    assert sorted((e.video_id, e.model) for e in entries) == [
+        ("AAAAAAAAAAA", "base"),
+        ("AAAAAAAAAAA", "small"),
+        ("BBBBBBBBBBB", "small"),
+    ]
+    assert all(e.size_bytes > 0 and e.created_at is not None for e in entries)
+    assert [e.model for e in scan_cache(tmp_path, video_id="BBBBBBBBBBB")] == ["small"]
+    stats = cache_statistics(tmp_path)
+    assert stats["entries"] == 3 and stats["unique_videos"] == 2
+
+    clear_cache(tmp_path, video_id="AAAAAAAAAAA")
+    assert [e.video_id for e in scan_cache(tmp_path)] == ["BBBBBBBBBBB"]
+
+
+def test_index_is_built_for_legacy_cache_and_rebuildable(tmp_path: Path):
+    d = _make_entry(tmp_path, "CCCCCCCCCCC")
+    (tmp_path / INDEX_DB).unlink()
+    # Missing index is rebuilt from disk on first query
+    assert [e.video_id for e in scan_cache(tmp_path)] == ["CCCCCCCCCCC"]
+    # Out-of-band deletions are picked up by an explicit rebuild
+    shutil.rmtree(d.parents[2])
+    assert len(scan_cache(tmp_path)) == 1
+    assert rebuild_index(tmp_path) == 0
+    assert scan_cache(tmp_path) == []
+
+
+def test_expire_uses_index(tmp_path: Path):
+    old = _make_entry(tmp_path, "DDDDDDDDDDD", age_days=10)
+    _make_entry(tmp_path, "EEEEEEEEEEE", age_days=0)
+    removed = expire_cache(5 * 86400, root=tmp_path)
+    assert removed == [old] and not old.exists()
+    assert [e.video_id for e in CacheIndex(tmp_path).entries()] == ["EEEEEEEEEEE"]
@@ -0,0 +1,75 @@
+from pathlib import Path
+import threading
+import time
+
+import pytest
+
+from ytx.chunking import ChunkPrefetcher
+from ytx.config import AppConfig
+from ytx.engines.openai_engine import OpenAIEngine
+
+
+def _touch_slicer(log: list):
+    lock = threading.Lock()
+
+    def slicer(src, dst, *, start, end):
+        Path(dst).write_bytes(b"x")
+        with lock:
+            log.append(int(start))
+        return 123  # return value must not be relied on
+
+    return slicer
+
+
+def test_prefetcher_bounds_files_on_disk_and_deletes(tmp_path: Path):
+    sliced: list = []
+    ranges = [(float(i), float(i + 1)) for i in range(6)]
+    with ChunkPrefetcher(tmp_path / "src.wav", ranges, tmp_path, max_ahead=2, slicer=_touch_slicer(sliced)) as pf:
+        for idx in range(len(ranges)):
+            path = pf.get(idx)
+            assert path == pf.path_for(idx) and path.exists()
+            time.sleep(0.02)
+            # Never more than max_ahead chunks sliced but not yet released
+            assert len(sliced) - idx <= 2
+            assert len(list(tmp_path.glob("chunk_*.wav"))) <= 2
+            pf.release(idx)
+    assert sliced == list(range(6))
+    assert not list(tmp_path.glob("chunk_*.wav"))
+
+
+def test_failing_slicer_does_not_hang(tmp_path: Path):
+    def slicer(src, dst, *, start, end):
+        raise RuntimeError("ffmpeg broke")
+
+    eng = OpenAIEngine()
+    ranges = [(float(i), float(i + 1)) for i in range(10)]
+    cfg = AppConfig(engine="openai", chunk_concurrency=2, chunk_prefetch=0)
+    result: dict = {}
+
+    def go():
+        try:
+            eng._map_sliced_chunks(tmp_path / "src.wav", ranges, tmp_path, lambda p, s, e: [], config=cfg, slicer=slicer)
+        except Exception as e:
+            result["error"] = e
+
+    t = threading.Thread(target=go, daemon=True)
+    t.start()
+    t.join(timeout=10)
+    assert not t.is_alive(), "chunk prefetch deadlocked"
+    assert "ffmpeg broke" in str(result.get("error"))
+
+
+def test_work_failure_cancels_prefetch(tmp_path: Path):
+    eng = OpenAIEngine()
+    ranges = [(float(i), float(i + 1)) for i in range(8)]
+    cfg = AppConfig(engine="openai", chunk_concurrency=3, chunk_prefetch=1)
+
+    def work(path, start, end):
+        if start == 1.0:
+            raise ValueError("upload failed")
+        time.sleep(0.01)
+        return [start]
+
+    with pytest.raises(ValueError, match="upload failed"):
+        eng._map_sliced_chunks(tmp_path / "src.wav", ranges, tmp_path, work, config=cfg, slicer=_touch_slicer([]))
+    assert not list(tmp_path.glob("chunk_*.wav"))
@@ -25,7 +25,7 @@ def test_gemini_chunked_offset_no_inplace(monkeypatch, tmp_path):
     eng = GeminiEngine()
 
     # Force deterministic chunk ranges: two 1s chunks back-to-back
-    monkeypatch.setattr('ytx.engines.gemini_engine.compute_chunks', lambda total, window_seconds, overlap_seconds: [(0.0, 1.0), (1.0, 2.0)])
+    monkeypatch.setattr('ytx.engines.cloud_base.plan_chunks', lambda total, **_: [(0.0, 1.0), (1.0, 2.0)])
 
     # Avoid real file slicing; just copy the source to chunk path
     def fake_slice(src, dst, *, start, end):
@@ -67,8 +67,8 @@ def test_openai_chunked_offset_no_inplace(monkeypatch, tmp_path):
 
     eng = OpenAIEngine()
     # Force two chunks
-    monkeypatch.setattr('ytx.engines.openai_engine.compute_chunks', lambda total, window_seconds, overlap_seconds: [(0.0, 1.0), (1.0, 2.0)])
-    monkeypatch.setattr('ytx.engines.openai_engine.slice_wav_segment', lambda src, dst, *, start, end: Path(dst).write_bytes(Path(src).read_bytes()) or Path(dst))
+    monkeypatch.setattr('ytx.engines.cloud_base.plan_chunks', lambda total, **_: [(0.0, 1.0), (1.0, 2.0)])
+    monkeypatch.setattr('ytx.engines.cloud_base.slice_wav_segment', lambda src, dst, *, start, end: Path(dst).write_bytes(Path(src).read_bytes()) or Path(dst))
 
     def fake_single(path, *, config, on_progress=None):
         # Return a minimal object with zero duration to trigger the offset guard
@@ -90,8 +90,8 @@ def test_deepgram_chunked_offset_no_inplace(monkeypatch, tmp_path):
     from ytx.config import AppConfig
 
     eng = DeepgramEngine()
-    monkeypatch.setattr('ytx.engines.deepgram_engine.compute_chunks', lambda total, window_seconds, overlap_seconds: [(0.0, 1.0), (1.0, 2.0)])
-    monkeypatch.setattr('ytx.engines.deepgram_engine.slice_wav_segment', lambda src, dst, *, start, end: Path(dst).write_bytes(Path(src).read_bytes()) or Path(dst))
+    monkeypatch.setattr('ytx.engines.cloud_base.plan_chunks', lambda total, **_: [(0.0, 1.0), (1.0, 2.0)])
+    monkeypatch.setattr('ytx.engines.cloud_base.slice_wav_segment', lambda src, dst, *, start, end: Path(dst).write_bytes(Path(src).read_bytes()) or Path(dst))
 
     def fake_single(path, *, config, on_progress=None):
         import types
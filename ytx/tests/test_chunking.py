@@ -0,0 +1,103 @@
+from pathlib import Path
+import struct
+import wave
+
+import pytest
+
+from ytx import chunking
+from ytx.chunking import is_canonical_wav, slice_wav_segment
+
+
+def _write_ramp_wav(path: Path, *, seconds: float = 2.0, rate: int = 16000, channels: int = 1) -> Path:
+    n = int(seconds * rate)
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"".join(struct.pack("<h", i % 30000) * channels for i in range(n)))
+    return path
+
+
+def test_native_slice_copies_exact_frames(tmp_path: Path, monkeypatch):
+    src = _write_ramp_wav(tmp_path / "src.wav")
+    assert is_canonical_wav(src)
+
+    def no_subprocess(*a, **k):
+        raise AssertionError("ffmpeg must not be spawned for canonical WAVs")
+
+    monkeypatch.setattr(chunking.subprocess, "run", no_subprocess)
+    dst = slice_wav_segment(src, tmp_path / "out" / "c.wav", start=0.5, end=1.25)
+    with wave.open(str(dst), "rb") as w:
+        assert (w.getnchannels(), w.getsampwidth(), w.getframerate()) == (1, 2, 16000)
+        frames = w.readframes(w.getnframes())
+    samples = struct.unpack(f"<{len(frames) // 2}h", frames)
+    assert len(samples) == 12000
+    assert samples[0] == 8000 and samples[-1] == 19999
+
+    # End past the source clamps to the available audio
+    tail = slice_wav_segment(src, tmp_path / "tail.wav", start=1.5, end=9.0)
+    with wave.open(str(tail), "rb") as w:
+        assert w.getnframes() == 8000
+
+
+def test_non_canonical_wav_uses_ffmpeg(tmp_path: Path, monkeypatch):
+    src = _write_ramp_wav(tmp_path / "stereo.wav", seconds=0.1, rate=44100, channels=2)
+    assert not is_canonical_wav(src)
+    calls: list = []
+
+    class Proc:
+        returncode = 0
+        stderr = ""
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        Path(cmd[-1]).write_bytes(b"RIFF")
+        return Proc()
+
+    monkeypatch.setattr(chunking, "ensure_ffmpeg", lambda: None)
+    monkeypatch.setattr(chunking.subprocess, "run", fake_run)
+    slice_wav_segment(src, tmp_path / "c.wav", start=0.0, end=0.05)
+    assert calls and calls[0][0] == "ffmpeg"
+
+
+def test_slice_rejects_bad_bounds(tmp_path: Path):
+    src = _write_ramp_wav(tmp_path / "src.wav", seconds=0.1)
+    with pytest.raises(chunking.FFmpegError):
+        slice_wav_segment(src, tmp_path / "c.wav", start=1.0, end=1.0)
+
+
+def test_multi_slice_is_one_ffmpeg_pass(tmp_path: Path, monkeypatch):
+    src = _write_ramp_wav(tmp_path / "stereo.wav", seconds=0.1, rate=44100, channels=2)
+    calls: list = []
+
+    class Proc:
+        returncode = 0
+        stderr = ""
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        for i, tok in enumerate(cmd):
+            if tok == "-c:a":
+                Path(cmd[i + 2]).write_bytes(b"RIFF")
+        return Proc()
+
+    monkeypatch.setattr(chunking, "ensure_ffmpeg", lambda: None)
+    monkeypatch.setattr(chunking.subprocess, "run", fake_run)
+    slices = [(tmp_path / f"c{i}.wav", i * 1.0, i * 1.0 + 1.5) for i in range(3)]
+    out = chunking.slice_wav_segments(src, slices)
+    assert out == [d for d, _s, _e in slices]
+    assert len(calls) == 1
+    graph = calls[0][calls[0].index("-filter_complex") + 1]
+    assert "asplit=3" in graph and "atrim=start=2.000:end=3.500" in graph
+
+
+def test_chapters_slice_natively(tmp_path: Path):
+    from ytx.chapters import slice_audio_by_chapters
+    from ytx.models import Chapter
+
+    src = _write_ramp_wav(tmp_path / "src.wav", seconds=3.0)
+    chapters = [Chapter(title="Intro", start=0.0, end=1.0), Chapter(title="Main", start=1.0, end=3.0)]
+    parts = slice_audio_by_chapters(src, chapters, tmp_path / "out", overlap_seconds=0.5)
+    assert [p.name for _i, _c, p in parts] == ["chapter_000_intro.wav", "chapter_001_main.wav"]
+    with wave.open(str(parts[0][2]), "rb") as w:
+        assert w.getnframes() == 24000  # 1.0s + 0.5s overlap
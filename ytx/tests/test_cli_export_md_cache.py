@@ -30,7 +30,8 @@ def test_cli_export_from_cache(monkeypatch, tmp_path: Path):
     # Monkeypatch scan_cache to return a single entry pointing at our fake dir
     from ytx.cache import CacheEntry
 
-    def fake_scan_cache(root=None):
+    def fake_scan_cache(root=None, *, video_id=None):
+        assert video_id == "CACHEID12345"
         return [
             CacheEntry(
                 dir=entry_dir,
@@ -0,0 +1,85 @@
+from pathlib import Path
+import threading
+import time
+import types
+
+import pytest
+
+from ytx.config import AppConfig
+from ytx.engines.cloud_base import TokenBucket
+
+
+def test_openai_chunks_run_concurrently_in_order(monkeypatch, tmp_path: Path):
+    from ytx.engines.openai_engine import OpenAIEngine
+
+    wav = tmp_path / "src.wav"
+    wav.write_bytes(b"RIFF")
+    ranges = [(float(i), float(i + 1)) for i in range(6)]
+    monkeypatch.setattr("ytx.engines.cloud_base.plan_chunks", lambda total, **_: ranges)
+    monkeypatch.setattr(
+        "ytx.engines.cloud_base.slice_wav_segment",
+        lambda src, dst, *, start, end: Path(dst).write_text(str(int(start))) or Path(dst),
+    )
+
+    active = [0]
+    peak = [0]
+    lock = threading.Lock()
+
+    def fake_single(path, *, config, on_progress=None):
+        idx = int(Path(path).read_text())
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        # Later chunks finish first to prove results are re-ordered
+        time.sleep(0.01 * (6 - idx))
+        with lock:
+            active[0] -= 1
+        return [types.SimpleNamespace(start=0.0, end=0.5, text=f"chunk{idx}", confidence=None)]
+
+    eng = OpenAIEngine()
+    monkeypatch.setattr(eng, "_transcribe_single", fake_single)
+    progress: list[float] = []
+    cfg = AppConfig(engine="openai", model="whisper-1", chunk_concurrency=3)
+    segs = eng._transcribe_chunked(wav, config=cfg, on_progress=progress.append, window_seconds=1.0, overlap_seconds=0.0)
+    assert [s.text for s in segs] == [f"chunk{i}" for i in range(6)]
+    assert [s.start for s in segs] == [float(i) for i in range(6)]
+    assert 1 < peak[0] <= 3
+    assert progress[-1] == 1.0
+
+
+def test_chunk_failure_propagates(monkeypatch, tmp_path: Path):
+    from ytx.engines.deepgram_engine import DeepgramEngine
+
+    wav = tmp_path / "src.wav"
+    wav.write_bytes(b"RIFF")
+    monkeypatch.setattr("ytx.engines.cloud_base.plan_chunks", lambda total, **_: [(0.0, 1.0), (1.0, 2.0)])
+    monkeypatch.setattr("ytx.engines.cloud_base.slice_wav_segment", lambda src, dst, *, start, end: Path(dst))
+
+    def fake_single(path, *, config, on_progress=None):
+        raise RuntimeError("provider down")
+
+    eng = DeepgramEngine()
+    monkeypatch.setattr(eng, "_transcribe_single", fake_single)
+    with pytest.raises(RuntimeError, match="provider down"):
+        eng._transcribe_chunked(wav, config=AppConfig(engine="deepgram"), window_seconds=1.0, overlap_seconds=0.0)
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50.0, capacity=1.0)
+    t0 = time.monotonic()
+    waited = sum(bucket.acquire() for _ in range(4))
+    elapsed = time.monotonic() - t0
+    # First token is free; the next three need ~20ms each
+    assert elapsed >= 0.05 and waited > 0
+
+
+def test_token_bucket_reconfigure_keeps_accrued_tokens():
+    bucket = TokenBucket(rate=1000.0, capacity=10.0)
+    for _ in range(10):
+        bucket.acquire()
+    time.sleep(0.005)
+    bucket.configure(rate=0.001, capacity=10.0)
+    # ~5 tokens accrued at the old rate remain usable after slowing down
+    t0 = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - t0 < 0.5
@@ -15,3 +15,15 @@ def test_friendly_error_hints():
     e2 = _friendly_yt_dlp_error("this video is private", "url")
     assert "private" in e2.lower()
 
+
+def test_parse_flat_playlist_dedupes_and_canonicalizes():
+    from ytx.downloader import _parse_flat_playlist
+
+    out = "\n".join([
+        '{"id": "ABCDEFGHIJK", "url": "https://www.youtube.com/watch?v=ABCDEFGHIJK"}',
+        '{"id": "UCxxxxxxxxxxxxxxxxxxxxxx", "url": "https://www.youtube.com/channel/UCxxxxxxxxxxxxxxxxxxxxxx"}',
+        'not json',
+        '{"id": "ABCDEFGHIJK"}',
+        '{"id": "x", "url": "https://youtu.be/ZYXWVUTSRQP"}',
+    ])
+    assert _parse_flat_playlist(out) == ["https://youtu.be/ABCDEFGHIJK", "https://youtu.be/ZYXWVUTSRQP"]
@@ -62,3 +62,46 @@ def test_gemini_engine_transcribe_mock(monkeypatch):
     cfg = AppConfig(engine="gemini", model="gemini-2.5-flash")
     segs = eng.transcribe(Path("dummy.wav"), config=cfg)
     assert [s.text for s in segs] == ["Hi", "there"]
+
+
+def test_gemini_uploads_are_reused_by_content(monkeypatch, tmp_path: Path):
+    import time
+    import ytx.engines.gemini_engine as ge
+    from ytx.cache_index import CacheIndex
+
+    monkeypatch.setenv("YTX_CACHE_DIR", str(tmp_path / "cache"))
+    calls: list = []
+    live: dict = {}
+
+    def upload_file(path, mime_type):
+        name = f"files/{len(calls)}"
+        calls.append(("upload", Path(path).name))
+        live[name] = types.SimpleNamespace(name=name, uri=f"https://x/{name}", state="ACTIVE", expiration_time=None)
+        return live[name]
+
+    def get_file(name):
+        calls.append(("get", name))
+        return live[name]
+
+    def delete_file(name):
+        calls.append(("delete", name))
+        live.pop(name, None)
+
+    fake = types.SimpleNamespace(upload_file=upload_file, get_file=get_file, delete_file=delete_file)
+    monkeypatch.setattr(ge, "genai", fake, raising=False)
+    monkeypatch.setattr(ge, "_ensure_client_configured", lambda: None)
+    a, b = tmp_path / "a.mp3", tmp_path / "copy-of-a.mp3"
+    a.write_bytes(b"ID3 same audio")
+    b.write_bytes(b"ID3 same audio")
+    eng = ge.GeminiEngine()
+    first = eng._upload_audio(a)
+    assert eng._upload_audio(b) is first  # identical content: referenced, not re-uploaded
+    assert calls == [("upload", "a.mp3"), ("get", "files/0")]
+
+    # A handle about to expire is deleted and replaced
+    idx = CacheIndex(tmp_path / "cache")
+    rec = idx.uploads("gemini")[0]
+    idx.record_upload(rec.__class__(**{**rec.__dict__, "expires_at": time.time() + 60}))
+    again = eng._upload_audio(a)
+    assert again is not first and ("delete", "files/0") in calls
+    assert ge.purge_uploads() == 1 and live == {} and idx.uploads() == []
@@ -0,0 +1,105 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+from ytx.config import AppConfig
+from ytx.http_pool import close_clients, connection_stats, get_client, reset_stats
+
+
+class _KeepAlive(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_requests_reuse_one_pooled_connection(monkeypatch):
+    from ytx.engines.deepgram_engine import DeepgramEngine
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAlive)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "k" * 32)
+    close_clients()
+    reset_stats()
+    try:
+        cfg = AppConfig(engine="deepgram", http_connect_timeout=2.0)
+        url = f"http://127.0.0.1:{srv.server_address[1]}/v1/listen"
+        eng = DeepgramEngine()
+        for _ in range(3):
+            assert eng._http_post_with_retries(url, data=b"chunk", timeout=5, config=cfg).json() == {"ok": True}
+        assert get_client("deepgram", cfg) is get_client("deepgram", cfg)
+        stats = connection_stats()["deepgram"]
+        assert stats["requests"] == 3 and stats["connections"] == 1 and stats["reused"] == 2
+        # Different pool settings get a fresh client
+        assert get_client("deepgram", AppConfig(engine="deepgram", http_max_connections=2)) is not get_client("deepgram", cfg)
+    finally:
+        close_clients()
+        srv.shutdown()
+        srv.server_close()
+
+
+def test_pooled_requests_are_counted_as_reused(monkeypatch):
+    import httpx
+
+    import ytx.http_pool as pool
+
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    options = pool._client_options
+    monkeypatch.setattr(pool, "_client_options", lambda s: {**options(s), "transport": httpx.MockTransport(handler)})
+    close_clients()
+    reset_stats()
+    try:
+        client = get_client("mock")
+        for _ in range(2):
+            assert client.post("https://api.example/v1", content=b"x").json() == {"ok": True}
+        # The mock transport opens no sockets, so both requests count as reused
+        assert connection_stats()["mock"] == {
+            "requests": 2, "connections": 0, "http2_requests": 0, "reused": 2, "reuse_ratio": 1.0,
+        }
+        assert len(calls) == 2
+    finally:
+        close_clients()
+        reset_stats()
+
+
+def test_verbose_batch_prints_connection_stats(monkeypatch):
+    import httpx
+    from typer.testing import CliRunner
+
+    import ytx.batch
+    from ytx.batch import BatchReport
+    from ytx.cli import app
+    from ytx.http_pool import _count_response
+
+    class Pipeline:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def run(self, urls):
+            reset_stats()
+            for _ in range(3):
+                _count_response("deepgram", httpx.Response(200))
+            return BatchReport(items=[], elapsed=1.0)
+
+    monkeypatch.setattr(ytx.batch, "BatchPipeline", Pipeline)
+    runner = CliRunner()
+    quiet = runner.invoke(app, ["batch", "dQw4w9WgXcQ", "--engine", "deepgram"])
+    assert quiet.exit_code == 0, quiet.output
+    assert "HTTP deepgram" not in quiet.output
+    loud = runner.invoke(app, ["--verbose", "batch", "dQw4w9WgXcQ", "--engine", "deepgram"])
+    assert loud.exit_code == 0, loud.output
+    assert "HTTP deepgram: 3 request(s) over 0 new connection(s), 3 reused (100%)" in loud.output
+    reset_stats()
@@ -38,3 +38,129 @@ def test_export_srt_perf(tmp_path: Path):
     # Generous bound to avoid flakiness
     assert dur < 0.5
 
+
+
+def _import_profile(code: str, env_extra: dict[str, str]) -> dict[str, int]:
+    """Run `code` under `python -X importtime`; map module -> cumulative microseconds."""
+    import os
+    import subprocess
+    import sys
+
+    src = Path(__file__).resolve().parents[1] / "src"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(src), os.environ.get("PYTHONPATH", "")]), **env_extra}
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, env=env, timeout=60
+    )
+    mods: dict[str, int] = {}
+    for line in res.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                mods[name.strip()] = int(cumulative)
+    return mods
+
+
+# Modules that only transcription/export work should pay for
+_HEAVY = ("faster_whisper", "ctranslate2", "httpx", "tenacity", "ytx.downloader", "ytx.engines", "ytx.exporters", "ytx.chapters")
+_RUN_CLI = "import sys\nfrom ytx.cli import app\ntry:\n    app(sys.argv[1:])\nexcept SystemExit:\n    pass\n"
+
+
+def _run_cli(args: list[str], env_extra: dict[str, str]) -> dict[str, int]:
+    code = f"import sys; sys.argv = ['ytx', *{args!r}]\n" + _RUN_CLI
+    return _import_profile(code, env_extra)
+
+
+def test_cli_startup_import_budget(tmp_path: Path):
+    env = {"YTX_CACHE_DIR": str(tmp_path / "cache")}
+    for args in (["--help"], ["cache", "stats"]):
+        mods = _run_cli(args, env)
+        assert "ytx.cli" in mods
+        assert not [m for m in _HEAVY + ("pydantic", "pydantic_settings") if m in mods], args
+        # Generous bound: typer/rich dominate; eager engine/downloader imports blow it
+        assert mods["ytx.cli"] < 400_000, args
+
+
+def test_cache_hit_transcribe_skips_download_stack(tmp_path: Path, monkeypatch):
+    import json
+
+    from ytx.cache import artifact_paths_for
+    from ytx.config import load_config
+
+    env = {"YTX_CACHE_DIR": str(tmp_path / "cache")}
+    monkeypatch.setenv("YTX_CACHE_DIR", env["YTX_CACHE_DIR"])
+    # Same config the CLI builds for `transcribe <id>` with default options
+    cfg = load_config(
+        engine="whisper",
+        model="small",
+        engine_options={},
+        timestamp_policy="native",
+        max_download_abr_kbps=96,
+        download_extract_audio=False,
+        stream_download=False,
+    )
+    paths = artifact_paths_for(video_id="AAAAAAAAAAA", config=cfg, create=True)
+    doc = {"video_id": "AAAAAAAAAAA", "source_url": "https://youtu.be/AAAAAAAAAAA", "engine": "whisper", "model": "small", "segments": []}
+    paths.transcript_json.write_text(json.dumps(doc), encoding="utf-8")
+    paths.captions_srt.write_text("1\n00:00:00,000 --> 00:00:00,500\nHi\n", encoding="utf-8")
+    paths.meta_json.write_text("{}", encoding="utf-8")
+
+    mods = _run_cli(["transcribe", "AAAAAAAAAAA"], env)
+    assert "ytx.models" in mods  # the cached TranscriptDoc was loaded
+    assert not [m for m in _HEAVY if m in mods]
+
+
+def _reference_overlap_merge(a: str, b: str) -> str:
+    # Previous quadratic implementation of the suffix/prefix merge
+    for k in range(min(len(a), len(b)), 0, -1):
+        if a.endswith(b[:k]):
+            return a + b[k:]
+    return a + " " + b
+
+
+def test_merge_text_dedup_matches_reference_and_is_fast():
+    import random
+
+    from ytx.stitch import _merge_text_dedup
+
+    rnd = random.Random(7)
+    for alphabet in ("ab", "ab AB", "thank you so much "):
+        for _ in range(3000):
+            a = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 40))).strip()
+            b = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 40))).strip()
+            if a and b and a.lower() not in b.lower() and b.lower() not in a.lower():
+                assert _merge_text_dedup(a, b) == _reference_overlap_merge(a, b), (a, b)
+
+    words = [rnd.choice("so yeah okay right um like I mean you know".split()) for _ in range(8000)]
+    a = " ".join(words[:4000])
+    b = " ".join(words[2000:6000])
+
+    def timed(fn) -> tuple[str, float]:
+        start = time.perf_counter()
+        for _ in range(20):
+            out = fn(a, b)
+        return out, time.perf_counter() - start
+
+    merged, dur = timed(_merge_text_dedup)
+    expected, ref_dur = timed(_reference_overlap_merge)
+    assert merged == expected == " ".join(words[:6000])
+    # The quadratic search takes ~1.5ms per call at this size; the probe is ~25us
+    assert dur * 10 < ref_dur
+
+
+def test_stitch_10k_segments_perf():
+    from ytx.models import TranscriptSegment
+    from ytx.stitch import stitch_segments
+
+    # Chunk-boundary style input: every segment overlaps a near-duplicate
+    segs = []
+    for i in range(5000):
+        text = f"segment {i} says something chatty and repetitive about item {i % 7}"
+        segs.append(TranscriptSegment(id=2 * i, start=i * 3.0, end=i * 3.0 + 2.0, text=text))
+        segs.append(TranscriptSegment(id=2 * i + 1, start=i * 3.0 + 0.2, end=i * 3.0 + 2.1, text=text[8:] + " ok"))
+    start = time.perf_counter()
+    out = stitch_segments(segs)
+    dur = time.perf_counter() - start
+    assert len(out) == 5000
+    assert out[1].text == "segment 1 says something chatty and repetitive about item 1 ok"
+    # Generous bound to avoid flakiness
+    assert dur < 5.0
@@ -0,0 +1,81 @@
+from pathlib import Path
+import json
+import threading
+import wave
+
+from ytx.config import AppConfig
+from ytx.models import TranscriptSegment
+from ytx.server import RemoteWhisperEngine, TranscriptionServer, find_server, state_path
+
+
+def _write_wav(path: Path) -> Path:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(b"\x00\x00" * 1600)
+    return path
+
+
+class _FakeEngine:
+    created = 0
+
+    def __init__(self) -> None:
+        type(self).created += 1
+        self.last_language = None
+
+    def transcribe(self, audio_path, *, config, on_progress=None):
+        self.last_language = "en"
+        return [TranscriptSegment(id=0, start=0.0, end=0.1, text=f"{config.model}:{Path(audio_path).name}")]
+
+    def detect_language(self, audio_path, *, config):
+        return "xx"
+
+
+def test_server_round_trip_and_discovery(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("YTX_NO_SERVER", raising=False)
+    jobs: list = []
+    srv = TranscriptionServer(port=0, root=tmp_path, engine_factory=_FakeEngine, on_job=jobs.append)
+    srv.start()
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    try:
+        info = find_server(tmp_path, timeout=2.0)
+        assert info is not None and info.port == srv.port
+        assert json.loads(state_path(tmp_path).read_text())["token"] == srv.token
+
+        eng = RemoteWhisperEngine(info)
+        wav = _write_wav(tmp_path / "a.wav")
+        cfg = AppConfig(engine="whisper", model="tiny")
+        for _ in range(2):
+            segs = eng.transcribe(wav, config=cfg)
+        assert [s.text for s in segs] == ["tiny:a.wav"]
+        assert eng.detect_language(wav, config=cfg) == "en"
+        assert len(jobs) == 2 and srv.health()["jobs"] == 2
+    finally:
+        srv.shutdown()
+        t.join(timeout=5)
+    # State file is removed on shutdown so later CLI runs fall back to local engines
+    assert not state_path(tmp_path).exists()
+    assert find_server(tmp_path) is None
+
+
+def test_find_server_ignores_stale_state(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("YTX_NO_SERVER", raising=False)
+    state_path(tmp_path).write_text(
+        json.dumps({"host": "127.0.0.1", "port": 9, "pid": 2**22 + 12345, "token": "x"}), encoding="utf-8"
+    )
+    assert find_server(tmp_path) is None
+
+
+def test_remote_engine_falls_back_when_daemon_is_gone(tmp_path: Path):
+    from ytx.server import ServerInfo
+
+    # Nothing listens on this port: the first job falls back and sticks to local
+    info = ServerInfo(host="127.0.0.1", port=9, pid=1, token="x")
+    eng = RemoteWhisperEngine(info, fallback_factory=_FakeEngine)
+    wav = _write_wav(tmp_path / "b.wav")
+    cfg = AppConfig(engine="whisper", model="base")
+    assert [s.text for s in eng.transcribe(wav, config=cfg)] == ["base:b.wav"]
+    assert eng.detect_language(wav, config=cfg) == "en"
+    assert [s.text for s in eng.transcribe(wav, config=cfg)] == ["base:b.wav"]
@@ -0,0 +1,89 @@
+from pathlib import Path
+import math
+import wave
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ytx.chunking import compute_chunks, plan_chunks
+from ytx.silence import find_silence, open_pcm
+
+
+def _write_speechlike(path: Path, seconds: float, pauses: list[tuple[float, float]]) -> Path:
+    # A 220 Hz tone with low background noise stands in for speech; pauses keep only the noise
+    rate = 16000
+    t = np.arange(int(seconds * rate)) / rate
+    rng = np.random.default_rng(0)
+    x = 0.3 * np.sin(2 * math.pi * 220.0 * t)
+    for a, b in pauses:
+        x[int(a * rate) : int(b * rate)] = 0.0
+    x += rng.normal(0.0, 0.002, size=x.shape)
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes((x * 32767).astype("<i2").tobytes())
+    return path
+
+
+def test_cuts_snap_to_pauses_without_overlap(tmp_path: Path):
+    wav = _write_speechlike(tmp_path / "a.wav", 200.0, [(50.0, 51.0), (90.2, 90.8)])
+    chunks = plan_chunks(200.0, window_seconds=60.0, overlap_seconds=2.0, audio_path=wav, tolerance_seconds=15.0)
+    (s0, e0), (s1, e1), (s2, e2), (s3, e3) = chunks[:4]
+    # First cut lands in the 50-51 s pause and the next chunk starts there
+    assert s0 == 0.0 and 50.0 < e0 < 51.0 and s1 == e0
+    # The 90.2-90.8 s pause is outside the [95, 110] s search range, so the
+    # second cut keeps the fixed window and overlap
+    assert e1 == pytest.approx(e0 + 60.0, abs=0.001) and s2 == pytest.approx(e1 - 2.0, abs=0.001)
+    assert all(e - s <= 60.0 + 1e-6 for s, e in chunks) and chunks[-1][1] == 200.0
+
+
+def test_find_silence_prefers_latest_pause(tmp_path: Path):
+    wav = _write_speechlike(tmp_path / "b.wav", 30.0, [(5.0, 6.0), (20.0, 21.0)])
+    pcm = open_pcm(wav)
+    cut = find_silence(pcm, 0.0, 25.0)
+    assert cut is not None and 20.0 < cut < 21.0
+    assert find_silence(pcm, 8.0, 19.0) is None
+
+
+def test_non_canonical_input_falls_back_to_fixed_windows(tmp_path: Path):
+    other = tmp_path / "a.m4a"
+    other.write_bytes(b"\0" * 64)
+    assert open_pcm(other) is None
+    fixed = compute_chunks(1300.0, window_seconds=600.0, overlap_seconds=2.0)
+    assert plan_chunks(1300.0, window_seconds=600.0, overlap_seconds=2.0, audio_path=other) == fixed
+    assert plan_chunks(1300.0, window_seconds=600.0, overlap_seconds=2.0) == fixed
+
+
+def test_speech_only_uploads_compacted_audio_and_remaps(tmp_path: Path):
+    from ytx.config import AppConfig
+    from ytx.engines.cloud_base import CloudEngineBase
+    from ytx.models import TranscriptSegment
+
+    # 10 s intro of silence, speech 10-20 s, 15 s silence, speech 35-40 s
+    wav = _write_speechlike(tmp_path / "c.wav", 40.0, [(0.0, 10.0), (20.0, 35.0)])
+    sent: list[float] = []
+
+    class FakeEngine(CloudEngineBase):
+        name = "fake"
+
+        def _transcribe_audio(self, audio_path, *, config, on_progress=None):
+            with wave.open(str(audio_path), "rb") as w:
+                sent.append(w.getnframes() / w.getframerate())
+            # One segment per region, on the compacted timeline
+            return [
+                TranscriptSegment(id=0, start=0.3, end=10.2, text="first", words=[(0.3, 1.0, "first")]),
+                TranscriptSegment(id=1, start=11.2, end=16.0, text="second"),
+            ]
+
+    segs = FakeEngine().transcribe(wav, config=AppConfig(engine="openai", speech_only=True))
+    # 10 s + 5 s of speech, each side padded by under half a second
+    assert 15.0 < sent[0] < 17.0
+    assert 9.5 < segs[0].start < 10.0 and 19.5 < segs[0].end < 20.0
+    assert segs[0].words[0][0] == segs[0].start
+    assert 34.8 < segs[1].start < 35.5 and 39.5 < segs[1].end <= 40.0
+    # Off by default: the original file is sent
+    FakeEngine().transcribe(wav, config=AppConfig(engine="openai"))
+    assert sent[1] == pytest.approx(40.0)
+    assert AppConfig(engine="openai", speech_only=True).config_hash() != AppConfig(engine="openai").config_hash()
@@ -0,0 +1,72 @@
+from pathlib import Path
+import json
+
+from ytx.config import AppConfig
+from ytx.models import Chapter, TranscriptSegment
+from ytx.stitch import stitch_chunks
+
+
+def _seg(start: float, end: float, words: list[tuple[float, float, str]]) -> TranscriptSegment:
+    return TranscriptSegment(id=0, start=start, end=end, text=" ".join(w[2] for w in words), words=words)
+
+
+def test_overlap_is_cut_at_midpoint_using_words():
+    # Chunks [0, 10] and [8, 18] overlap on [8, 10]; the cut is at 9.0
+    a = [_seg(6.0, 10.0, [(6.0, 7.0, "the"), (7.2, 8.4, "quick"), (8.5, 9.2, "brown"), (9.3, 9.9, "fox")])]
+    b = [_seg(8.1, 12.0, [(8.1, 8.4, "quick"), (8.5, 9.2, "brown"), (9.3, 9.9, "fox"), (10.0, 11.0, "jumps")])]
+    out = stitch_chunks([(0.0, 10.0, a), (8.0, 18.0, b)])
+    assert [s.text for s in out] == ["the quick brown", "fox jumps"]
+    assert [w[2] for s in out for w in s.words or []] == ["the", "quick", "brown", "fox", "jumps"]
+    assert out[0].start == 6.0 and out[0].end == 9.2 and out[1].start == 9.3
+    # Word arrays stay compact in JSON and are omitted when absent
+    assert json.loads(out[1].model_dump_json())["words"][0] == [9.3, 9.9, "fox"]
+    assert "words" not in TranscriptSegment(id=0, start=0, end=1, text="x").model_dump()
+
+
+def test_segments_without_words_fall_back_to_heuristic_stitch():
+    a = [TranscriptSegment(id=0, start=0.0, end=10.0, text="hello there world")]
+    b = [TranscriptSegment(id=0, start=9.0, end=12.0, text="hello there world")]
+    out = stitch_chunks([(0.0, 10.0, a), (8.0, 18.0, b)])
+    assert [s.text for s in out] == ["hello there world"]
+
+
+def test_similarity_compares_seam_words_only():
+    from ytx.stitch import _similar
+
+    words = " ".join(f"w{i}" for i in range(40))
+    # The same long utterance twice, differing only in punctuation
+    assert _similar(words.replace("w20", "w20,"), words)
+    # b picks up where a's tail ends; the long history before it is ignored
+    assert _similar("intro words " * 500 + words, words[words.index("w20"):] + ", and more")
+    assert not _similar("completely different words here", "nothing alike at all today")
+
+
+def test_deepgram_chunked_words_are_offset_and_cut(monkeypatch, tmp_path: Path):
+    from ytx.engines.deepgram_engine import DeepgramEngine
+
+    wav = tmp_path / "src.wav"
+    wav.write_bytes(b"RIFF")
+    monkeypatch.setattr("ytx.engines.cloud_base.plan_chunks", lambda total, **_: [(0.0, 4.0), (2.0, 6.0)])
+    monkeypatch.setattr("ytx.engines.cloud_base.slice_wav_segment", lambda src, dst, *, start, end: Path(dst))
+    words = [{"word": w, "punctuated_word": w.capitalize(), "start": float(i), "end": i + 0.8} for i, w in enumerate(["one", "two", "three", "four"])]
+    payload = {"results": {"channels": [{"alternatives": [{"utterances": [{"start": 0.0, "end": 3.8, "transcript": "one two three four", "words": words}]}]}]}}
+    eng = DeepgramEngine()
+    cfg = AppConfig(engine="deepgram", word_timestamps=True)
+    monkeypatch.setattr(eng, "_transcribe_single", lambda path, *, config, on_progress=None: eng._parse_deepgram_segments(payload, words=config.word_timestamps))
+    segs = eng._transcribe_chunked(wav, config=cfg, window_seconds=4.0, overlap_seconds=2.0)
+    # Cut at 3.0: chunk 1 keeps words centred before it, chunk 2 (offset +2s) the rest
+    assert [w[2] for s in segs for w in s.words or []] == ["One", "Two", "Three", "Two", "Three", "Four"]
+    assert [s.text for s in segs] == ["One Two Three", "Two Three Four"]
+    assert segs[1].words[0][0] == 3.0
+
+
+def test_chapter_results_use_slice_overlap():
+    from ytx.chapters import stitch_chapter_results
+
+    ch1 = Chapter(title="a", start=0.0, end=10.0)
+    ch2 = Chapter(title="b", start=10.0, end=20.0)
+    # Chapter 1's slice runs to 12s, so the cut is at 11s; both hear "overlap" at 10.5s
+    s1 = [_seg(8.0, 11.0, [(8.0, 9.5, "end"), (10.2, 10.8, "overlap")])]
+    s2 = [_seg(0.2, 3.0, [(0.2, 0.8, "overlap"), (1.5, 2.5, "start")])]
+    out = stitch_chapter_results([(1, ch2, s2), (0, ch1, s1)], overlap_seconds=2.0)
+    assert [s.text for s in out] == ["end overlap", "start"]
@@ -0,0 +1,54 @@
+from pathlib import Path
+import os
+import stat
+import sys
+
+import pytest
+
+from ytx.downloader import YTDLPError, stream_audio_to_wav
+from ytx.models import VideoMetadata
+
+
+def _script(dir_: Path, name: str, body: str) -> None:
+    p = dir_ / name
+    p.write_text(f"#!{sys.executable}\nimport sys\n{body}\n", encoding="utf-8")
+    p.chmod(p.stat().st_mode | stat.S_IEXEC)
+
+
+@pytest.fixture
+def fake_tools(tmp_path: Path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    # yt-dlp writes audio bytes to stdout (or fails for a "bad" URL)
+    _script(
+        bin_dir,
+        "yt-dlp",
+        "url = sys.argv[-1]\n"
+        "if 'bad' in url:\n"
+        "    sys.stderr.write('ERROR: Private video'); sys.exit(1)\n"
+        "sys.stdout.buffer.write(b'AUDIO' * 1000)",
+    )
+    # ffmpeg copies stdin to the output path (last argument)
+    _script(
+        bin_dir,
+        "ffmpeg",
+        "assert 'pipe:0' in sys.argv\n"
+        "open(sys.argv[-1], 'wb').write(b'RIFF' + sys.stdin.buffer.read())",
+    )
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+    return bin_dir
+
+
+def test_stream_pipes_download_into_ffmpeg(fake_tools, tmp_path: Path):
+    meta = VideoMetadata(id="AAAAAAAAAAA", title="t", duration=1.0, url="https://youtu.be/AAAAAAAAAAA")
+    out = stream_audio_to_wav(meta, tmp_path / "out" / "AAAAAAAAAAA.wav", timeout=30)
+    assert out.read_bytes() == b"RIFF" + b"AUDIO" * 1000
+    # No intermediate audio file and no leftover partial WAV
+    assert sorted(p.name for p in out.parent.iterdir()) == ["AAAAAAAAAAA.wav"]
+
+
+def test_stream_reports_yt_dlp_failure(fake_tools, tmp_path: Path):
+    meta = VideoMetadata(id="BBBBBBBBBBB", title="t", duration=1.0, url="https://youtu.be/bad")
+    with pytest.raises(YTDLPError, match="private"):
+        stream_audio_to_wav(meta, tmp_path / "BBBBBBBBBBB.wav", timeout=30)
+    assert not list(tmp_path.glob("*.wav"))
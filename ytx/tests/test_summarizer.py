@@ -0,0 +1,117 @@
+import hashlib
+import json
+import threading
+import time
+import types
+
+from ytx.models import TranscriptSegment
+from ytx.summarizer import REDUCE_FAN_IN, GeminiSummarizer, estimate_tokens, pack_windows
+
+
+class _FakeModel:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = self.peak = 0
+        self.prompts: list[str] = []
+
+    def generate_content(self, parts, request_options=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.prompts.append(parts[1])
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        if "numbered sections" in parts[0]:
+            n = parts[1].count("### ")
+            return types.SimpleNamespace(text="```json\n" + json.dumps([f"sum {k}" for k in range(n)]) + "\n```")
+        # ~300-char TL;DR that depends on the input, so edits propagate up the tree
+        tldr = hashlib.sha256(parts[1].encode()).hexdigest() * 9
+        return types.SimpleNamespace(text=json.dumps({"tldr": tldr[:300], "bullets": ["b"]}))
+
+
+def _summarizer(concurrency: int, window_tokens: int = 1000) -> GeminiSummarizer:
+    s = GeminiSummarizer.__new__(GeminiSummarizer)
+    s.concurrency = concurrency
+    s.window_tokens = window_tokens
+    s._model = _FakeModel()
+    s._throttle = lambda: None
+    return s
+
+
+def _segments(n: int, text: str = "") -> list[TranscriptSegment]:
+    # 99 estimated tokens of text each (+1 separator): ten segments per 1000-token window
+    return [
+        TranscriptSegment(id=i, start=float(i * 5), end=float(i * 5 + 5), text=(text or f"{i:05d} ") + "w" * (390 if not text else 0))
+        for i in range(n)
+    ]
+
+
+def test_summarize_long_maps_concurrently_and_reduces_as_tree():
+    s = _summarizer(4)
+    res = s.summarize_long(_segments(210), bullets=3)
+    model = s._model
+    windows = 21
+    # 21 windows -> 3 group reduces (8, 8, 5) -> final reduce
+    assert len(model.prompts) == windows + 3 + 1
+    assert 1 < model.peak <= 4
+    # Reduce prompts hold at most REDUCE_FAN_IN time-anchored partial summaries
+    assert any(p.startswith("[0:00-0:50] ") for p in model.prompts[windows:])
+    assert max(len(p) for p in model.prompts[windows:]) <= REDUCE_FAN_IN * 322
+    assert res["tldr"] and res["bullets"] == ["b"]
+
+
+def test_summaries_are_cached_per_window(tmp_path):
+    from ytx.cache_index import CacheIndex
+
+    s = _summarizer(2)
+    s._cache = CacheIndex(tmp_path)
+    s.model_name = "gemini-test"
+    segs = _segments(210)
+    first = s.summarize_long(segs)
+    calls = len(s._model.prompts)
+    respaced = [seg.model_copy(update={"text": " " + seg.text + "  "}) for seg in segs]
+    assert s.summarize_long(respaced) == first  # whitespace-normalized hit
+    assert len(s._model.prompts) == calls
+    # Editing one segment: its window, its reduce group and the final reduce
+    segs[100] = segs[100].model_copy(update={"text": segs[100].text.replace("w", "x", 1)})
+    s.summarize_long(segs)
+    assert len(s._model.prompts) == calls + 3
+    # Different parameters are a different key
+    s.summarize_structured("short text", bullets=3)
+    s.summarize_structured("short text", bullets=4)
+    assert len(s._model.prompts) == calls + 5
+
+
+def test_windows_pack_whole_segments_within_budget():
+    segs = _segments(25)
+    windows = pack_windows(segs, max_tokens=1000)
+    assert [len(w.text.splitlines()) for w in windows] == [10, 10, 5]
+    assert (windows[1].start, windows[1].end) == (50.0, 100.0) and windows[1].tokens <= 1000
+    assert windows[0].text.splitlines()[-1] == segs[9].text  # never cut mid-segment
+    # Only a segment larger than the budget is split, on word boundaries
+    big = [TranscriptSegment(id=0, start=0.0, end=60.0, text="word " * 1000)]
+    parts = pack_windows(big, max_tokens=300)
+    assert len(parts) > 1 and all(p.tokens <= 300 and p.start == 0.0 for p in parts)
+    assert " ".join(p.text for p in parts) == ("word " * 1000).strip()
+    # Plain strings are packed by line, without time ranges
+    assert [w.label for w in pack_windows("a\nb")] == [""]
+    assert estimate_tokens("abcdefgh") == 2 and estimate_tokens("日本語") == 3
+
+
+def test_chapter_summaries_concurrent_or_batched():
+    from ytx.chapters import chapter_texts
+    from ytx.models import Chapter
+
+    segs = _segments(40, text="x")
+    chapters = [Chapter(title=f"c{i}", start=i * 20.0, end=i * 20.0 + 20.0) for i in range(10)]
+    texts = chapter_texts(chapters, list(reversed(segs)))
+    naive = [" ".join(s.text for s in segs if s.start >= ch.start and s.end <= ch.end).strip() for ch in chapters]
+    assert texts == naive and texts[0] == "x x x x"
+
+    s = _summarizer(4)
+    assert len(s.summarize_many(texts)) == 10 and 1 < s._model.peak <= 4
+    s = _summarizer(4)
+    out = s.summarize_batch(["a", "", "b"], titles=["one", "two", "three"])
+    assert out == ["sum 0", "", "sum 1"] and len(s._model.prompts) == 1
+    assert "### 2. three" in s._model.prompts[0]
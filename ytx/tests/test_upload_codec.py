@@ -0,0 +1,86 @@
+from pathlib import Path
+import types
+
+from ytx.audio import build_encode_command, encode_for_upload, upload_mime
+from ytx.config import AppConfig
+
+
+_PAYLOAD = {"results": {"channels": [{"alternatives": [{"utterances": [{"start": 0.0, "end": 0.5, "transcript": "hi"}]}]}]}}
+
+
+def _fake_ffmpeg(monkeypatch, calls: list):
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        Path(cmd[-1]).write_bytes(b"OggS" + b"\0" * 16)
+        return types.SimpleNamespace(returncode=0, stderr="")
+
+    monkeypatch.setattr("ytx.audio.ensure_ffmpeg", lambda: None)
+    monkeypatch.setattr("ytx.audio.subprocess.run", run)
+
+
+def test_encode_once_and_reuse(monkeypatch, tmp_path: Path):
+    calls: list = []
+    _fake_ffmpeg(monkeypatch, calls)
+    wav = tmp_path / "abc.wav"
+    wav.write_bytes(b"RIFF")
+    out = encode_for_upload(wav, "opus")
+    assert out == tmp_path / "abc.upload.ogg" and out.read_bytes().startswith(b"OggS")
+    assert "libopus" in calls[0] and "-ar" in calls[0]
+    assert encode_for_upload(wav, "opus") == out and len(calls) == 1
+    assert upload_mime(out) == "audio/ogg" and upload_mime(wav) == "audio/wav"
+    assert "libmp3lame" in build_encode_command(wav, tmp_path / "x.mp3", "mp3")
+
+
+def test_concurrent_encodes_use_separate_temp_files(monkeypatch, tmp_path: Path):
+    import threading
+
+    barrier = threading.Barrier(2)
+    targets: list[str] = []
+
+    def run(cmd, **kwargs):
+        targets.append(cmd[-1])
+        barrier.wait(timeout=5)  # both threads are mid-encode at once
+        Path(cmd[-1]).write_bytes(b"OggS" + b"\0" * 16)
+        return types.SimpleNamespace(returncode=0, stderr="")
+
+    monkeypatch.setattr("ytx.audio.ensure_ffmpeg", lambda: None)
+    monkeypatch.setattr("ytx.audio.subprocess.run", run)
+    wav = tmp_path / "abc.wav"
+    wav.write_bytes(b"RIFF")
+    threads = [threading.Thread(target=encode_for_upload, args=(wav, "opus")) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(targets)) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["abc.upload.ogg", "abc.wav"]
+
+
+def test_deepgram_chunks_are_cut_from_one_encoding(monkeypatch, tmp_path: Path):
+    from ytx.engines.deepgram_engine import DeepgramEngine
+
+    calls: list = []
+    _fake_ffmpeg(monkeypatch, calls)
+    wav = tmp_path / "src.wav"
+    wav.write_bytes(b"RIFF")
+    cut: list = []
+    monkeypatch.setattr("ytx.engines.cloud_base.plan_chunks", lambda total, **_: [(0.0, 1.0), (1.0, 2.0)])
+    monkeypatch.setattr(
+        "ytx.engines.cloud_base.slice_encoded_segment",
+        lambda src, dst, *, start, end: cut.append((Path(src).name, Path(dst).suffix)) or Path(dst).write_bytes(b"OggS"),
+    )
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "k" * 32)
+    sent: list = []
+    eng = DeepgramEngine()
+
+    def post(url, *, headers=None, data=None, **kwargs):
+        sent.append(headers["Content-Type"])
+        return types.SimpleNamespace(json=lambda: _PAYLOAD)
+
+    monkeypatch.setattr(eng, "_http_post_with_retries", post)
+    segs = eng._transcribe_chunked(wav, config=AppConfig(engine="deepgram"), window_seconds=1.0, overlap_seconds=0.0)
+    assert len(calls) == 1  # one encode for the whole file
+    assert cut == [("src.upload.ogg", ".ogg"), ("src.upload.ogg", ".ogg")]
+    assert sent == ["audio/ogg", "audio/ogg"] and [s.start for s in segs] == [0.0, 1.0]
+    # upload_codec=wav keeps the old behaviour
+    assert eng._upload_file(wav, AppConfig(engine="deepgram", upload_codec="wav")) == wav
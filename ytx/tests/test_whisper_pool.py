@@ -0,0 +1,102 @@
+from pathlib import Path
+import textwrap
+import wave
+
+from ytx.config import AppConfig
+
+# Stand-in for faster_whisper: one segment per whole second of input audio,
+# with text naming the absolute second so duplicates/drops are visible.
+_FAKE_FASTER_WHISPER = '''
+import wave
+
+
+class _Word:
+    def __init__(self, start, end, word):
+        self.start, self.end, self.word = start, end, word
+
+
+class _Seg:
+    def __init__(self, start, end, text, words):
+        self.start, self.end, self.text, self.words, self.avg_logprob = start, end, text, words, -0.1
+
+
+class _Info:
+    language = "xx"
+
+
+class WhisperModel:
+    def __init__(self, name, device="cpu", compute_type="int8", cpu_threads=0, num_workers=1):
+        self.cpu_threads = cpu_threads
+
+    def transcribe(self, path, language=None, word_timestamps=False, **kwargs):
+        with wave.open(path, "rb") as w:
+            n = w.getnframes()
+            # Chunk files are named after their absolute start: tone markers
+            # in the first frame encode it (see the test's WAV writer).
+            first = int.from_bytes(w.readframes(1), "little", signed=True)
+        seconds = int(n / 16000)
+        segs = []
+        for i in range(seconds):
+            t = first / 10.0 + i
+            label = f"s{int(round(t))}"
+            words = [_Word(i + 0.1, i + 0.9, label)] if word_timestamps else None
+            segs.append(_Seg(float(i), i + 1.0, label, words))
+        return iter(segs), _Info()
+'''
+
+
+def _write_marked_wav(path: Path, seconds: int) -> Path:
+    # Every second starts with a sample equal to 10x its own timestamp so the
+    # fake model can tell which absolute second a chunk begins at.
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        frames = bytearray()
+        for sec in range(seconds):
+            for tenth in range(10):
+                block = bytearray(1600 * 2)
+                block[0:2] = int(sec * 10 + tenth).to_bytes(2, "little", signed=True)
+                frames += block
+        w.writeframes(bytes(frames))
+    return path
+
+
+def test_parallel_whisper_pool_stitches_chunks(monkeypatch, tmp_path: Path):
+    pkg = tmp_path / "fakes" / "faster_whisper"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text(textwrap.dedent(_FAKE_FASTER_WHISPER), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path / "fakes"))
+
+    import ytx.engines.whisper_engine as we
+    from ytx.engines.whisper_pool import shutdown_pools
+
+    monkeypatch.setattr(we, "_FW_AVAILABLE", None)
+    monkeypatch.setattr(we, "probe_duration", lambda p: 24.0)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    wav = _write_marked_wav(tmp_path / "src.wav", 24)
+    cfg = AppConfig(engine="whisper", model="tiny", whisper_workers=2, whisper_threads=1, word_timestamps=True, silence_cuts=False)
+    progress: list[float] = []
+    eng = we.WhisperEngine()
+    try:
+        segs = eng.transcribe(wav, config=cfg, on_progress=progress.append)
+    finally:
+        shutdown_pools()
+    # Chunks overlap by 2s; the word-level cut keeps every second exactly once
+    assert [s.text for s in segs] == [f"s{i}" for i in range(24)]
+    assert all(b.start >= a.end for a, b in zip(segs, segs[1:]))
+    assert eng.last_language == "xx"
+    assert progress[-1] == 1.0
+    stats = eng.last_stats
+    assert stats["workers"] == 2 and stats["threads_per_worker"] == 1 and stats["rtf"] > 0
+
+
+def test_split_threads_partitions_cores(monkeypatch):
+    from ytx.engines.whisper_pool import split_threads
+
+    monkeypatch.setattr("os.cpu_count", lambda: 32)
+    assert split_threads(8) == (8, 4)
+    assert split_threads(3, 2) == (3, 2)
+    assert split_threads(64) == (32, 1)
+    assert AppConfig(engine="whisper", whisper_workers=4).config_hash() != AppConfig(engine="whisper").config_hash()
+    assert AppConfig(engine="whisper", whisper_threads=4).config_hash() == AppConfig(engine="whisper").config_hash()